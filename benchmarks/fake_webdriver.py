@@ -0,0 +1,123 @@
+"""
+프로세스 내 가짜 WebDriver
+브라우저/네트워크 없이 프레임워크 코드(BasePage, DriverFactory, DriverPool)의 자체 비용을 측정할 때 사용합니다.
+모든 명령은 즉시 성공하며, 요소는 항상 존재하고 보이며 클릭할 수 있습니다.
+"""
+from selenium.webdriver.remote.webelement import WebElement
+from pages.locator_js import FIND_FIRST_JS, SNAPSHOT_JS
+
+
+class FakeElement(WebElement):
+    """항상 보이고 활성화된 가짜 요소"""
+
+    def __init__(self, parent, element_id, text=''):
+        super().__init__(parent, element_id)
+        self._text = text
+        self.value = ''
+
+    @property
+    def text(self):
+        return self._text
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def click(self):
+        pass
+
+    def clear(self):
+        self.value = ''
+
+    def send_keys(self, *value):
+        self.value += ''.join(str(v) for v in value)
+
+
+class _SwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+    def default_content(self):
+        pass
+
+
+class FakeWebDriver:
+    """WebDriver 명령에 즉시 응답하는 가짜 드라이버"""
+
+    def __init__(self, options=None):
+        self.options = options
+        self.current_url = 'about:blank'
+        self.title = ''
+        self.window_handles = ['main']
+        self.current_window_handle = 'main'
+        self.switch_to = _SwitchTo(self)
+        self.commands = 0
+        self._element = FakeElement(self, 'element-1', text='fake')
+
+    def _command(self):
+        self.commands += 1
+
+    def get(self, url):
+        self._command()
+        self.current_url = url
+        self.title = url
+
+    def refresh(self):
+        self._command()
+
+    def back(self):
+        self._command()
+
+    def forward(self):
+        self._command()
+
+    def implicitly_wait(self, seconds):
+        self._command()
+
+    def set_page_load_timeout(self, seconds):
+        self._command()
+
+    def set_window_size(self, width, height):
+        self._command()
+
+    def find_element(self, by, value):
+        self._command()
+        return self._element
+
+    def find_elements(self, by, value):
+        self._command()
+        return [self._element]
+
+    def execute_script(self, script, *args):
+        self._command()
+        if script == FIND_FIRST_JS:
+            return [0, self._element]
+        if script == SNAPSHOT_JS:
+            return [{'text': 'fake', 'visible': True} for _ in args[0]]
+        return None
+
+    def execute_async_script(self, script, *args):
+        self._command()
+        return {}
+
+    def execute_cdp_cmd(self, command, params):
+        self._command()
+        return {}
+
+    def delete_all_cookies(self):
+        self._command()
+
+    def close(self):
+        self._command()
+
+    def quit(self):
+        self._command()
+
+    def get_screenshot_as_base64(self):
+        self._command()
+        return ''
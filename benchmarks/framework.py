@@ -0,0 +1,213 @@
+"""
+프레임워크 자체 성능 벤치마크
+프로세스 내 가짜 WebDriver로 브라우저/네트워크 없이 BasePage 헬퍼의 호출당 비용,
+WebDriverWait 생성 비용, 브라우저 옵션 생성, 드라이버 fixture 준비/정리 비용을 측정하고
+기준선보다 p95가 임계값과 최소 증가량을 모두 넘게 느려지면 실패(종료 코드 1)합니다.
+마이크로 벤치마크는 장비 부하에 민감하므로 저하로 보이는 시나리오는 다시 측정해 가장 빠른 결과로 판단합니다.
+
+사용법:
+    python -m benchmarks.framework [--repeats=15] [--warmup=3] [--calls=200]
+                                   [--threshold=0.5] [--min-delta=2] [--confirm=2]
+                                   [--scenario=get_text] [--update-baseline]
+"""
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from benchmarks.fake_webdriver import FakeWebDriver
+from config.config import TestConfig
+from pages.base_page import BasePage
+from utils.benchmark import BenchmarkRunner, baseline_results, compare_to_baseline, finish_benchmark
+from utils.driver_factory import DriverFactory
+
+LOCATOR = (By.ID, "query")
+
+
+@contextmanager
+def fake_browser():
+    """
+    DriverFactory가 실제 브라우저 대신 가짜 드라이버를 실행하도록 교체
+
+    브라우저 데몬 대여, 기록/재생 프록시, 드라이버 미리 실행은 가짜 드라이버 실행을 거치지 않으므로
+    환경 설정과 관계없이 측정 중에는 끕니다.
+    """
+    original = DriverFactory.__dict__['_launch']
+    settings = {'BROWSER_DAEMON': 'off', 'REPLAY_MODE': '', 'DRIVER_PREWARM': 0}
+    saved = {name: getattr(TestConfig, name) for name in settings}
+    DriverFactory._launch = staticmethod(lambda browser, options: FakeWebDriver(options))
+    for name, value in settings.items():
+        setattr(TestConfig, name, value)
+    try:
+        yield
+    finally:
+        DriverFactory._launch = original
+        DriverFactory.close_pool()
+        for name, value in saved.items():
+            setattr(TestConfig, name, value)
+
+
+@contextmanager
+def browser_config(browser):
+    """TestConfig.BROWSER를 잠시 변경"""
+    original = TestConfig.BROWSER
+    TestConfig.BROWSER = browser
+    try:
+        yield
+    finally:
+        TestConfig.BROWSER = original
+
+
+def build_scenarios(calls):
+    """
+    측정할 시나리오 목록 (각 시나리오는 대상 동작을 calls번 실행)
+
+    Args:
+        calls (int): 시나리오 한 번에 반복할 호출 수
+
+    Returns:
+        dict: 시나리오 이름 → 인자 없는 함수 (호출당 시간 µs 반환)
+    """
+    driver = FakeWebDriver()
+    page = BasePage(driver)
+    page.find_element(LOCATOR)
+
+    def per_call(action):
+        def scenario():
+            start = time.perf_counter()
+            for _ in range(calls):
+                action()
+            return {'per_call_us': (time.perf_counter() - start) / calls * 1e6}
+        return scenario
+
+    def chrome_options():
+        with browser_config('chrome'):
+            TestConfig.get_browser_options()
+
+    def firefox_options():
+        with browser_config('firefox'):
+            TestConfig.get_browser_options()
+
+    def fixture_fresh():
+        driver = DriverFactory.acquire_driver(reuse=False)
+        DriverFactory.release_driver(driver, reuse=False)
+
+    def fixture_pooled():
+        driver = DriverFactory.acquire_driver(reuse=True)
+        DriverFactory.release_driver(driver, reuse=True)
+
+    return {
+        'base_page_init': per_call(lambda: BasePage(driver)),
+        'webdriver_wait_init': per_call(lambda: WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)),
+        'navigate_to': per_call(lambda: page.navigate_to("about:blank")),
+        'find_element': per_call(lambda: page.find_element(LOCATOR)),
+        'find_first': per_call(lambda: page.find_first([(By.ID, "a"), LOCATOR])),
+        'click_element': per_call(lambda: page.click_element(LOCATOR)),
+        'input_text': per_call(lambda: page.input_text(LOCATOR, "제주")),
+        'get_text': per_call(lambda: page.get_text(LOCATOR)),
+        'is_element_present': per_call(lambda: page.is_element_present(LOCATOR)),
+        'snapshot': per_call(lambda: page.snapshot([LOCATOR, (By.ID, "b")])),
+        'chrome_options': per_call(chrome_options),
+        'firefox_options': per_call(firefox_options),
+        'build_chrome_options': per_call(
+            lambda: DriverFactory._release_resources(DriverFactory._build_chrome_options(True))
+        ),
+        'driver_fixture_fresh': per_call(fixture_fresh),
+        'driver_fixture_pooled': per_call(fixture_pooled),
+    }
+
+
+def run_framework_benchmark(repeats=15, warmup=3, calls=200, threshold=0.5, scenarios=None,
+                            update_baseline=False, baseline_path=None, output_path=None,
+                            min_delta=None, confirm=None):
+    """
+    프레임워크 벤치마크 실행
+
+    Args:
+        repeats (int): 반복 횟수
+        warmup (int): 워밍업 횟수
+        calls (int): 시나리오마다 반복할 호출 수
+        threshold (float): p95 허용 증가율 (마이크로 벤치마크라 페이지 벤치마크보다 넉넉하게)
+        scenarios (list): 실행할 시나리오 이름 (기본값: 전체)
+        update_baseline (bool): 결과를 새 기준선으로 저장
+        baseline_path (str): 기준선 파일 (기본값: TestConfig.FRAMEWORK_BENCHMARK_BASELINE)
+        output_path (str): 결과 파일 (기본값: TestConfig.FRAMEWORK_BENCHMARK_RESULT)
+        min_delta (float): 저하로 판단할 호출당 최소 증가량 (us, 기본값: TestConfig.FRAMEWORK_BENCHMARK_MIN_DELTA)
+        confirm (int): 저하로 보이는 시나리오를 다시 측정할 횟수 (기본값: TestConfig.FRAMEWORK_BENCHMARK_CONFIRM)
+
+    Returns:
+        bool: 성능 저하가 없으면 True
+    """
+    baseline_path = baseline_path or TestConfig.FRAMEWORK_BENCHMARK_BASELINE
+    output_path = output_path or TestConfig.FRAMEWORK_BENCHMARK_RESULT
+    min_delta = min_delta if min_delta is not None else TestConfig.FRAMEWORK_BENCHMARK_MIN_DELTA
+    confirm = confirm if confirm is not None else TestConfig.FRAMEWORK_BENCHMARK_CONFIRM
+    # 장비마다 절대 성능이 다르므로 같은 장비(Jenkins 에이전트)에서 측정한 기준선끼리만 비교
+    target = f"fake-webdriver/calls={calls}@{os.getenv('NODE_NAME') or platform.node()}"
+
+    with fake_browser():
+        available = build_scenarios(calls)
+        names = scenarios or list(available)
+        for name in names:
+            if name not in available:
+                raise ValueError(f"알 수 없는 시나리오: {name} (사용 가능: {', '.join(available)})")
+        print(f"⏱️ 시나리오 {len(names)}개: 워밍업 {warmup}회 + 측정 {repeats}회 (회당 {calls}번 호출)")
+        results = _measure(available, names, repeats, warmup)
+
+        # 저하로 보이는 시나리오만 다시 측정해 시나리오별로 가장 빠른 결과 사용 (일시적인 장비 부하 무시)
+        baseline = None if update_baseline else baseline_results(baseline_path, target)
+        for attempt in range(confirm if baseline else 0):
+            suspects = sorted({regression['scenario'] for regression in
+                               compare_to_baseline(results, baseline, threshold, min_delta=min_delta)})
+            if not suspects:
+                break
+            print(f"🔁 저하 의심 시나리오 재측정 ({attempt + 1}/{confirm}): {', '.join(suspects)}")
+            for name, metrics in _measure(available, suspects, repeats, warmup).items():
+                if metrics['per_call_us']['p95'] < results[name]['per_call_us']['p95']:
+                    results[name] = metrics
+
+    regressions = finish_benchmark(
+        results, target, baseline_path, output_path, threshold,
+        update_baseline, min_delta=min_delta, repeats=repeats, warmup=warmup, unit='us',
+    )
+    return not regressions
+
+
+def _measure(available, names, repeats, warmup):
+    """시나리오 측정 후 호출당 시간 요약 반환"""
+    runner = BenchmarkRunner(repeats, warmup, TestConfig.BENCHMARK_TRIM)
+    # 드라이버 생성/정리 메시지가 수천 줄 출력되지 않도록 측정 중에는 출력 숨김
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for name in names:
+            runner.measure(name, available[name])
+    # 시나리오 전체 시간(duration)은 calls에 비례하므로 호출당 시간만 비교
+    return {name: {'per_call_us': metrics['per_call_us']} for name, metrics in runner.results().items()}
+
+
+def main(argv=None):
+    """명령행 실행"""
+    options = {}
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--repeats="):
+            options['repeats'] = int(arg.split("=")[1])
+        elif arg.startswith("--warmup="):
+            options['warmup'] = int(arg.split("=")[1])
+        elif arg.startswith("--calls="):
+            options['calls'] = int(arg.split("=")[1])
+        elif arg.startswith("--threshold="):
+            options['threshold'] = float(arg.split("=")[1])
+        elif arg.startswith("--min-delta="):
+            options['min_delta'] = float(arg.split("=")[1])
+        elif arg.startswith("--confirm="):
+            options['confirm'] = int(arg.split("=")[1])
+        elif arg.startswith("--scenario="):
+            options['scenarios'] = arg.split("=")[1].split(",")
+        elif arg == "--update-baseline":
+            options['update_baseline'] = True
+    return 0 if run_framework_benchmark(**options) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+페이지 로드 성능 회귀 벤치마크
+BasePage로 페이지 이동과 주요 사용자 흐름을 반복 실행해 백분위수를 계산하고,
+저장된 기준선보다 p95가 임계값 넘게 느려지면 실패(종료 코드 1)합니다.
+
+기본적으로 benchmarks/site의 정적 픽스처 사이트를 로컬 서버로 띄워 네트워크 없이 측정합니다.
+
+사용법:
+    python -m benchmarks.page_load [--repeats=10] [--warmup=2] [--threshold=0.2]
+                                   [--scenario=home,search_flow] [--url=https://...]
+                                   [--update-baseline]
+"""
+import os
+import sys
+import time
+from selenium.webdriver.common.by import By
+from config.config import TestConfig
+from pages.base_page import BasePage
+from utils.benchmark import BenchmarkRunner, finish_benchmark
+from utils.driver_factory import DriverFactory
+from utils.fixture_server import FixtureServer
+from utils.perf_metrics import collect_page_metrics
+
+SITE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'site')
+
+# 측정값으로 기록할 브라우저 측 지표 (ms)
+PAGE_METRICS = ('ttfb', 'dom_content_loaded', 'load')
+
+
+def page_metrics(metrics):
+    """수집한 성능 지표에서 비교할 값만 추출"""
+    if not metrics:
+        return {}
+    values = {name: (metrics.get('navigation') or {}).get(name) for name in PAGE_METRICS}
+    values['lcp'] = metrics.get('lcp')
+    return {name: value for name, value in values.items() if value is not None}
+
+
+def build_scenarios(page, base_url, local=True):
+    """
+    측정할 시나리오 목록
+
+    Args:
+        page (BasePage): 페이지 객체
+        base_url (str): 대상 사이트 주소
+        local (bool): 픽스처 사이트 여부 (아니면 base_url 이동만 측정)
+
+    Returns:
+        dict: 시나리오 이름 → 인자 없는 함수
+    """
+    def timed_load(url, *then):
+        # 실행 시간은 지표 수집 스크립트(최소 50ms 대기) 전까지만 측정
+        start = time.perf_counter()
+        page.navigate_to(url, collect_metrics=False)
+        for step in then:
+            step()
+        duration = (time.perf_counter() - start) * 1000
+        try:
+            metrics = page_metrics(collect_page_metrics(page.driver, TestConfig.PERF_RESOURCE_LIMIT))
+        except Exception as e:
+            print(f"⚠️ 성능 지표 수집 실패 ({url}): {e}")
+            metrics = {}
+        return dict(metrics, duration=duration)
+
+    if not local:
+        return {'home': lambda: timed_load(base_url)}
+
+    def home():
+        return timed_load(f"{base_url}/index.html")
+
+    def item_list():
+        return timed_load(f"{base_url}/list.html", lambda: page.find_elements((By.CSS_SELECTOR, "#items .item")))
+
+    def search_flow():
+        page.navigate_to(f"{base_url}/form.html")
+        page.input_text((By.ID, "query"), "제주")
+        page.click_element((By.ID, "submit"))
+        page.wait_for_element_visible((By.CSS_SELECTOR, "#results .result"))
+
+    return {'home': home, 'list': item_list, 'search_flow': search_flow}
+
+
+def run_benchmark(repeats=None, warmup=None, threshold=None, scenarios=None, url=None,
+                  update_baseline=False, baseline_path=None, output_path=None):
+    """
+    벤치마크 실행
+
+    Args:
+        repeats (int): 반복 횟수 (기본값: TestConfig.BENCHMARK_REPEATS)
+        warmup (int): 워밍업 횟수 (기본값: TestConfig.BENCHMARK_WARMUP)
+        threshold (float): p95 허용 증가율 (기본값: TestConfig.BENCHMARK_THRESHOLD)
+        scenarios (list): 실행할 시나리오 이름 (기본값: 전체)
+        url (str): 측정할 실제 사이트 주소 (없으면 로컬 픽스처 사이트)
+        update_baseline (bool): 결과를 새 기준선으로 저장
+        baseline_path (str): 기준선 파일 (기본값: TestConfig.BENCHMARK_BASELINE)
+        output_path (str): 결과 파일 (기본값: TestConfig.BENCHMARK_RESULT)
+
+    Returns:
+        bool: 성능 저하가 없으면 True
+    """
+    repeats = repeats or TestConfig.BENCHMARK_REPEATS
+    warmup = warmup if warmup is not None else TestConfig.BENCHMARK_WARMUP
+    threshold = threshold if threshold is not None else TestConfig.BENCHMARK_THRESHOLD
+    baseline_path = baseline_path or TestConfig.BENCHMARK_BASELINE
+    output_path = output_path or TestConfig.BENCHMARK_RESULT
+
+    server = None if url else FixtureServer(SITE_DIR).start()
+    driver = None
+    try:
+        driver = DriverFactory.get_driver()
+        page = BasePage(driver)
+        available = build_scenarios(page, url or server.base_url, local=url is None)
+        runner = BenchmarkRunner(repeats, warmup, TestConfig.BENCHMARK_TRIM)
+        for name in scenarios or list(available):
+            if name not in available:
+                raise ValueError(f"알 수 없는 시나리오: {name} (사용 가능: {', '.join(available)})")
+            print(f"⏱️ {name}: 워밍업 {warmup}회 + 측정 {repeats}회")
+            runner.measure(name, available[name])
+    finally:
+        DriverFactory.quit_driver(driver)
+        if server:
+            server.stop()
+
+    regressions = finish_benchmark(
+        runner.results(), url or 'fixture-site', baseline_path, output_path, threshold,
+        update_baseline, browser=TestConfig.BROWSER, repeats=repeats, warmup=warmup,
+    )
+    return not regressions
+
+
+def main(argv=None):
+    """명령행 실행"""
+    options = {}
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--repeats="):
+            options['repeats'] = int(arg.split("=")[1])
+        elif arg.startswith("--warmup="):
+            options['warmup'] = int(arg.split("=")[1])
+        elif arg.startswith("--threshold="):
+            options['threshold'] = float(arg.split("=")[1])
+        elif arg.startswith("--scenario="):
+            options['scenarios'] = arg.split("=")[1].split(",")
+        elif arg.startswith("--url="):
+            options['url'] = arg.split("=", 1)[1]
+        elif arg == "--update-baseline":
+            options['update_baseline'] = True
+    return 0 if run_benchmark(**options) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
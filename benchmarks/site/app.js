@@ -0,0 +1,4 @@
+// 공통 스크립트: 로드 완료 표시
+window.addEventListener('load', function () {
+  document.body.setAttribute('data-loaded', 'true');
+});
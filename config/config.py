@@ -2,6 +2,8 @@
 Selenium 테스트 설정 파일
 """
 import os
+import tempfile
+import time
 from dotenv import load_dotenv
 
 # .env 파일 로드
@@ -10,24 +12,121 @@ load_dotenv()
 class TestConfig:
     """테스트 설정 클래스"""
     
-    # 기본 URL
+    # 기본 URL ('fixture'면 세션 시작 시 로컬 픽스처 서버 주소로 대체)
     BASE_URL = os.getenv('BASE_URL', 'https://www.hanatour.com')
     
+    # 로컬 픽스처 웹 서버 (정적 페이지 디렉토리, 포트: 0이면 빈 포트 자동 선택)
+    FIXTURE_SITE_DIR = os.getenv('FIXTURE_SITE_DIR', 'tests/fixtures/site')
+    FIXTURE_SERVER_PORT = int(os.getenv('FIXTURE_SERVER_PORT', '0'))
+    
     # 브라우저 설정
     BROWSER = os.getenv('BROWSER', 'chrome').lower()
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     
     # 타임아웃 설정 (초)
-    IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '10'))
     EXPLICIT_WAIT = int(os.getenv('EXPLICIT_WAIT', '20'))
     PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
     
+    # BasePage 대기 엔진 설정 (폴링 간격 초, 학습된 대기 시간 배수/최소값)
+    WAIT_POLL_INITIAL = float(os.getenv('WAIT_POLL_INITIAL', '0.05'))
+    WAIT_POLL_MAX = float(os.getenv('WAIT_POLL_MAX', '0.5'))
+    WAIT_BACKOFF = float(os.getenv('WAIT_BACKOFF', '1.5'))
+    WAIT_BUDGET_FACTOR = float(os.getenv('WAIT_BUDGET_FACTOR', '3'))
+    WAIT_BUDGET_MIN = float(os.getenv('WAIT_BUDGET_MIN', '1'))
+    
     # 윈도우 크기
     WINDOW_WIDTH = int(os.getenv('WINDOW_WIDTH', '1920'))
     WINDOW_HEIGHT = int(os.getenv('WINDOW_HEIGHT', '1080'))
     
+    # 드라이버 재사용(풀) 설정
+    DRIVER_REUSE = os.getenv('DRIVER_REUSE', 'false').lower() == 'true'
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '2'))
+    DRIVER_POOL_IDLE_TIMEOUT = int(os.getenv('DRIVER_POOL_IDLE_TIMEOUT', '300'))
+    
+    # 드라이버 미리 실행: 테스트 실행 중에 다음 브라우저를 이 수만큼 띄워 둠 (0이면 사용 안 함),
+    # 여유 메모리(MemAvailable)가 이 값(MB)보다 적으면 새로 띄우지 않음
+    DRIVER_PREWARM = int(os.getenv('DRIVER_PREWARM', '0'))
+    DRIVER_PREWARM_MIN_AVAILABLE_MB = int(os.getenv('DRIVER_PREWARM_MIN_AVAILABLE_MB', '1024'))
+    
+    # 상주 브라우저 데몬 (run_tests.py --daemon): 'auto'면 소켓이 있을 때 대여한 세션 사용, 'off'면 항상 새로 실행
+    BROWSER_DAEMON = os.getenv('BROWSER_DAEMON', 'auto').lower()
+    BROWSER_DAEMON_SOCKET = (os.getenv('BROWSER_DAEMON_SOCKET')
+                             or os.path.join(tempfile.gettempdir(), 'selenium_browser_daemon.sock'))
+    BROWSER_DAEMON_SIZE = int(os.getenv('BROWSER_DAEMON_SIZE', '1'))
+    
+    # 브라우저 컨텍스트 격리 모드 (Chrome 전용, 테스트마다 새 incognito 컨텍스트 사용)
+    CONTEXT_ISOLATION = os.getenv('CONTEXT_ISOLATION', 'false').lower() == 'true'
+    
+    # 네트워크 요청 차단 (Chrome 전용, 쉼표 구분): driver fixture에 적용할 리소스 분류와 추가 URL 패턴,
+    # 'ubuntu'/'fast' 프로필이 차단할 리소스 분류 (images, fonts, media, analytics, ads)
+    BLOCK_RESOURCES = os.getenv('BLOCK_RESOURCES', '')
+    BLOCK_URL_PATTERNS = os.getenv('BLOCK_URL_PATTERNS', '')
+    PROFILE_BLOCK_RESOURCES = os.getenv('PROFILE_BLOCK_RESOURCES', 'images,fonts,media,analytics,ads')
+    
+    # HTTP 기록/재생 프록시: 비우면 사용 안 함, 'record'면 응답 저장, 'replay'면 저장된 응답만 사용
+    # (REPLAY_CA_DIR: HTTPS 복호화용 로컬 CA 디렉토리, 비우면 HTTPS는 기록/재생하지 않음)
+    REPLAY_MODE = os.getenv('REPLAY_MODE', '').lower()
+    REPLAY_ARCHIVE = os.getenv('REPLAY_ARCHIVE', 'recordings')
+    REPLAY_CA_DIR = os.getenv('REPLAY_CA_DIR', '~/.cache/seleniumtest/replay_ca')
+    
+    # 병렬 실행 설정
+    WORKER_ID = os.getenv('WORKER_ID', '')
+    # 원격 디버깅 포트: 비우면 사용 안 함, 'auto'면 자동 예약, 숫자면 고정 포트
+    REMOTE_DEBUGGING_PORT = os.getenv('REMOTE_DEBUGGING_PORT', '')
+    PORT_LOCK_DIR = os.getenv('PORT_LOCK_DIR', os.path.join(tempfile.gettempdir(), 'selenium_ports'))
+    RUN_HISTORY_FILE = os.getenv('RUN_HISTORY_FILE', 'reports/run_history.json')
+    # 실행 순서: 'failed-first'면 최근 실패/불안정/변경된 테스트 먼저, 나머지는 빠른 테스트부터 ('none'이면 수집 순서)
+    TEST_ORDER = os.getenv('TEST_ORDER', 'failed-first')
+    # 이 수만큼 실패하면 나머지 테스트를 건너뛰고 종료 (0이면 사용 안 함)
+    FAIL_FAST = int(os.getenv('FAIL_FAST', '0'))
+    # flaky 마커 기본 재실행 횟수/간격(초)과 재실행 통계 파일
+    FLAKY_RERUNS = int(os.getenv('FLAKY_RERUNS', '2'))
+    FLAKY_RERUN_DELAY = float(os.getenv('FLAKY_RERUN_DELAY', '0'))
+    FLAKY_STATS_FILE = os.getenv('FLAKY_STATS_FILE', 'reports/flaky_stats.json')
+    
+    # 실행 식별자: 결과 스트림과 실패 스크린샷 인덱스에 기록해 리포트에서 이번 실행의 스크린샷만 연결
+    RUN_ID = os.getenv('RUN_ID') or f"{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+    
+    # 리포트 설정: 결과는 테스트가 끝날 때마다 JSONL로 기록하고, 세션 종료 시 HTML 생성 (비우면 생성 안 함)
+    REPORT_STREAM_FILE = os.getenv('REPORT_STREAM_FILE', 'reports/results.jsonl')
+    REPORT_HTML_FILE = os.getenv('REPORT_HTML_FILE', 'reports/report.html')
+    # 테스트/단계별 타이밍 집계 파일 (비우면 저장 안 함)과 요약에 표시할 느린 테스트 수
+    TIMING_FILE = os.getenv('TIMING_FILE', 'reports/timings.json')
+    TIMING_SUMMARY_TOP = int(os.getenv('TIMING_SUMMARY_TOP', '10'))
+    
+    # 페이지 성능 지표 수집 (navigate_to 기본값), 결과 파일, 기록할 느린 리소스 수
+    PERF_METRICS = os.getenv('PERF_METRICS', 'false').lower() == 'true'
+    PERF_METRICS_FILE = os.getenv('PERF_METRICS_FILE', 'reports/perf_metrics.jsonl')
+    PERF_RESOURCE_LIMIT = int(os.getenv('PERF_RESOURCE_LIMIT', '10'))
+    
+    # 페이지 로드 벤치마크 설정 (BENCHMARK_THRESHOLD: 기준선 대비 p95 허용 증가율)
+    BENCHMARK_REPEATS = int(os.getenv('BENCHMARK_REPEATS', '10'))
+    BENCHMARK_WARMUP = int(os.getenv('BENCHMARK_WARMUP', '2'))
+    BENCHMARK_TRIM = float(os.getenv('BENCHMARK_TRIM', '1.5'))
+    BENCHMARK_THRESHOLD = float(os.getenv('BENCHMARK_THRESHOLD', '0.2'))
+    BENCHMARK_BASELINE = os.getenv('BENCHMARK_BASELINE', 'benchmarks/baseline.json')
+    BENCHMARK_RESULT = os.getenv('BENCHMARK_RESULT', 'reports/benchmark.json')
+    # 가짜 WebDriver로 측정하는 프레임워크 자체 벤치마크
+    # (MIN_DELTA: 저하로 볼 호출당 최소 증가량 us, CONFIRM: 저하 의심 시나리오 재측정 횟수)
+    FRAMEWORK_BENCHMARK_BASELINE = os.getenv('FRAMEWORK_BENCHMARK_BASELINE', 'benchmarks/framework_baseline.json')
+    FRAMEWORK_BENCHMARK_RESULT = os.getenv('FRAMEWORK_BENCHMARK_RESULT', 'reports/framework_benchmark.json')
+    FRAMEWORK_BENCHMARK_MIN_DELTA = float(os.getenv('FRAMEWORK_BENCHMARK_MIN_DELTA', '2'))
+    FRAMEWORK_BENCHMARK_CONFIRM = int(os.getenv('FRAMEWORK_BENCHMARK_CONFIRM', '2'))
+    
+    # 드라이버 실행 파일 캐시 설정 (DRIVER_OFFLINE=true면 다운로드 없이 캐시만 사용)
+    DRIVER_CACHE_DIR = os.getenv('DRIVER_CACHE_DIR', '~/.cache/seleniumtest/drivers')
+    DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'
+    DRIVER_STRATEGY_TTL = int(os.getenv('DRIVER_STRATEGY_TTL', '3600'))
+    
     # 스크린샷 설정
     SCREENSHOT_DIR = os.getenv('SCREENSHOT_DIR', 'reports/screenshots')
+    # 저장 형식(png/webp/jpeg, png 외에는 Pillow 필요), 품질, 최대 너비 (0이면 원본 크기)
+    SCREENSHOT_FORMAT = os.getenv('SCREENSHOT_FORMAT', 'png')
+    SCREENSHOT_QUALITY = int(os.getenv('SCREENSHOT_QUALITY', '80'))
+    SCREENSHOT_MAX_WIDTH = int(os.getenv('SCREENSHOT_MAX_WIDTH', '0'))
+    # 실패 아티팩트 백그라운드 기록 스레드 수와 대기열 크기
+    ARTIFACT_WORKERS = int(os.getenv('ARTIFACT_WORKERS', '2'))
+    ARTIFACT_QUEUE_SIZE = int(os.getenv('ARTIFACT_QUEUE_SIZE', '32'))
     
     # 테스트 데이터
     TEST_USERNAME = os.getenv('TEST_USERNAME', 'test_user')
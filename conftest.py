@@ -6,7 +6,56 @@ import pytest
 import os
 import time
 import traceback
+from config.config import TestConfig
 from utils.driver_factory import DriverFactory
+from utils.run_history import RunHistory
+from utils.artifact_writer import ArtifactWriter
+from utils.report_stream import ReportStream, read_results
+from utils.report_merge import write_html_report
+from utils.timing import timings
+from utils.perf_metrics import PerfMetricsStore
+from utils.resource_blocking import DEFAULT_CLASSES
+from utils.fixture_server import FixtureServer
+from utils.ordering import GROUP_NAMES, STABLE, changed_files, order_items
+from utils.flaky_stats import FlakyStats
+
+
+# 테스트별 소요 시간 이력 (병렬 실행 스케줄링에 사용)
+_run_history = RunHistory(TestConfig.RUN_HISTORY_FILE)
+_test_durations = {}
+_test_outcomes = {}
+
+# 실패 스크린샷/로그 파일 기록은 백그라운드에서 처리 (다음 테스트를 막지 않음)
+_artifact_writer = ArtifactWriter(TestConfig.ARTIFACT_WORKERS, TestConfig.ARTIFACT_QUEUE_SIZE)
+
+# 테스트 결과를 끝나는 대로 JSONL에 기록 (HTML 리포트는 세션 종료 시 생성)
+_report_stream = ReportStream(TestConfig.REPORT_STREAM_FILE)
+_report_outcomes = {}
+_report_messages = {}
+
+# flaky 마커 테스트의 재실행 횟수와 누적 통계
+_test_reruns = {}
+_flaky_stats = FlakyStats(TestConfig.FLAKY_STATS_FILE)
+
+
+def pytest_addoption(parser):
+    """커스텀 명령행 옵션 등록"""
+    parser.addoption(
+        "--reuse-driver", action="store_true", default=False,
+        help="드라이버 풀을 사용해 테스트 간 브라우저 재사용"
+    )
+    parser.addoption(
+        "--pool-size", action="store", type=int, default=None,
+        help="드라이버 풀 최대 크기 (기본값: DRIVER_POOL_SIZE)"
+    )
+    parser.addoption(
+        "--test-order", action="store", choices=("failed-first", "none"), default=None,
+        help="실행 순서 (기본값: TEST_ORDER)"
+    )
+    parser.addoption(
+        "--fail-fast", action="store_const", const=1, default=None,
+        help="첫 실패에서 실행 중단 (N번째 실패에서 중단하려면 FAIL_FAST=N)"
+    )
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -18,20 +67,7 @@ def pytest_runtest_makereport(item, call):
     # 테스트가 실패했고, WebDriver가 있는 경우에만 스크린샷 촬영
     if report.when == "call" and report.failed:
         try:
-            # 테스트 클래스에서 driver 인스턴스 찾기
-            driver = None
-            if hasattr(item, 'funcargs'):
-                # fixture에서 driver 찾기
-                for fixture_name, fixture_value in item.funcargs.items():
-                    if hasattr(fixture_value, 'save_screenshot'):
-                        driver = fixture_value
-                        break
-            
-            # 클래스 인스턴스에서 driver 찾기
-            if not driver and hasattr(item, 'instance'):
-                if hasattr(item.instance, 'driver'):
-                    driver = item.instance.driver
-            
+            driver = _find_driver(item)
             if driver:
                 # 테스트 이름 생성
                 test_name = f"{item.module.__name__}.{item.name}"
@@ -41,34 +77,275 @@ def pytest_runtest_makereport(item, call):
                 if hasattr(report, 'longrepr'):
                     error_info = str(report.longrepr)
                 
-                # 스크린샷 촬영
-                screenshot_path = DriverFactory.take_screenshot_on_failure(
+                # 브라우저 상태만 수집하고 파일 기록은 백그라운드로 넘김
+                payload = DriverFactory.capture_failure(
                     driver=driver,
                     test_name=test_name,
                     error_info=error_info
                 )
-                
-                if screenshot_path:
-                    print(f"📸 실패 스크린샷 저장됨: {screenshot_path}")
+                _artifact_writer.submit(DriverFactory.write_failure_artifacts, payload)
+                print(f"📸 실패 스크린샷 기록 예약됨: {test_name}")
                     
         except Exception as e:
             print(f"스크린샷 촬영 중 오류: {e}")
 
 
+def _find_driver(item):
+    """테스트가 사용하는 WebDriver (fixture 또는 테스트 클래스 인스턴스의 driver 속성)"""
+    for fixture_value in getattr(item, 'funcargs', {}).values():
+        if hasattr(fixture_value, 'save_screenshot'):
+            return fixture_value
+    instance = getattr(item, 'instance', None)
+    return getattr(instance, 'driver', None)
+
+
+@pytest.hookimpl(hookwrapper=True, trylast=True)
+def pytest_runtest_call(item):
+    """
+    flaky 마커 테스트는 실패한 본문(call)만 재실행
+    
+    setup/teardown과 maxfail, --setup-only 등은 pytest 기본 실행 절차가 그대로 처리하고,
+    재실행 전에는 같은 브라우저의 상태만 초기화하므로 브라우저를 다시 띄우지 않습니다.
+    실패한 시도는 'rerun'으로 기록되고 마지막 시도의 결과만 일반 결과로 보고됩니다.
+    """
+    marker = item.get_closest_marker("flaky")
+    start = time.time()
+    outcome = yield
+    if marker is None:
+        return
+    reruns = marker.kwargs.get("reruns", marker.args[0] if marker.args else TestConfig.FLAKY_RERUNS)
+    delay = marker.kwargs.get("delay", TestConfig.FLAKY_RERUN_DELAY)
+    
+    attempts = 1
+    # skip/xfail/exit 같은 pytest 제어 예외(BaseException)는 재실행하지 않음
+    while (outcome.excinfo is not None and isinstance(outcome.excinfo[1], Exception)
+           and attempts <= reruns and _report_rerun(item, outcome.excinfo[1], start)):
+        _reset_for_rerun(item)
+        if delay:
+            time.sleep(delay)
+        attempts += 1
+        start = time.time()
+        try:
+            item.runtest()
+        except Exception as e:
+            outcome.force_exception(e)
+        else:
+            outcome.force_result(None)
+    if outcome.excinfo is None:
+        _flaky_stats.record(item.nodeid, attempts, "passed")
+    elif isinstance(outcome.excinfo[1], Exception):
+        _flaky_stats.record(item.nodeid, attempts, "failed")
+
+
+def _report_rerun(item, exception, start):
+    """
+    실패한 시도를 'rerun' 결과로 기록
+    
+    Returns:
+        bool: 재실행할지 여부 (xfail처럼 실패가 예상된 결과면 False)
+    """
+    def reraise():
+        raise exception
+    
+    call = pytest.CallInfo.from_call(reraise, "call")
+    call.start, call.duration = start, time.time() - start
+    report = item.ihook.pytest_runtest_makereport(item=item, call=call)
+    if not report.failed:
+        return False
+    report.outcome = "rerun"
+    item.ihook.pytest_runtest_logreport(report=report)
+    return True
+
+
+def _reset_for_rerun(item):
+    """재실행 전 테스트가 쓰던 브라우저 상태 초기화 (실패하면 그대로 재실행)"""
+    driver = _find_driver(item)
+    if driver is None:
+        return
+    try:
+        # 컨텍스트 격리 모드에서는 호스트 탭을 닫지 않도록 창은 유지
+        DriverFactory.reset_driver(driver, close_windows=not _use_isolated_context(item))
+    except Exception as e:
+        print(f"재실행 전 브라우저 초기화 실패: {e}")
+
+
+def pytest_report_teststatus(report, config):
+    """재실행된 시도는 실패 대신 RERUN으로 표시"""
+    if report.outcome == "rerun":
+        return "rerun", "R", ("RERUN", {"yellow": True})
+    return None
+
+
+def pytest_sessionstart(session):
+    """타이밍 계측과 결과 스트림 기록 시작 (수집만 하는 실행에서는 기존 결과 유지)"""
+    timings.start_session()
+    if not session.config.option.collectonly:
+        _report_stream.open()
+        # 병렬 워커는 실행기가 미리 비운 파일에 함께 기록
+        if not TestConfig.WORKER_ID:
+            PerfMetricsStore(TestConfig.PERF_METRICS_FILE).reset()
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """이후 측정되는 타이밍을 현재 테스트에 기록"""
+    timings.start_test(nodeid)
+
+
+def pytest_runtest_logreport(report):
+    """setup/call/teardown 결과를 합산해 실행 이력과 결과 스트림에 기록"""
+    _test_durations[report.nodeid] = _test_durations.get(report.nodeid, 0.0) + report.duration
+    if report.outcome == "rerun":
+        _test_reruns[report.nodeid] = _test_reruns.get(report.nodeid, 0) + 1
+        return
+    if report.when == "call" or (report.when == "setup" and not report.passed):
+        _test_outcomes[report.nodeid] = report.outcome
+    
+    # 리포트용 결과: setup/teardown 실패는 error
+    if report.when == "call":
+        outcome = report.outcome
+    elif report.failed:
+        outcome = "error"
+    elif report.skipped:
+        outcome = "skipped"
+    else:
+        outcome = None
+    if outcome and _report_outcomes.get(report.nodeid) != "error":
+        _report_outcomes[report.nodeid] = outcome
+    if not report.passed and report.nodeid not in _report_messages:
+        _report_messages[report.nodeid] = report.longreprtext
+    
+    if report.when == "teardown":
+        duration = _test_durations.pop(report.nodeid)
+        timings.end_test(report.nodeid, duration)
+        _run_history.record(report.nodeid, duration, _test_outcomes.pop(report.nodeid, None))
+        _report_stream.write(
+            report.nodeid,
+            _report_outcomes.pop(report.nodeid, "passed"),
+            duration,
+            _report_messages.pop(report.nodeid, ""),
+            worker=TestConfig.WORKER_ID or None,
+            run=TestConfig.RUN_ID,
+            reruns=_test_reruns.pop(report.nodeid, 0),
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """세션 종료 시 남은 아티팩트 기록, 실행 이력/타이밍 저장, HTML 리포트 생성"""
+    _artifact_writer.shutdown()
+    timings.end_session()
+    if TestConfig.TIMING_FILE and not session.config.option.collectonly:
+        try:
+            timings.write_json(TestConfig.TIMING_FILE, TestConfig.TIMING_SUMMARY_TOP)
+        except Exception as e:
+            print(f"타이밍 저장 실패: {e}")
+    try:
+        _run_history.save()
+    except Exception as e:
+        print(f"실행 이력 저장 실패: {e}")
+    try:
+        _flaky_stats.save()
+    except Exception as e:
+        print(f"flaky 통계 저장 실패: {e}")
+    
+    _report_stream.close()
+    if TestConfig.REPORT_HTML_FILE and not session.config.option.collectonly:
+        try:
+            write_html_report(
+                read_results([TestConfig.REPORT_STREAM_FILE]),
+                TestConfig.REPORT_HTML_FILE,
+                TestConfig.SCREENSHOT_DIR,
+                source=TestConfig.REPORT_STREAM_FILE,
+            )
+        except Exception as e:
+            print(f"HTML 리포트 생성 실패: {e}")
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """느린 테스트, 대기/동작 시간, 브라우저 실행 오버헤드 요약 출력"""
+    if config.option.collectonly or not timings.wall_clock:
+        return
+    terminalreporter.section("⏱️ 타이밍 요약")
+    for line in timings.format_summary(TestConfig.TIMING_SUMMARY_TOP):
+        terminalreporter.write_line(line)
+    
+    rerun = _flaky_stats.session_results()
+    chronic = _flaky_stats.load().chronic()
+    if rerun or chronic:
+        terminalreporter.section("🔁 flaky 테스트")
+        for nodeid, attempts, outcome in rerun:
+            terminalreporter.write_line(f"  {outcome:7} {attempts}회 실행  {nodeid}")
+        for nodeid in chronic:
+            entry = _flaky_stats.tests[nodeid]
+            terminalreporter.write_line(f"  격리 후보 (불안정 {entry['flaky_rate'] * 100:.0f}%, "
+                                        f"{entry['runs']}회 중): {nodeid}")
+
+
+def _use_isolated_context(node):
+    """컨텍스트 격리 모드 사용 여부 (isolated_context 마커 또는 CONTEXT_ISOLATION 설정)"""
+    if not (node.get_closest_marker("isolated_context") or TestConfig.CONTEXT_ISOLATION):
+        return False
+    if TestConfig.BROWSER != 'chrome':
+        print(f"⚠️ 컨텍스트 격리는 Chrome 전용입니다 ({TestConfig.BROWSER}): 일반 드라이버 사용")
+        return False
+    return True
+
+
+def _apply_resource_blocking(request, driver):
+    """
+    block_resources 마커 또는 BLOCK_RESOURCES/BLOCK_URL_PATTERNS 설정에 따라 요청 차단
+    
+    마커 인자가 없으면 기본 분류(이미지, 폰트, 미디어, 분석, 광고)를 차단합니다.
+    
+    Returns:
+        bool: 차단 적용 여부
+    """
+    marker = request.node.get_closest_marker("block_resources")
+    if marker:
+        classes = marker.args or (DEFAULT_CLASSES if 'patterns' not in marker.kwargs else ())
+        patterns = marker.kwargs.get('patterns', ())
+    else:
+        classes, patterns = TestConfig.BLOCK_RESOURCES, TestConfig.BLOCK_URL_PATTERNS
+    return bool(DriverFactory.block_resources(driver, classes, patterns))
+
+
 @pytest.fixture(scope="function")
-def driver():
-    """WebDriver fixture - 각 테스트마다 새로운 드라이버 제공"""
+def driver(request):
+    """WebDriver fixture - 각 테스트마다 드라이버 제공 (풀/컨텍스트 격리 모드에서는 재사용)"""
+    if _use_isolated_context(request.node):
+        context = DriverFactory.open_isolated_context()
+        try:
+            # 차단 설정은 컨텍스트의 탭에만 적용되고 컨텍스트와 함께 폐기됨
+            _apply_resource_blocking(request, context.driver)
+            yield context.driver
+        finally:
+            DriverFactory.close_isolated_context(context)
+        return
+    
     driver = None
+    blocked = False
     try:
-        driver = DriverFactory.get_driver()
+        driver = DriverFactory.acquire_driver()
+        blocked = _apply_resource_blocking(request, driver)
         yield driver
     finally:
         if driver:
-            DriverFactory.quit_driver(driver)
+            # 풀에 반납하는 드라이버는 다음 테스트를 위해 차단 해제
+            if blocked and TestConfig.DRIVER_REUSE:
+                DriverFactory.unblock_resources(driver)
+            DriverFactory.release_driver(driver)
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    """로컬 픽스처 웹 서버 - 정적 페이지와 httpbin 호환 엔드포인트 제공 (세션당 하나)"""
+    server = FixtureServer(TestConfig.FIXTURE_SITE_DIR, port=TestConfig.FIXTURE_SERVER_PORT).start()
+    print(f"🌐 픽스처 서버 시작: {server.base_url}")
+    yield server
+    server.stop()
 
 
 @pytest.fixture(scope="session", autouse=True)
-def setup_test_environment():
+def setup_test_environment(request):
     """테스트 환경 설정"""
     # 스크린샷 디렉토리 생성
     screenshot_dir = "reports/screenshots"
@@ -76,17 +353,51 @@ def setup_test_environment():
     
     print(f"📁 스크린샷 디렉토리 준비: {screenshot_dir}")
     
+    # BASE_URL=fixture면 로컬 픽스처 서버를 대상으로 실행
+    if TestConfig.BASE_URL == 'fixture':
+        TestConfig.BASE_URL = request.getfixturevalue("fixture_server").base_url
+    
     yield
     
+    # 풀과 컨텍스트 격리 모드에 남아있는 드라이버 종료
+    DriverFactory.close_pool()
+    DriverFactory.close_context_host()
+    DriverFactory.stop_prewarm()
+    DriverFactory.stop_replay_proxy()
+    
     print("🧹 테스트 환경 정리 완료")
 
 
 def pytest_configure(config):
     """pytest 설정"""
+    # 드라이버 풀 모드 설정
+    if config.getoption("--reuse-driver"):
+        TestConfig.DRIVER_REUSE = True
+    if config.getoption("--pool-size"):
+        TestConfig.DRIVER_POOL_SIZE = config.getoption("--pool-size")
+    
+    # 실행 순서와 조기 종료 설정
+    if config.getoption("--test-order"):
+        TestConfig.TEST_ORDER = config.getoption("--test-order")
+    fail_fast = config.getoption("--fail-fast") or TestConfig.FAIL_FAST
+    if fail_fast and not config.option.maxfail:
+        config.option.maxfail = fail_fast
+    
     # 커스텀 마커 등록
     config.addinivalue_line(
         "markers", "screenshot: 테스트 실패 시 스크린샷 촬영"
     )
+    config.addinivalue_line(
+        "markers", "isolated_context: 공유 Chrome에서 테스트별 incognito 브라우저 컨텍스트 사용"
+    )
+    config.addinivalue_line(
+        "markers",
+        "block_resources(*classes, patterns=[]): 리소스 분류/URL 패턴 요청 차단 (인자가 없으면 기본 분류 전체)"
+    )
+    config.addinivalue_line(
+        "markers",
+        "flaky(reruns=FLAKY_RERUNS, delay=FLAKY_RERUN_DELAY): 실패 시 같은 브라우저로 본문만 재실행"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -94,3 +405,20 @@ def pytest_collection_modifyitems(config, items):
     for item in items:
         # 모든 테스트에 screenshot 마커 추가
         item.add_marker(pytest.mark.screenshot)
+    
+    # 실패 우선 정렬 (병렬/샤드 워커는 실행기가 정한 순서를 유지)
+    if TestConfig.TEST_ORDER != "failed-first" or TestConfig.WORKER_ID or len(items) < 2:
+        return
+    ordered, counts = order_items(items, _run_history.load(), changed_files(str(config.rootpath)))
+    items[:] = ordered
+    prioritized = [f"{GROUP_NAMES[group]} {count}개" for group, count in sorted(counts.items()) if group != STABLE]
+    if prioritized:
+        print(f"🔀 먼저 실행: {', '.join(prioritized)}")
+
+
+def pytest_collection_finish(session):
+    """driver fixture를 쓰는 테스트가 있으면 수집 직후 첫 브라우저 미리 실행 (DRIVER_PREWARM, 수집만 할 때는 제외)"""
+    if session.config.option.collectonly or TestConfig.CONTEXT_ISOLATION or not TestConfig.DRIVER_PREWARM:
+        return
+    if any("driver" in getattr(item, "fixturenames", ()) for item in session.items):
+        DriverFactory.start_prewarm()
@@ -31,7 +31,7 @@ pip install -r requirements.txt
 # 5. 환경 변수 설정
 echo "⚙️ 환경 설정 중..."
 export PYTHONPATH="${PWD}:${PYTHONPATH}"
-export CHROME_OPTIONS="--headless,--no-sandbox,--disable-dev-shm-usage,--disable-gpu,--disable-extensions,--disable-plugins,--disable-images,--disable-javascript,--disable-background-timer-throttling,--disable-backgrounding-occluded-windows,--disable-renderer-backgrounding,--disable-features=TranslateUI,--disable-ipc-flooding-protection"
+export CHROME_OPTIONS="--headless,--no-sandbox,--disable-dev-shm-usage,--disable-gpu,--disable-extensions,--disable-plugins,--disable-background-timer-throttling,--disable-backgrounding-occluded-windows,--disable-renderer-backgrounding,--disable-features=TranslateUI,--disable-ipc-flooding-protection"
 
 # 6. 디렉토리 생성
 echo "📁 디렉토리 생성 중..."
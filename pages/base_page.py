@@ -4,8 +4,17 @@ Page Object Model의 기본 클래스
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 from config.config import TestConfig
+from pages.wait_engine import WaitEngine
+from pages.locator_js import FIND_FIRST_JS, SNAPSHOT_JS, to_js_locators
+from utils.driver_factory import DriverFactory
+from utils.timing import timed, NAVIGATE, WAIT, ACTION
+from utils.perf_metrics import PerfMetricsStore, collect_page_metrics
 import os
 import time
 
@@ -13,6 +22,9 @@ import time
 class BasePage:
     """모든 페이지 객체의 기본 클래스"""
     
+    # StaleElementReferenceException 발생 시 재시도 횟수
+    STALE_RETRIES = 2
+    
     def __init__(self, driver):
         """
         BasePage 초기화
@@ -22,20 +34,88 @@ class BasePage:
         """
         self.driver = driver
         self.wait = WebDriverWait(driver, TestConfig.EXPLICIT_WAIT)
+        
+        # implicit wait와 명시적 대기가 겹치지 않도록 implicit wait 끄기
+        self.driver.implicitly_wait(0)
+        self.waiter = WaitEngine(driver, page_key=type(self).__name__)
+        
+        # 로케이터 → WebElement 캐시 (페이지 이동 시 무효화)
+        self._element_cache = {}
+    
+    @timed(WAIT)
+    def _wait_for(self, locator, condition, timeout, ignored_exceptions=None):
+        """
+        조건 대기 후 탐색 시간을 학습
+        
+        Args:
+            locator (tuple): (By, value) 형태의 로케이터
+            condition (callable): expected_conditions 조건
+            timeout (float): 대기 시간 (초)
+            ignored_exceptions (tuple): 폴링 중 무시할 예외
+        """
+        start = time.monotonic()
+        result = self.waiter.until(
+            condition, timeout, f"요소 대기 시간 초과 ({timeout}초): {locator}", ignored_exceptions
+        )
+        self.waiter.learn(locator, time.monotonic() - start)
+        return result
+    
+    def clear_element_cache(self):
+        """요소 캐시 비우기 (페이지 이동/새로고침 시 자동 호출)"""
+        self._element_cache.clear()
     
-    def navigate_to(self, url):
+    def _with_element(self, locator, timeout, action):
+        """
+        캐시된 요소로 동작 수행 (요소가 stale이면 다시 찾아 재시도)
+        
+        Args:
+            locator (tuple): (By, value) 형태의 로케이터
+            timeout (int): 대기 시간 (초)
+            action (callable): WebElement를 받아 동작을 수행하는 함수
+        """
+        for attempt in range(self.STALE_RETRIES + 1):
+            element = self._element_cache.get(tuple(locator)) or self.find_element(locator, timeout)
+            try:
+                return action(element)
+            except StaleElementReferenceException:
+                self._element_cache.pop(tuple(locator), None)
+                if attempt == self.STALE_RETRIES:
+                    raise
+    
+    @timed(NAVIGATE)
+    def navigate_to(self, url, collect_metrics=None):
         """
         지정된 URL로 이동
         
         Args:
             url (str): 이동할 URL
+            collect_metrics (bool): 페이지 성능 지표(TTFB, DOMContentLoaded, load, LCP, 전송 크기,
+                Chrome CDP 지표) 수집 여부 (기본값: TestConfig.PERF_METRICS)
+            
+        Returns:
+            dict: 수집한 성능 지표 (수집하지 않았거나 실패하면 None)
         """
+        self.clear_element_cache()
         self.driver.get(url)
+        
+        if collect_metrics is None:
+            collect_metrics = TestConfig.PERF_METRICS
+        if not collect_metrics:
+            return None
+        try:
+            metrics = collect_page_metrics(self.driver, TestConfig.PERF_RESOURCE_LIMIT)
+            PerfMetricsStore(TestConfig.PERF_METRICS_FILE).record(url, metrics)
+            return metrics
+        except Exception as e:
+            print(f"⚠️ 성능 지표 수집 실패 ({url}): {e}")
+            return None
     
+    @timed(ACTION)
     def get_title(self):
         """페이지 제목 반환"""
         return self.driver.title
     
+    @timed(ACTION)
     def get_current_url(self):
         """현재 URL 반환"""
         return self.driver.current_url
@@ -44,6 +124,9 @@ class BasePage:
         """
         요소 찾기
         
+        반환한 요소는 호출한 쪽이 직접 사용하므로 stale 여부를 알 수 없는 캐시 대신 항상 새로 찾고,
+        찾은 요소는 캐시에 넣어 클릭/입력 등의 동작(_with_element)이 WebDriver 호출 없이 재사용합니다.
+        
         Args:
             locator (tuple): (By, value) 형태의 로케이터
             timeout (int): 대기 시간 (초)
@@ -52,8 +135,9 @@ class BasePage:
             WebElement: 찾은 요소
         """
         wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.presence_of_element_located(locator))
+        element = self._wait_for(locator, EC.presence_of_element_located(locator), wait_time)
+        self._element_cache[tuple(locator)] = element
+        return element
     
     def find_elements(self, locator, timeout=None):
         """
@@ -67,9 +151,53 @@ class BasePage:
             list: 찾은 요소들의 리스트
         """
         wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        return wait.until(EC.presence_of_all_elements_located(locator))
+        return self._wait_for(locator, EC.presence_of_all_elements_located(locator), wait_time)
     
+    @timed(WAIT)
+    def find_first(self, locators, timeout=None):
+        """
+        여러 로케이터 중 처음으로 존재하는 요소 찾기
+        
+        폴링마다 execute_script 한 번으로 모든 로케이터를 확인하며,
+        전체 로케이터 목록이 하나의 대기 시간을 공유합니다.
+        
+        Args:
+            locators (list): (By, value) 형태의 로케이터 리스트 (앞쪽이 우선)
+            timeout (int): 대기 시간 (초)
+            
+        Returns:
+            tuple: (찾은 로케이터, WebElement)
+        """
+        locators = list(locators)
+        wait_time = timeout or TestConfig.EXPLICIT_WAIT
+        js_locators = to_js_locators(locators)
+        
+        start = time.monotonic()
+        index, element = self.waiter.until(
+            lambda driver: driver.execute_script(FIND_FIRST_JS, js_locators),
+            wait_time,
+            f"요소 대기 시간 초과 ({wait_time}초): {locators}",
+        )
+        self.waiter.learn(locators[index], time.monotonic() - start)
+        return locators[index], element
+    
+    def first_present(self, locators, timeout=None):
+        """
+        여러 로케이터 중 처음으로 존재하는 요소 확인 (없으면 None)
+        
+        Args:
+            locators (list): (By, value) 형태의 로케이터 리스트
+            timeout (int): 전체 로케이터에 대한 대기 시간 (초)
+            
+        Returns:
+            tuple: (찾은 로케이터, WebElement) 또는 None
+        """
+        try:
+            return self.find_first(locators, timeout)
+        except TimeoutException:
+            return None
+    
+    @timed(ACTION)
     def click_element(self, locator, timeout=None):
         """
         요소 클릭
@@ -78,10 +206,16 @@ class BasePage:
             locator (tuple): (By, value) 형태의 로케이터
             timeout (int): 대기 시간 (초)
         """
-        element = self.find_element(locator, timeout)
-        self.wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        wait_time = timeout or TestConfig.EXPLICIT_WAIT
+        
+        def click(element):
+            # 요소 기준 대기이므로 stale 예외는 재시도를 위해 그대로 전달
+            self._wait_for(locator, EC.element_to_be_clickable(element), wait_time, ignored_exceptions=())
+            element.click()
+        
+        self._with_element(locator, timeout, click)
     
+    @timed(ACTION)
     def input_text(self, locator, text, timeout=None):
         """
         텍스트 입력
@@ -91,10 +225,13 @@ class BasePage:
             text (str): 입력할 텍스트
             timeout (int): 대기 시간 (초)
         """
-        element = self.find_element(locator, timeout)
-        element.clear()
-        element.send_keys(text)
+        def type_text(element):
+            element.clear()
+            element.send_keys(text)
+        
+        self._with_element(locator, timeout, type_text)
     
+    @timed(ACTION)
     def get_text(self, locator, timeout=None):
         """
         요소의 텍스트 가져오기
@@ -106,45 +243,83 @@ class BasePage:
         Returns:
             str: 요소의 텍스트
         """
-        element = self.find_element(locator, timeout)
-        return element.text
+        return self._with_element(locator, timeout, lambda element: element.text)
+    
+    @timed(ACTION)
+    def snapshot(self, locators, fields=('text', 'visible'), all_matches=False):
+        """
+        여러 요소의 텍스트/속성/위치/가시성을 execute_script 한 번으로 읽기
+        
+        Args:
+            locators (dict | list): 이름→로케이터 dict 또는 (By, value) 로케이터 리스트
+            fields (list): 읽을 필드 ('text', 'visible', 'rect', 'tag', 'value', 'attr:<속성명>')
+            all_matches (bool): True면 로케이터와 일치하는 모든 요소를 읽음
+            
+        Returns:
+            dict | list: 입력과 같은 형태의 결과. 각 항목은 필드 dict
+                (all_matches면 dict 리스트, 요소가 없으면 None 또는 빈 리스트)
+        
+        Example:
+            rows = page.snapshot([(By.CSS_SELECTOR, ".result")], fields=['text', 'attr:href'],
+                                 all_matches=True)[0]
+        """
+        names = list(locators) if isinstance(locators, dict) else None
+        locator_list = [locators[name] for name in names] if names is not None else list(locators)
+        
+        results = self.driver.execute_script(
+            SNAPSHOT_JS, to_js_locators(locator_list), list(fields), bool(all_matches)
+        )
+        
+        if names is not None:
+            return dict(zip(names, results))
+        return results
     
     def is_element_present(self, locator, timeout=None):
         """
         요소 존재 여부 확인
         
+        timeout을 지정하지 않으면 이전에 찾은 적이 있는 요소는 학습된 탐색 시간을 기준으로
+        짧게 대기하므로 요소가 없을 때 빠르게 False를 반환합니다.
+        
         Args:
             locator (tuple): (By, value) 형태의 로케이터
-            timeout (int): 대기 시간 (초)
+            timeout (int): 대기 시간 (초, 지정하면 그대로 사용)
             
         Returns:
             bool: 요소 존재 여부
         """
+        wait_time = self._check_timeout(locator, timeout)
         try:
-            self.find_element(locator, timeout)
+            element = self._wait_for(locator, EC.presence_of_element_located(locator), wait_time)
+            self._element_cache[tuple(locator)] = element
             return True
         except (TimeoutException, NoSuchElementException):
             return False
     
     def is_element_visible(self, locator, timeout=None):
         """
-        요소 가시성 확인
+        요소 가시성 확인 (timeout을 지정하지 않으면 학습된 탐색 시간을 기준으로 대기)
         
         Args:
             locator (tuple): (By, value) 형태의 로케이터
-            timeout (int): 대기 시간 (초)
+            timeout (int): 대기 시간 (초, 지정하면 그대로 사용)
             
         Returns:
             bool: 요소 가시성
         """
+        wait_time = self._check_timeout(locator, timeout)
         try:
-            wait_time = timeout or TestConfig.EXPLICIT_WAIT
-            wait = WebDriverWait(self.driver, wait_time)
-            wait.until(EC.visibility_of_element_located(locator))
+            self._wait_for(locator, EC.visibility_of_element_located(locator), wait_time)
             return True
         except TimeoutException:
             return False
     
+    def _check_timeout(self, locator, timeout):
+        """존재/가시성 확인 대기 시간 (호출자가 지정한 timeout은 줄이지 않음)"""
+        if timeout:
+            return timeout
+        return self.waiter.budget(locator, TestConfig.EXPLICIT_WAIT)
+    
     def wait_for_element_visible(self, locator, timeout=None):
         """
         요소가 보일 때까지 대기
@@ -154,22 +329,30 @@ class BasePage:
             timeout (int): 대기 시간 (초)
         """
         wait_time = timeout or TestConfig.EXPLICIT_WAIT
-        wait = WebDriverWait(self.driver, wait_time)
-        wait.until(EC.visibility_of_element_located(locator))
+        self._wait_for(locator, EC.visibility_of_element_located(locator), wait_time)
     
+    @timed(ACTION)
     def take_screenshot(self, filename=None):
         """
         스크린샷 촬영
         
+        파일명을 지정하지 않으면 스크린샷 저장소에 내용 해시로 저장하므로
+        같은 화면을 여러 번 촬영해도 파일은 하나만 남습니다.
+        
         Args:
-            filename (str): 파일명 (기본값: timestamp)
+            filename (str): 파일명 (지정하면 SCREENSHOT_DIR 아래 해당 이름으로 저장)
             
         Returns:
             str: 스크린샷 파일 경로
         """
         if not filename:
-            timestamp = int(time.time())
-            filename = f"screenshot_{timestamp}.png"
+            return DriverFactory.get_screenshot_store().put(
+                self.driver.get_screenshot_as_png(),
+                test_name=type(self).__name__,
+                url=self.driver.current_url,
+                title=self.driver.title,
+                kind='manual',
+            )
         
         # 스크린샷 디렉토리 생성
         screenshot_dir = TestConfig.SCREENSHOT_DIR
@@ -179,6 +362,7 @@ class BasePage:
         self.driver.save_screenshot(filepath)
         return filepath
     
+    @timed(ACTION)
     def scroll_to_element(self, locator):
         """
         요소로 스크롤
@@ -186,25 +370,35 @@ class BasePage:
         Args:
             locator (tuple): (By, value) 형태의 로케이터
         """
-        element = self.find_element(locator)
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        self._with_element(
+            locator, None,
+            lambda element: self.driver.execute_script("arguments[0].scrollIntoView(true);", element),
+        )
     
+    @timed(ACTION)
     def scroll_to_bottom(self):
         """페이지 하단으로 스크롤"""
         self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
     
+    @timed(ACTION)
     def scroll_to_top(self):
         """페이지 상단으로 스크롤"""
         self.driver.execute_script("window.scrollTo(0, 0);")
     
+    @timed(NAVIGATE)
     def refresh_page(self):
         """페이지 새로고침"""
+        self.clear_element_cache()
         self.driver.refresh()
     
+    @timed(NAVIGATE)
     def go_back(self):
         """뒤로 가기"""
+        self.clear_element_cache()
         self.driver.back()
     
+    @timed(NAVIGATE)
     def go_forward(self):
         """앞으로 가기"""
+        self.clear_element_cache()
         self.driver.forward()
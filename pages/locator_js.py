@@ -0,0 +1,114 @@
+"""
+브라우저 안에서 Selenium 로케이터를 해석하는 JavaScript
+여러 로케이터를 execute_script 한 번으로 확인할 때 사용합니다.
+"""
+
+# __find(by, value, all): By 전략에 맞게 요소 하나(all=false) 또는 목록(all=true) 반환
+FIND_FUNCTION_JS = """
+function __find(by, value, all) {
+    var list;
+    switch (by) {
+        case 'id':
+            var byId = document.getElementById(value);
+            if (!all) return byId;
+            list = document.querySelectorAll('[id="' + value.replace(/"/g, '\\\\"') + '"]');
+            break;
+        case 'name':
+            list = document.getElementsByName(value);
+            break;
+        case 'class name':
+            list = document.getElementsByClassName(value);
+            break;
+        case 'tag name':
+            list = document.getElementsByTagName(value);
+            break;
+        case 'css selector':
+            if (!all) return document.querySelector(value);
+            list = document.querySelectorAll(value);
+            break;
+        case 'xpath':
+            if (!all) {
+                return document.evaluate(value, document, null,
+                    XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+            }
+            var snapshot = document.evaluate(value, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            list = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) list.push(snapshot.snapshotItem(i));
+            break;
+        case 'link text':
+        case 'partial link text':
+            list = Array.prototype.filter.call(document.querySelectorAll('a'), function (a) {
+                var text = (a.innerText || a.textContent || '').trim();
+                return by === 'link text' ? text === value : text.indexOf(value) !== -1;
+            });
+            break;
+        default:
+            throw new Error('지원하지 않는 로케이터: ' + by);
+    }
+    list = Array.prototype.slice.call(list);
+    return all ? list : (list[0] || null);
+}
+"""
+
+# arguments[0]: [[by, value], ...] → 처음으로 찾은 [인덱스, 요소] 또는 null
+FIND_FIRST_JS = FIND_FUNCTION_JS + """
+var locators = arguments[0];
+for (var i = 0; i < locators.length; i++) {
+    try {
+        var element = __find(locators[i][0], locators[i][1], false);
+        if (element) return [i, element];
+    } catch (e) {}
+}
+return null;
+"""
+
+# arguments[0]: [[by, value], ...], arguments[1]: 필드 목록, arguments[2]: 모든 일치 요소 여부
+# → 로케이터별 필드 dict (all이면 dict 리스트, 없으면 null / [])
+SNAPSHOT_JS = FIND_FUNCTION_JS + """
+var locators = arguments[0], fields = arguments[1], all = arguments[2];
+function __read(element) {
+    var data = {};
+    for (var i = 0; i < fields.length; i++) {
+        var field = fields[i];
+        if (field === 'text') {
+            data.text = (element.innerText || element.textContent || '').trim();
+        } else if (field === 'visible') {
+            var box = element.getBoundingClientRect();
+            var style = window.getComputedStyle(element);
+            data.visible = box.width > 0 && box.height > 0 &&
+                style.visibility !== 'hidden' && style.display !== 'none' && style.opacity !== '0';
+        } else if (field === 'rect') {
+            var rect = element.getBoundingClientRect();
+            data.rect = {x: rect.left + window.scrollX, y: rect.top + window.scrollY,
+                         width: rect.width, height: rect.height};
+        } else if (field === 'tag') {
+            data.tag = element.tagName.toLowerCase();
+        } else if (field === 'value') {
+            data.value = element.value === undefined ? null : element.value;
+        } else if (field.indexOf('attr:') === 0) {
+            data[field.substring(5)] = element.getAttribute(field.substring(5));
+        }
+    }
+    return data;
+}
+var results = [];
+for (var i = 0; i < locators.length; i++) {
+    try {
+        if (all) {
+            results.push(__find(locators[i][0], locators[i][1], true).map(__read));
+        } else {
+            var element = __find(locators[i][0], locators[i][1], false);
+            results.push(element ? __read(element) : null);
+        }
+    } catch (e) {
+        results.push(all ? [] : null);
+    }
+}
+return results;
+"""
+
+
+def to_js_locators(locators):
+    """(By, value) 튜플 목록을 execute_script 인자로 변환"""
+    return [[by, value] for by, value in locators]
@@ -0,0 +1,102 @@
+"""
+대기 엔진
+암묵적 대기(implicit wait)를 끄고 하나의 명시적 폴링 루프로 조건을 기다립니다.
+로케이터별로 실제 탐색에 걸린 시간을 학습해, 부정 확인(요소 없음 확인)을 빠르게 끝냅니다.
+"""
+import threading
+import time
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from config.config import TestConfig
+
+
+class WaitEngine:
+    """점진적으로 폴링 간격을 늘리는 명시적 대기 루프"""
+
+    # (페이지 키, 로케이터) → 관측된 최대 탐색 시간 (초), 같은 페이지 클래스끼리 공유
+    _learned = {}
+    _lock = threading.Lock()
+
+    # 폴링 중 무시할 예외
+    IGNORED_EXCEPTIONS = (NoSuchElementException, StaleElementReferenceException)
+
+    def __init__(self, driver, page_key, initial_poll=None, max_poll=None, backoff=None):
+        """
+        WaitEngine 초기화
+
+        Args:
+            driver: WebDriver 인스턴스
+            page_key (str): 학습 결과를 구분할 페이지 키 (보통 페이지 클래스 이름)
+            initial_poll (float): 첫 폴링 간격 (초)
+            max_poll (float): 최대 폴링 간격 (초)
+            backoff (float): 폴링 간격 증가 배수
+        """
+        self.driver = driver
+        self.page_key = page_key
+        self.initial_poll = initial_poll if initial_poll is not None else TestConfig.WAIT_POLL_INITIAL
+        self.max_poll = max_poll if max_poll is not None else TestConfig.WAIT_POLL_MAX
+        self.backoff = backoff if backoff is not None else TestConfig.WAIT_BACKOFF
+
+    def until(self, condition, timeout, message='', ignored_exceptions=None):
+        """
+        조건이 참이 될 때까지 대기
+
+        Args:
+            condition (callable): driver를 받아 참 값을 반환하는 조건
+            timeout (float): 최대 대기 시간 (초)
+            message (str): 시간 초과 시 예외 메시지
+            ignored_exceptions (tuple): 폴링 중 무시할 예외 (기본값: IGNORED_EXCEPTIONS)
+
+        Returns:
+            조건이 반환한 값
+        """
+        ignored = self.IGNORED_EXCEPTIONS if ignored_exceptions is None else ignored_exceptions
+        deadline = time.monotonic() + timeout
+        poll = self.initial_poll
+        while True:
+            try:
+                value = condition(self.driver)
+                if value:
+                    return value
+            except ignored:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutException(message)
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self.backoff, self.max_poll)
+
+    def learn(self, locator, elapsed):
+        """
+        로케이터 탐색에 걸린 시간 기록
+
+        Args:
+            locator (tuple): (By, value) 형태의 로케이터
+            elapsed (float): 탐색에 걸린 시간 (초)
+        """
+        key = (self.page_key, tuple(locator))
+        with self._lock:
+            self._learned[key] = max(self._learned.get(key, 0.0), elapsed)
+
+    def budget(self, locator, timeout):
+        """
+        부정 확인에 사용할 대기 시간
+
+        이전에 찾은 적이 있는 로케이터는 관측된 최대 시간의 몇 배까지만 기다립니다.
+        찾은 적이 없으면 요청한 timeout을 그대로 사용합니다.
+
+        Args:
+            locator (tuple): (By, value) 형태의 로케이터
+            timeout (float): 요청한 대기 시간 (초)
+
+        Returns:
+            float: 실제로 사용할 대기 시간 (초)
+        """
+        learned = self._learned.get((self.page_key, tuple(locator)))
+        if learned is None:
+            return timeout
+        return min(timeout, max(TestConfig.WAIT_BUDGET_MIN, learned * TestConfig.WAIT_BUDGET_FACTOR))
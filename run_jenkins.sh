@@ -105,7 +105,7 @@ setup_environment() {
     export DISPLAY=":99"
     
     # Chrome 옵션 설정
-    export CHROME_OPTIONS="--headless,--no-sandbox,--disable-dev-shm-usage,--disable-gpu,--disable-extensions,--disable-plugins,--disable-images,--disable-javascript,--disable-background-timer-throttling,--disable-backgrounding-occluded-windows,--disable-renderer-backgrounding,--disable-features=TranslateUI,--disable-ipc-flooding-protection"
+    export CHROME_OPTIONS="--headless,--no-sandbox,--disable-dev-shm-usage,--disable-gpu,--disable-extensions,--disable-plugins,--disable-background-timer-throttling,--disable-backgrounding-occluded-windows,--disable-renderer-backgrounding,--disable-features=TranslateUI,--disable-ipc-flooding-protection"
     
     # 디렉토리 생성
     mkdir -p reports/screenshots
@@ -20,7 +20,8 @@ def install_requirements():
     return True
 
 
-def run_tests(test_path=None, browser=None, headless=False):
+def run_tests(test_path=None, browser=None, headless=False, reuse_driver=False, workers=1, replay=None,
+              shard=None, order=None, fail_fast=0):
     """테스트 실행"""
     print("🚀 테스트를 실행합니다...")
     
@@ -30,6 +31,37 @@ def run_tests(test_path=None, browser=None, headless=False):
         env['BROWSER'] = browser
     if headless:
         env['HEADLESS'] = 'true'
+    if reuse_driver:
+        env['DRIVER_REUSE'] = 'true'
+    if replay:
+        # record: 실제 응답을 아카이브에 저장, replay: 아카이브 응답만 사용 (네트워크 없음)
+        env['REPLAY_MODE'] = replay
+    if order:
+        env['TEST_ORDER'] = order
+    if fail_fast:
+        # 최근 실패한 테스트가 먼저 실행되므로 깨진 배포는 몇 초 안에 중단됨
+        env['FAIL_FAST'] = str(fail_fast)
+    
+    # 샤드 실행 (CI 노드/컨테이너별로 전체 테스트의 일부만 실행, 결과는 --merge-shards로 병합)
+    if shard:
+        from utils.shard_runner import run_shard
+        if not run_shard(test_path or "tests/", *shard, env):
+            print("❌ 테스트 실행 실패")
+            return False
+        print("✅ 테스트 실행 완료")
+        print(f"📊 샤드 결과: reports/shards/s{shard[0]}/")
+        return True
+    
+    # 병렬 실행 (워커별 브라우저 재사용)
+    if workers > 1:
+        from utils.parallel_runner import run_parallel
+        print(f"🧵 {workers}개 워커로 병렬 실행합니다")
+        if not run_parallel(test_path or "tests/", workers, env):
+            print("❌ 테스트 실행 실패")
+            return False
+        print("✅ 테스트 실행 완료")
+        print("📊 리포트: reports/report.html")
+        return True
     
     # pytest 명령어 구성
     cmd = [sys.executable, "-m", "pytest"]
@@ -39,11 +71,8 @@ def run_tests(test_path=None, browser=None, headless=False):
     else:
         cmd.append("tests/")
     
-    cmd.extend([
-        "-v",
-        "--html=reports/report.html",
-        "--self-contained-html"
-    ])
+    # HTML 리포트는 conftest가 결과 스트림(reports/results.jsonl)으로 생성
+    cmd.append("-v")
     
     try:
         subprocess.run(cmd, env=env, check=True)
@@ -56,6 +85,39 @@ def run_tests(test_path=None, browser=None, headless=False):
     return True
 
 
+def run_benchmark(browser=None, headless=False, options=None):
+    """페이지 로드 벤치마크 실행 (기준선 대비 p95 저하 시 실패)"""
+    print("⏱️ 페이지 로드 벤치마크를 실행합니다...")
+    
+    env = os.environ.copy()
+    if browser:
+        env['BROWSER'] = browser
+    if headless:
+        env['HEADLESS'] = 'true'
+    
+    cmd = [sys.executable, "-m", "benchmarks.page_load", *(options or [])]
+    result = subprocess.run(cmd, env=env)
+    if result.returncode != 0:
+        print("❌ 벤치마크 실패 (성능 저하 또는 실행 오류)")
+        return False
+    print("✅ 벤치마크 완료")
+    return True
+
+
+def run_daemon(headless=False, options=None):
+    """상주 브라우저 데몬 실행 (Ctrl+C까지 대기, 이후 pytest 실행은 미리 실행된 Chrome 세션을 대여)"""
+    env = os.environ.copy()
+    if headless:
+        env['HEADLESS'] = 'true'
+    
+    cmd = [sys.executable, "-m", "utils.browser_daemon", *(options or [])]
+    try:
+        result = subprocess.run(cmd, env=env)
+    except KeyboardInterrupt:
+        return True
+    return result.returncode == 0
+
+
 def main():
     """메인 함수"""
     print("🎯 Selenium 테스트 프로젝트")
@@ -65,6 +127,18 @@ def main():
     test_path = None
     browser = None
     headless = False
+    reuse_driver = False
+    workers = 1
+    benchmark = False
+    benchmark_options = []
+    replay = None
+    shard = None
+    merge_shards = False
+    merge_total = None
+    order = None
+    fail_fast = 0
+    daemon = None
+    daemon_options = []
     
     if len(sys.argv) > 1:
         for arg in sys.argv[1:]:
@@ -72,9 +146,54 @@ def main():
                 browser = arg.split("=")[1]
             elif arg.startswith("--headless"):
                 headless = True
+            elif arg == "--reuse-driver":
+                reuse_driver = True
+            elif arg.startswith("--workers="):
+                workers = int(arg.split("=")[1])
+            elif arg.startswith("--shard="):
+                from utils.shard_runner import parse_shard
+                shard = parse_shard(arg.split("=")[1])
+            elif arg == "--merge-shards":
+                merge_shards = True
+            elif arg.startswith("--merge-shards="):
+                merge_shards = True
+                merge_total = int(arg.split("=")[1])
+            elif arg == "--no-reorder":
+                order = "none"
+            elif arg == "--fail-fast":
+                fail_fast = 1
+            elif arg.startswith("--fail-fast="):
+                fail_fast = int(arg.split("=")[1])
+            elif arg == "--record":
+                replay = "record"
+            elif arg == "--replay":
+                replay = "replay"
+            elif arg == "--daemon":
+                daemon = "start"
+            elif arg == "--daemon-stop":
+                daemon = "stop"
+            elif arg.startswith("--daemon-size="):
+                daemon_options.append(arg)
+            elif arg == "--benchmark":
+                benchmark = True
+            elif arg.split("=")[0] in ("--repeats", "--warmup", "--threshold", "--scenario",
+                                        "--url", "--update-baseline"):
+                benchmark_options.append(arg)
             elif not arg.startswith("--"):
                 test_path = arg
     
+    # 샤드 결과 병합 (테스트 실행/패키지 설치 없음)
+    if merge_shards:
+        from utils.shard_runner import merge_shards as merge
+        if not merge(total=merge_total):
+            return 1
+        print("📊 리포트: reports/report.html")
+        return 0
+    
+    # 브라우저 데몬 종료 (패키지 설치 없음)
+    if daemon == "stop":
+        return 0 if run_daemon(options=["--stop"]) else 1
+    
     # requirements.txt가 있는지 확인
     if not Path("requirements.txt").exists():
         print("❌ requirements.txt 파일을 찾을 수 없습니다.")
@@ -84,8 +203,22 @@ def main():
     if not install_requirements():
         return 1
     
+    # 상주 브라우저 데몬 (Chrome 전용)
+    if daemon == "start":
+        if browser and browser != "chrome":
+            print(f"❌ 브라우저 데몬은 chrome만 지원합니다: {browser}")
+            return 1
+        return 0 if run_daemon(headless, daemon_options) else 1
+    
+    # 벤치마크 실행
+    if benchmark:
+        if not run_benchmark(browser, headless, benchmark_options):
+            return 1
+        print("🎉 모든 작업이 완료되었습니다!")
+        return 0
+    
     # 테스트 실행
-    if not run_tests(test_path, browser, headless):
+    if not run_tests(test_path, browser, headless, reuse_driver, workers, replay, shard, order, fail_fast):
         return 1
     
     print("🎉 모든 작업이 완료되었습니다!")
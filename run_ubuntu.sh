@@ -160,7 +160,7 @@ setup_environment() {
     export BROWSER=chrome
     
     # 메모리 최적화 설정
-    export CHROME_OPTIONS="--no-sandbox --disable-dev-shm-usage --disable-gpu --disable-extensions --disable-plugins --disable-images --disable-javascript"
+    export CHROME_OPTIONS="--no-sandbox --disable-dev-shm-usage --disable-gpu --disable-extensions --disable-plugins"
     
     # Jenkins 환경 특별 설정
     if [[ "$JENKINS_MODE" == "true" ]]; then
@@ -180,6 +180,7 @@ run_tests() {
     TEST_PATH="tests/"
     BROWSER="chrome"
     HEADLESS=true
+    WORKERS=1
     
     while [[ $# -gt 0 ]]; do
         case $1 in
@@ -195,6 +196,10 @@ run_tests() {
                 TEST_PATH="${1#*=}"
                 shift
                 ;;
+            --workers=*)
+                WORKERS="${1#*=}"
+                shift
+                ;;
             *)
                 TEST_PATH="$1"
                 shift
@@ -215,20 +220,24 @@ run_tests() {
     fi
     
     # 테스트 실행
-    if [[ "$JENKINS_MODE" == "true" ]]; then
+    if [[ "$WORKERS" -gt 1 ]]; then
+        # 병렬 실행 (워커별 브라우저 재사용, 리포트 병합)
+        log_info "병렬 실행: 워커 ${WORKERS}개"
+        if [[ "$JENKINS_MODE" == "true" ]]; then
+            python3 -m utils.parallel_runner $TEST_PATH --workers=$WORKERS
+        else
+            python -m utils.parallel_runner $TEST_PATH --workers=$WORKERS
+        fi
+    elif [[ "$JENKINS_MODE" == "true" ]]; then
         # Jenkins 환경에서는 python3 직접 사용
         python3 -m pytest $TEST_PATH \
             -v \
-            --html=reports/report.html \
-            --self-contained-html \
             --tb=short \
             --disable-warnings
     else
         # 일반 환경에서는 가상환경의 python 사용
         python -m pytest $TEST_PATH \
             -v \
-            --html=reports/report.html \
-            --self-contained-html \
             --tb=short \
             --disable-warnings
     fi
@@ -252,7 +261,7 @@ cleanup() {
     fi
     
     # 오래된 스크린샷 정리 (7일 이상)
-    find reports/screenshots -name "*.png" -mtime +7 -delete 2>/dev/null || true
+    find reports/screenshots \( -name "*.png" -o -name "*.webp" -o -name "*.jpg" \) -mtime +7 -delete 2>/dev/null || true
     
     # 오래된 로그 정리 (30일 이상)
     find . -name "*.log" -mtime +30 -delete 2>/dev/null || true
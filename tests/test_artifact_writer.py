@@ -0,0 +1,82 @@
+"""
+ArtifactWriter / 실패 아티팩트 기록 단위 테스트 (브라우저 불필요)
+"""
+import base64
+import os
+import threading
+import time
+from config.config import TestConfig
+from utils.artifact_writer import ArtifactWriter
+from utils.driver_factory import DriverFactory
+
+
+class FakeDriver:
+    """스크린샷과 스크립트 호출 횟수를 기록하는 가짜 드라이버"""
+
+    def __init__(self):
+        self.calls = []
+
+    def get_screenshot_as_base64(self):
+        self.calls.append('screenshot')
+        return base64.b64encode(b'png-bytes').decode('ascii')
+
+    def execute_script(self, script, *args):
+        self.calls.append('script')
+        return ['https://example.com/', 'Example']
+
+
+class TestArtifactWriter:
+    """ArtifactWriter 테스트"""
+
+    def test_flush_waits_for_pending_jobs(self):
+        writer = ArtifactWriter(workers=2, max_pending=4)
+        done = []
+        for i in range(4):
+            writer.submit(lambda n=i: (time.sleep(0.05), done.append(n)))
+        assert writer.flush(timeout=5) == 0
+        assert sorted(done) == [0, 1, 2, 3]
+        writer.shutdown()
+
+    def test_submit_blocks_when_queue_is_full(self):
+        writer = ArtifactWriter(workers=1, max_pending=1)
+        gate = threading.Event()
+        writer.submit(gate.wait)
+
+        submitted = threading.Event()
+        threading.Thread(target=lambda: (writer.submit(lambda: None), submitted.set())).start()
+        assert not submitted.wait(0.2)
+
+        gate.set()
+        assert submitted.wait(5)
+        writer.shutdown(timeout=5)
+
+    def test_failed_job_does_not_break_writer(self):
+        writer = ArtifactWriter(workers=1, max_pending=2)
+        writer.submit(lambda: 1 / 0)
+        writer.submit(lambda: None)
+        assert writer.flush(timeout=5) == 0
+        writer.shutdown()
+
+
+class TestFailureArtifacts:
+    """capture_failure / write_failure_artifacts 테스트"""
+
+    def test_capture_uses_one_screenshot_and_one_script(self):
+        driver = FakeDriver()
+        payload = DriverFactory.capture_failure(driver, 'test_mod.test_case', 'boom')
+        assert driver.calls == ['screenshot', 'script']
+        assert payload['url'] == 'https://example.com/'
+        assert payload['title'] == 'Example'
+
+    def test_write_stores_screenshot_and_index_entry(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(TestConfig, 'SCREENSHOT_DIR', str(tmp_path))
+        payload = DriverFactory.capture_failure(FakeDriver(), 'test_mod.test_case', 'boom')
+
+        filepath = DriverFactory.write_failure_artifacts(payload)
+
+        with open(filepath, 'rb') as f:
+            assert f.read() == b'png-bytes'
+        assert os.path.dirname(filepath) == str(tmp_path)
+        entry, = DriverFactory.get_screenshot_store().entries('test_mod.test_case')
+        assert entry['url'] == 'https://example.com/'
+        assert entry['error'] == 'boom'
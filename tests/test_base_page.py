@@ -0,0 +1,176 @@
+"""
+BasePage 헬퍼 테스트
+execute_script 결과를 흉내내는 가짜 드라이버로 WebDriver 호출 횟수를 확인합니다.
+"""
+import pytest
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+from pages.base_page import BasePage
+from pages.locator_js import FIND_FIRST_JS
+
+
+class ScriptDriver:
+    """execute_script 호출을 기록하고 미리 정한 응답을 돌려주는 가짜 드라이버"""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.scripts = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def execute_script(self, script, *args):
+        self.scripts.append((script, args))
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+
+def test_find_first_checks_all_locators_in_one_call():
+    """폴링 한 번에 모든 로케이터를 execute_script 한 번으로 확인하는지 확인"""
+    element = object()
+    driver = ScriptDriver([None, None, [2, element]])
+    locators = [(By.ID, "search"), (By.ID, "rso"), (By.CLASS_NAME, "g")]
+
+    locator, found = BasePage(driver).find_first(locators, timeout=5)
+
+    assert (locator, found) == ((By.CLASS_NAME, "g"), element)
+    assert len(driver.scripts) == 3
+    assert driver.scripts[0] == (FIND_FIRST_JS, ([["id", "search"], ["id", "rso"], ["class name", "g"]],))
+
+
+def test_first_present_shares_one_timeout():
+    """여러 로케이터가 하나의 대기 시간을 공유하고 None을 반환하는지 확인"""
+    driver = ScriptDriver([None])
+    page = BasePage(driver)
+
+    assert page.first_present([(By.ID, "a"), (By.ID, "b")], timeout=0.2) is None
+    with pytest.raises(TimeoutException):
+        page.find_first([(By.ID, "a")], timeout=0.1)
+
+
+class CountingElement(WebElement):
+    """stale 여부를 지정할 수 있는 가짜 요소"""
+
+    def __init__(self, stale=False):
+        self.stale = stale
+        self.clicks = 0
+        self.sent = []
+
+    def _check(self):
+        if self.stale:
+            raise StaleElementReferenceException("stale")
+
+    @property
+    def text(self):
+        self._check()
+        return "결과"
+
+    def is_displayed(self):
+        self._check()
+        return True
+
+    def is_enabled(self):
+        self._check()
+        return True
+
+    def click(self):
+        self._check()
+        self.clicks += 1
+
+    def clear(self):
+        self._check()
+
+    def send_keys(self, text):
+        self._check()
+        self.sent.append(text)
+
+
+class FindDriver:
+    """find_element 호출 횟수를 세는 가짜 드라이버"""
+
+    def __init__(self, elements):
+        self.elements = list(elements)
+        self.find_calls = 0
+        self.navigations = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        return self.elements.pop(0) if len(self.elements) > 1 else self.elements[0]
+
+    def get(self, url):
+        self.navigations.append(url)
+
+    def refresh(self):
+        self.navigations.append("refresh")
+
+
+def test_element_cache_avoids_repeated_lookups():
+    """같은 로케이터는 한 번만 찾고, 페이지 이동 시 캐시가 비워지는지 확인"""
+    driver = FindDriver([CountingElement()])
+    page = BasePage(driver)
+    search_box = (By.NAME, "q")
+
+    page.input_text(search_box, "Selenium")
+    page.click_element(search_box)
+    assert page.get_text(search_box) == "결과"
+    assert driver.find_calls == 1
+
+    page.refresh_page()
+    page.get_text(search_box)
+    assert driver.find_calls == 2
+
+    page.navigate_to("https://example.com")
+    page.get_text(search_box)
+    assert driver.find_calls == 3
+
+
+def test_stale_element_is_found_again():
+    """캐시된 요소가 stale이면 다시 찾아 재시도하는지 확인"""
+    stale, fresh = CountingElement(), CountingElement()
+    driver = FindDriver([stale, fresh])
+    page = BasePage(driver)
+    button = (By.ID, "submit")
+
+    page.find_element(button)
+    stale.stale = True
+    page.click_element(button, timeout=1)
+
+    assert fresh.clicks == 1
+    assert driver.find_calls == 2
+
+
+def test_find_element_is_not_served_stale_from_cache():
+    """DOM이 바뀐 뒤 find_element를 직접 호출하면 캐시된 stale 요소 대신 새 요소를 반환하는지 확인"""
+    old, new = CountingElement(), CountingElement()
+    driver = FindDriver([old, new])
+    page = BasePage(driver)
+    button = (By.ID, "submit")
+
+    page.click_element(button)
+    old.stale = True
+
+    element = page.find_element(button)
+    assert element is new
+    element.click()
+    assert new.clicks == 1
+
+
+def test_snapshot_reads_many_locators_in_one_call():
+    """여러 로케이터를 한 번의 execute_script로 읽고 이름별로 반환하는지 확인"""
+    rows = [{"text": f"결과 {i}", "href": f"/item/{i}"} for i in range(50)]
+    driver = ScriptDriver([[rows, {"text": "50건"}]])
+    page = BasePage(driver)
+
+    snapshot = page.snapshot(
+        {"rows": (By.CSS_SELECTOR, ".result"), "count": (By.ID, "count")},
+        fields=["text", "attr:href"],
+        all_matches=True,
+    )
+
+    assert len(driver.scripts) == 1
+    assert driver.scripts[0][1][1:] == (["text", "attr:href"], True)
+    assert snapshot["rows"][49] == {"text": "결과 49", "href": "/item/49"}
+    assert snapshot["count"] == {"text": "50건"}
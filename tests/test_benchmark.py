@@ -0,0 +1,138 @@
+"""
+벤치마크 통계/기준선 비교 및 픽스처 서버 테스트 (브라우저 불필요)
+"""
+import urllib.request
+from benchmarks.page_load import SITE_DIR, page_metrics
+from utils.benchmark import (
+    BenchmarkRunner,
+    compare_to_baseline,
+    load_baseline,
+    percentile,
+    summarize,
+    trim_outliers,
+    write_benchmark_json,
+)
+from utils.fixture_server import FixtureServer
+
+
+def test_percentile_interpolates():
+    values = [10, 20, 30, 40, 50]
+    assert percentile(values, 50) == 30
+    assert percentile(values, 95) == 48
+    assert percentile([], 50) is None
+
+
+def test_outliers_are_trimmed_before_percentiles():
+    values = [100, 101, 99, 102, 98, 100, 5000]
+    assert 5000 not in trim_outliers(values)
+    summary = summarize(values)
+    assert summary["trimmed"] == 1
+    assert summary["p95"] < 200
+
+
+def test_runner_skips_warmup_iterations():
+    calls = []
+
+    def scenario():
+        calls.append(len(calls))
+        return {"load": 1000.0 if len(calls) == 1 else 10.0}
+
+    runner = BenchmarkRunner(repeats=5, warmup=2, trim_factor=0)
+    runner.measure("home", scenario)
+
+    assert len(calls) == 7
+    assert runner.samples["home"]["load"] == [10.0] * 5
+    assert runner.results()["home"]["duration"]["count"] == 5
+
+
+def test_regression_detected_past_threshold(tmp_path):
+    baseline = {"home": {"load": {"p95": 100.0}, "duration": {"p95": 200.0}}}
+    results = {"home": {"load": {"p95": 125.0}, "duration": {"p95": 210.0}, "lcp": {"p95": 50.0}}}
+
+    regressions = compare_to_baseline(results, baseline, threshold=0.2)
+    assert [(r["scenario"], r["metric"]) for r in regressions] == [("home", "load")]
+
+    path = str(tmp_path / "baseline.json")
+    write_benchmark_json(path, results, target="fixture-site")
+    stored = load_baseline(path)
+    assert stored["results"] == results
+    assert stored["meta"]["target"] == "fixture-site"
+    assert load_baseline(str(tmp_path / "missing.json")) is None
+
+
+def test_regression_needs_minimum_absolute_delta():
+    baseline = {"find": {"per_call_us": {"p95": 1.0}}, "wait": {"per_call_us": {"p95": 10.0}}}
+    results = {"find": {"per_call_us": {"p95": 1.8}}, "wait": {"per_call_us": {"p95": 16.0}}}
+
+    regressions = compare_to_baseline(results, baseline, threshold=0.5, min_delta=2.0)
+    assert [r["scenario"] for r in regressions] == ["wait"]
+
+
+def test_framework_benchmark_remeasures_suspected_regressions(tmp_path, monkeypatch):
+    import benchmarks.framework as framework
+
+    baseline = str(tmp_path / "baseline.json")
+    output = str(tmp_path / "result.json")
+    assert framework.run_framework_benchmark(repeats=2, warmup=0, calls=3, scenarios=["find_first"],
+                                             update_baseline=True, baseline_path=baseline, output_path=output)
+
+    # 첫 측정만 느리고 재측정은 기준선과 같으면 저하로 보지 않음
+    stored = load_baseline(baseline)["results"]["find_first"]
+    slow = {"p95": stored["per_call_us"]["p95"] * 10 + 100}
+    measured = []
+
+    def fake_measure(available, names, repeats, warmup):
+        measured.append(list(names))
+        return {name: {"per_call_us": slow if len(measured) == 1 else stored["per_call_us"]} for name in names}
+
+    monkeypatch.setattr(framework, "_measure", fake_measure)
+    assert framework.run_framework_benchmark(repeats=2, warmup=0, calls=3, scenarios=["find_first"],
+                                             baseline_path=baseline, output_path=output, confirm=2)
+    assert measured == [["find_first"], ["find_first"]]
+
+
+def test_page_metrics_extracts_timings():
+    metrics = {"navigation": {"ttfb": 5.0, "load": 30.0, "dom_content_loaded": None}, "lcp": 20.0}
+    assert page_metrics(metrics) == {"ttfb": 5.0, "load": 30.0, "lcp": 20.0}
+    assert page_metrics(None) == {}
+
+
+def test_fixture_server_serves_site():
+    with FixtureServer(SITE_DIR) as server:
+        with urllib.request.urlopen(server.url("form.html"), timeout=5) as response:
+            assert response.status == 200
+            assert 'id="query"' in response.read().decode("utf-8")
+
+
+def test_scenario_reported_duration_replaces_wall_time():
+    runner = BenchmarkRunner(repeats=3, warmup=0, trim_factor=0)
+    runner.measure("home", lambda: {"duration": 12.5, "load": 30.0})
+
+    assert runner.samples["home"]["duration"] == [12.5] * 3
+    assert runner.samples["home"]["load"] == [30.0] * 3
+
+
+def test_framework_benchmark_runs_without_browser(tmp_path, monkeypatch):
+    from benchmarks.framework import fake_browser, run_framework_benchmark
+    from config.config import TestConfig
+    from utils.driver_factory import DriverFactory
+
+    # 데몬/재생/미리 실행 설정이 켜져 있어도 가짜 드라이버로만 측정
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON", "auto")
+    monkeypatch.setattr(TestConfig, "REPLAY_MODE", "replay")
+    monkeypatch.setattr(TestConfig, "DRIVER_PREWARM", 2)
+    launch = DriverFactory.__dict__["_launch"]
+    with fake_browser():
+        assert (TestConfig.BROWSER_DAEMON, TestConfig.REPLAY_MODE, TestConfig.DRIVER_PREWARM) == ("off", "", 0)
+    baseline = str(tmp_path / "baseline.json")
+    output = str(tmp_path / "result.json")
+
+    # 기준선은 --update-baseline일 때만 저장됨
+    assert run_framework_benchmark(repeats=2, warmup=0, calls=3, baseline_path=baseline, output_path=output)
+    assert load_baseline(baseline) is None
+    assert run_framework_benchmark(repeats=2, warmup=0, calls=3, update_baseline=True,
+                                   baseline_path=baseline, output_path=output)
+    assert load_baseline(baseline)["meta"]["target"].startswith("fake-webdriver/calls=3@")
+    assert set(load_baseline(output)["results"]) >= {"click_element", "driver_fixture_pooled", "chrome_options"}
+    assert DriverFactory.__dict__["_launch"] is launch
+    assert (TestConfig.BROWSER_DAEMON, TestConfig.REPLAY_MODE, TestConfig.DRIVER_PREWARM) == ("auto", "replay", 2)
@@ -0,0 +1,56 @@
+"""
+CDP 브라우저 컨텍스트 격리 테스트
+가짜 드라이버로 CDP 명령 순서를 확인합니다.
+"""
+from utils.browser_context import BrowserContext
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+
+
+class FakeCdpDriver:
+    """execute_cdp_cmd만 흉내내는 가짜 Chrome 드라이버"""
+
+    def __init__(self):
+        self.current_window_handle = 'host'
+        self.window_handles = ['host']
+        self.commands = []
+        self.switch_to = _FakeSwitchTo(self)
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.commands.append((cmd, params, self.current_window_handle))
+        if cmd == 'Target.createBrowserContext':
+            return {'browserContextId': 'ctx-1'}
+        if cmd == 'Target.createTarget':
+            self.window_handles.append('target-1')
+            return {'targetId': 'target-1'}
+        if cmd == 'Target.disposeBrowserContext':
+            self.window_handles.remove('target-1')
+        return {}
+
+
+def test_open_switches_to_new_context_target():
+    """새 컨텍스트의 탭으로 전환되는지 확인"""
+    driver = FakeCdpDriver()
+    context = BrowserContext.open(driver, window_size=(1280, 720))
+
+    assert driver.current_window_handle == 'target-1'
+    create_target = driver.commands[1]
+    assert create_target[0] == 'Target.createTarget'
+    assert create_target[1] == {'url': 'about:blank', 'browserContextId': 'ctx-1',
+                                'width': 1280, 'height': 720}
+    assert context.host_handle == 'host'
+
+
+def test_close_disposes_context_from_host_tab():
+    """호스트 탭으로 돌아간 뒤 컨텍스트를 폐기하는지 확인"""
+    driver = FakeCdpDriver()
+    BrowserContext.open(driver).close()
+
+    assert driver.commands[-1] == ('Target.disposeBrowserContext', {'browserContextId': 'ctx-1'}, 'host')
+    assert driver.window_handles == ['host']
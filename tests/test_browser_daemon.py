@@ -0,0 +1,126 @@
+"""
+상주 브라우저 데몬 테스트 (실제 브라우저 대신 가짜 드라이버 사용)
+"""
+import itertools
+import os
+import stat
+import time
+from types import SimpleNamespace
+import pytest
+from config.config import TestConfig
+from utils import browser_daemon
+from utils.browser_daemon import AttachedDriver, BrowserDaemon, attach, request
+from utils.driver_factory import DriverFactory
+
+
+class FakeDriver:
+    """chromedriver 세션 흉내 (window_handles 접근 실패 = 죽은 세션)"""
+
+    ids = itertools.count(1)
+
+    def __init__(self):
+        self.session_id = f"session-{next(self.ids)}"
+        self.command_executor = SimpleNamespace(_url="http://127.0.0.1:9515")
+        self.capabilities = {"browserName": "chrome"}
+        self.alive = True
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return ["main"]
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    resets = []
+    server = BrowserDaemon(str(tmp_path / "daemon.sock"), size=1, create=FakeDriver,
+                           reset=resets.append, destroy=lambda driver: None,
+                           config=DriverFactory.daemon_config()).start()
+    server.resets = resets
+    yield server
+    server.stop()
+
+
+def test_lease_attaches_to_existing_session_and_returns_on_quit(daemon):
+    driver = attach(daemon.socket_path, daemon.config)
+
+    assert isinstance(driver, AttachedDriver)
+    assert driver.session_id == daemon._slots[0]['driver'].session_id
+    assert driver.caps == {"browserName": "chrome"}
+    assert daemon.status() == {"size": 1, "idle": 0}
+    # 유휴 세션이 없으면 대여 실패 (호출자는 새 브라우저 실행)
+    assert attach(daemon.socket_path, daemon.config) is None
+
+    driver.quit()
+    wait_for(lambda: daemon.status()["idle"] == 1)
+    assert daemon.resets == [daemon._slots[0]['driver']]
+
+
+def test_dead_session_is_replaced_on_acquire(daemon):
+    dead = daemon._slots[0]['driver']
+    dead.alive = False
+
+    driver = attach(daemon.socket_path, daemon.config)
+
+    assert driver.session_id != dead.session_id
+    driver.quit()
+
+
+def test_status_and_shutdown_over_socket(daemon):
+    response, sock = request(daemon.socket_path, {"cmd": "status"})
+    sock.close()
+    assert response == {"ok": True, "size": 1, "idle": 1, "config": daemon.config}
+
+    request(daemon.socket_path, {"cmd": "shutdown"})[1].close()
+    wait_for(lambda: daemon._stopped.is_set())
+    assert attach(daemon.socket_path, daemon.config) is None
+
+
+def test_get_driver_uses_daemon_when_running(daemon, monkeypatch):
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON_SOCKET", daemon.socket_path)
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON", "auto")
+    monkeypatch.setattr(TestConfig, "REPLAY_MODE", "")
+
+    driver = DriverFactory.get_driver("chrome")
+    assert isinstance(driver, AttachedDriver)
+    DriverFactory.quit_driver(driver)
+    wait_for(lambda: daemon.status()["idle"] == 1)
+
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON", "off")
+    assert DriverFactory.attach_daemon_driver() is None
+
+
+def test_socket_is_private_to_owner(daemon):
+    assert stat.S_IMODE(os.stat(daemon.socket_path).st_mode) == 0o600
+    assert browser_daemon.is_own_socket(daemon.socket_path)
+
+
+def test_session_with_different_config_is_not_leased(daemon, monkeypatch):
+    requested = dict(daemon.config, headless=not daemon.config["headless"])
+
+    assert attach(daemon.socket_path, requested) is None
+    assert daemon.status()["idle"] == 1
+
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON_SOCKET", daemon.socket_path)
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON", "auto")
+    monkeypatch.setattr(TestConfig, "REPLAY_MODE", "")
+    assert DriverFactory.attach_daemon_driver(headless=requested["headless"]) is None
+    driver = DriverFactory.attach_daemon_driver(headless=daemon.config["headless"])
+    assert isinstance(driver, AttachedDriver)
+    driver.quit()
+
+
+def test_second_daemon_on_same_socket_is_refused(daemon):
+    with pytest.raises(RuntimeError):
+        BrowserDaemon(daemon.socket_path, create=FakeDriver, reset=print, destroy=print).start()
+    driver = browser_daemon.attach(daemon.socket_path, daemon.config)
+    assert driver is not None
+    driver.quit()
@@ -0,0 +1,174 @@
+"""
+DriverPool 테스트
+실제 브라우저 없이 가짜 드라이버로 풀 동작을 확인합니다.
+"""
+import time
+import pytest
+from utils.driver_pool import DriverPool
+from utils.driver_factory import DriverFactory
+
+
+class _FakeSwitchTo:
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        self._driver.current_handle = handle
+
+    def default_content(self):
+        pass
+
+
+class FakeDriver:
+    """WebDriver 흉내를 내는 가짜 드라이버"""
+
+    def __init__(self):
+        self.alive = True
+        self.current_url = 'https://example.com'
+        self.cookies_cleared = 0
+        self.window_size = None
+        self.handles = ['main']
+        self.current_handle = 'main'
+        self.switch_to = _FakeSwitchTo(self)
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise RuntimeError("session deleted")
+        return list(self.handles)
+
+    def close(self):
+        self.handles.remove(self.current_handle)
+
+    def execute_script(self, script, *args):
+        return None
+
+    def delete_all_cookies(self):
+        self.cookies_cleared += 1
+
+    def get(self, url):
+        self.current_url = url
+
+    def set_window_size(self, width, height):
+        self.window_size = (width, height)
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def set_page_load_timeout(self, seconds):
+        self.page_load_timeout = seconds
+
+
+def _make_pool(**kwargs):
+    created, destroyed = [], []
+
+    def create():
+        driver = FakeDriver()
+        created.append(driver)
+        return driver
+
+    pool = DriverPool(create=create, destroy=destroyed.append, **kwargs)
+    return pool, created, destroyed
+
+
+def test_checkin_reuses_driver_and_resets_state():
+    """반납된 드라이버가 초기화되어 재사용되는지 확인"""
+    pool, created, _ = _make_pool(max_size=2, window_size=(1280, 720))
+
+    driver = pool.checkout()
+    driver.handles.append('popup')
+    pool.checkin(driver)
+
+    assert driver.current_url == 'about:blank'
+    assert driver.cookies_cleared == 1
+    assert driver.window_size == (1280, 720)
+    assert driver.window_handles == ['main']
+
+    for _ in range(5):
+        pool.checkin(pool.checkout())
+
+    assert len(created) == 1
+    assert pool.stats['reused'] == 5
+
+
+def test_checkin_keeps_implicit_wait_off():
+    """반납 시 드라이버 설정을 복원해도 implicit wait은 0으로 유지되는지 확인"""
+    pool = DriverPool(create=FakeDriver, destroy=lambda driver: None,
+                      configure=DriverFactory._configure_driver)
+
+    driver = pool.checkout()
+    driver.implicitly_wait(30)
+    pool.checkin(driver)
+
+    assert driver.implicit_wait == 0
+
+
+def test_unhealthy_driver_is_replaced():
+    """세션이 죽은 드라이버는 폐기 후 새로 생성되는지 확인"""
+    pool, created, destroyed = _make_pool(max_size=1)
+
+    driver = pool.checkout()
+    pool.checkin(driver)
+    driver.alive = False
+
+    replacement = pool.checkout()
+    assert replacement is not driver
+    assert destroyed == [driver]
+    assert len(created) == 2
+
+
+def test_driver_checked_in_after_close_is_quit():
+    """풀을 닫은 뒤 반납되거나 다른 풀에 반납된 드라이버가 종료되는지 확인"""
+    pool, _, destroyed = _make_pool(max_size=2)
+    first, second = pool.checkout(), pool.checkout()
+
+    pool.close_all()
+    pool.checkin(first)
+    assert destroyed == [first]
+    assert pool.size == 1
+
+    other, _, other_destroyed = _make_pool()
+    other.checkin(second)
+    assert other_destroyed == [second]
+    assert other.size == 0
+
+
+def test_idle_driver_is_evicted():
+    """idle_timeout이 지난 드라이버가 종료되는지 확인"""
+    pool, _, destroyed = _make_pool(max_size=1, idle_timeout=0.01)
+
+    driver = pool.checkout()
+    pool.checkin(driver)
+    time.sleep(0.05)
+
+    assert pool.checkout() is not driver
+    assert destroyed == [driver]
+
+
+def test_eviction_quits_outside_lock_and_wakes_waiters():
+    """만료된 드라이버 종료 중에도 다른 스레드가 풀을 사용할 수 있는지 확인"""
+    lock_free = []
+
+    def slow_destroy(driver):
+        lock_free.append(pool._lock.acquire(blocking=False))
+        if lock_free[-1]:
+            pool._lock.release()
+        time.sleep(0.05)
+
+    pool = DriverPool(create=FakeDriver, destroy=slow_destroy, max_size=1, idle_timeout=0.01)
+    driver = pool.checkout()
+    pool.checkin(driver)
+    time.sleep(0.05)
+
+    assert pool.checkout(timeout=1) is not driver
+    assert lock_free == [True]
+    assert pool.stats['evicted'] == 1 and pool.size == 1
+
+
+def test_checkout_times_out_when_pool_is_full():
+    """풀이 가득 찼을 때 대기 시간 초과 확인"""
+    pool, _, _ = _make_pool(max_size=1)
+    pool.checkout()
+
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.05)
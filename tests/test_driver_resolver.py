@@ -0,0 +1,68 @@
+"""
+드라이버 실행 파일 resolver 테스트
+네트워크 없이 미리 채워둔 캐시만으로 동작하는지 확인합니다.
+"""
+import os
+import pytest
+from utils.driver_resolver import DriverResolver
+
+
+def _seed(cache_dir, browser, major, name):
+    directory = cache_dir / browser / major
+    directory.mkdir(parents=True)
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    os.chmod(path, 0o755)
+    return str(path)
+
+
+def test_offline_resolve_uses_matching_major(tmp_path):
+    """브라우저 메이저 버전에 맞는 캐시 드라이버를 사용하는지 확인"""
+    _seed(tmp_path, "chrome", "119", "chromedriver")
+    expected = _seed(tmp_path, "chrome", "120", "chromedriver")
+
+    resolver = DriverResolver(str(tmp_path), offline=True)
+    resolver._versions["chrome"] = "120.0.6099.109"
+
+    assert resolver.resolve("chrome") == expected
+
+
+def test_offline_resolve_without_version_picks_latest(tmp_path):
+    """브라우저 버전을 모르면 가장 높은 버전의 캐시를 사용하는지 확인"""
+    _seed(tmp_path, "chrome", "99", "chromedriver")
+    expected = _seed(tmp_path, "chrome", "120", "chromedriver")
+
+    resolver = DriverResolver(str(tmp_path), offline=True)
+    resolver._versions["chrome"] = None
+
+    assert resolver.resolve("chrome") == expected
+
+
+def test_offline_resolve_without_version_reuses_unknown_download(tmp_path):
+    """버전을 모를 때 받아둔 드라이버({browser}/unknown)를 다음 실행에서 재사용하는지 확인"""
+    expected = _seed(tmp_path, "chrome", "unknown", "chromedriver")
+
+    resolver = DriverResolver(str(tmp_path), offline=True)
+    resolver._versions["chrome"] = None
+
+    assert resolver.resolve("chrome") == expected
+
+
+def test_offline_resolve_is_memoized(tmp_path):
+    """한 번 확인한 경로는 캐시가 바뀌어도 재확인하지 않는지 확인"""
+    path = _seed(tmp_path, "firefox", "121", "geckodriver")
+    resolver = DriverResolver(str(tmp_path), offline=True)
+    resolver._versions["firefox"] = "121.0"
+
+    assert resolver.resolve("firefox") == path
+    os.remove(path)
+    assert resolver.resolve("firefox") == path
+
+
+def test_offline_resolve_missing_cache_raises(tmp_path):
+    """오프라인 모드에서 캐시가 없으면 다운로드하지 않고 실패하는지 확인"""
+    resolver = DriverResolver(str(tmp_path), offline=True)
+    resolver._versions["edge"] = "120.0"
+
+    with pytest.raises(FileNotFoundError):
+        resolver.resolve("edge")
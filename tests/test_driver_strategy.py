@@ -0,0 +1,69 @@
+"""
+드라이버 실행 전략 probe 테스트
+"""
+import json
+import os
+import time
+from utils.driver_strategy import DriverStrategyProbe
+
+
+class _OfflineResolver:
+    """캐시가 비어있는 resolver"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def resolve(self, browser):
+        self.calls += 1
+        raise FileNotFoundError(browser)
+
+
+def _driver_binary(tmp_path, name="chromedriver"):
+    path = tmp_path / name
+    path.write_text("#!/bin/sh\n")
+    os.chmod(path, 0o755)
+    return str(path)
+
+
+def test_remembered_strategy_skips_probe(tmp_path):
+    """기억된 전략이 있으면 probe 없이 바로 반환되는지 확인"""
+    resolver = _OfflineResolver()
+    state_file = str(tmp_path / "strategy.json")
+    driver_path = _driver_binary(tmp_path)
+
+    DriverStrategyProbe(resolver, state_file).remember("chrome", "cache", driver_path)
+
+    # 새 프로세스를 흉내내 디스크에서 읽기
+    probe = DriverStrategyProbe(resolver, state_file)
+    assert next(probe.candidates("chrome")) == ("cache", driver_path)
+    assert resolver.calls == 0
+
+
+def test_expired_strategy_is_probed_again(tmp_path):
+    """TTL이 지난 전략은 무시하고 다시 probe하는지 확인"""
+    resolver = _OfflineResolver()
+    state_file = tmp_path / "strategy.json"
+    state_file.write_text(json.dumps({
+        "chrome": {"strategy": "cache", "driver_path": _driver_binary(tmp_path),
+                   "probed_at": time.time() - 7200},
+    }))
+
+    probe = DriverStrategyProbe(resolver, str(state_file), ttl=3600)
+    strategies = [name for name, _ in probe.candidates("chrome")]
+
+    assert "cache" not in strategies
+    assert strategies[-1] == "selenium-manager"
+    assert resolver.calls == 1
+
+
+def test_invalidate_forgets_strategy(tmp_path):
+    """실패한 전략이 메모리와 디스크에서 삭제되는지 확인"""
+    state_file = str(tmp_path / "strategy.json")
+    probe = DriverStrategyProbe(_OfflineResolver(), state_file)
+    probe.remember("edge", "path", _driver_binary(tmp_path, "msedgedriver"))
+
+    probe.invalidate("edge")
+
+    with open(state_file) as f:
+        assert "edge" not in json.load(f)
+    assert probe._load("edge") is None
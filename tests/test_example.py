@@ -13,12 +13,12 @@ class TestGoogleSearch:
     
     def setup_method(self):
         """각 테스트 메서드 실행 전 설정"""
-        self.driver = DriverFactory.get_driver()
+        self.driver = DriverFactory.acquire_driver()
         self.base_page = BasePage(self.driver)
     
     def teardown_method(self):
         """각 테스트 메서드 실행 후 정리"""
-        DriverFactory.quit_driver(self.driver)
+        DriverFactory.release_driver(self.driver)
     
     def test_google_search(self):
         """Google 검색 기능 테스트"""
@@ -47,11 +47,7 @@ class TestGoogleSearch:
             (By.CSS_SELECTOR, "[data-sokoban-container]")
         ]
         
-        results_found = False
-        for selector in possible_selectors:
-            if self.base_page.is_element_present(selector, timeout=5):
-                results_found = True
-                break
+        results_found = self.base_page.first_present(possible_selectors, timeout=5)
         
         assert results_found, "검색 결과를 찾을 수 없습니다"
     
@@ -64,6 +60,7 @@ class TestGoogleSearch:
         title = self.base_page.get_title()
         assert "Google" in title
     
+    @pytest.mark.flaky(reruns=2)
     def test_google_search_suggestions(self):
         """Google 검색 제안 기능 테스트"""
         # Google 홈페이지로 이동
@@ -80,6 +77,7 @@ class TestGoogleSearch:
             suggestion_items = self.base_page.find_elements((By.CSS_SELECTOR, ".UUbT9 .sbct"))
             assert len(suggestion_items) > 0
     
+    @pytest.mark.flaky(reruns=2)
     def test_google_lucky_search(self):
         """Google I'm Feeling Lucky 버튼 테스트"""
         # Google 홈페이지로 이동
@@ -103,12 +101,12 @@ class TestBasicNavigation:
     
     def setup_method(self):
         """각 테스트 메서드 실행 전 설정"""
-        self.driver = DriverFactory.get_driver()
+        self.driver = DriverFactory.acquire_driver()
         self.base_page = BasePage(self.driver)
     
     def teardown_method(self):
         """각 테스트 메서드 실행 후 정리"""
-        DriverFactory.quit_driver(self.driver)
+        DriverFactory.release_driver(self.driver)
     
     def test_page_navigation(self):
         """페이지 네비게이션 테스트"""
@@ -0,0 +1,72 @@
+"""
+로컬 픽스처 웹 서버 테스트 (브라우저/네트워크 불필요)
+"""
+import json
+import urllib.error
+import urllib.request
+import pytest
+from utils.fixture_server import FixtureServer
+
+
+def fetch(url, data=None, headers=None):
+    """URL 요청 → (상태 코드, 헤더, 본문 문자열), 오류 상태도 그대로 반환"""
+    request = urllib.request.Request(url, data=data, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, response.headers, response.read().decode("utf-8")
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read().decode("utf-8")
+
+
+def test_static_index_page(fixture_server):
+    status, headers, body = fetch(fixture_server.base_url + "/")
+
+    assert status == 200
+    assert "<title>httpbin" in body and "<pre" in body
+
+
+def test_httpbin_style_endpoints(fixture_server):
+    status, _, body = fetch(fixture_server.url("get?q=%EC%A0%9C%EC%A3%BC"), headers={"X-Test": "1"})
+    data = json.loads(body)
+    assert status == 200
+    assert data["args"] == {"q": "제주"}
+    assert data["headers"]["X-Test"] == "1"
+
+    _, _, body = fetch(fixture_server.url("headers"), headers={"X-Trace": "abc"})
+    assert json.loads(body)["headers"]["X-Trace"] == "abc"
+
+    _, _, body = fetch(fixture_server.url("user-agent"), headers={"User-Agent": "fixture-test"})
+    assert json.loads(body) == {"user-agent": "fixture-test"}
+
+    status, headers, body = fetch(fixture_server.url("html"))
+    assert status == 200 and headers["Content-Type"].startswith("text/html")
+    assert "Moby-Dick" in body
+
+    _, _, body = fetch(fixture_server.url("post"), data=b'{"a": 1}')
+    assert json.loads(body)["json"] == {"a": 1}
+
+
+@pytest.mark.parametrize("code", [404, 500, 418])
+def test_status_endpoint(fixture_server, code):
+    status, _, body = fetch(fixture_server.url(f"status/{code}"))
+
+    assert status == code
+    assert str(code) in body
+
+
+def test_status_redirect_and_missing_file(fixture_server):
+    status, _, body = fetch(fixture_server.url("status/302"))
+    assert status == 200 and json.loads(body)["url"].endswith("/get")
+
+    assert fetch(fixture_server.url("missing.html"))[0] == 404
+
+
+def test_custom_route_takes_priority(tmp_path):
+    (tmp_path / "get").write_text("static")
+    with FixtureServer(str(tmp_path)) as server:
+        server.route(r"/api/items/(\d+)", lambda handler, item: (200, "application/json", json.dumps({"id": int(item)})))
+        server.route(r"/get", lambda handler: (201, "text/plain", "custom"))
+
+        assert json.loads(fetch(server.url("api/items/7"))[2]) == {"id": 7}
+        status, _, body = fetch(server.url("get"))
+        assert (status, body) == (201, "custom")
@@ -0,0 +1,171 @@
+"""
+flaky 마커 재실행과 통계 테스트
+"""
+import json
+import os
+import subprocess
+import sys
+from utils.flaky_stats import FlakyStats
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FLAKY_TESTS = '''
+import pytest
+
+calls = {"setup": 0, "flaky": 0}
+
+
+@pytest.fixture
+def counted():
+    calls["setup"] += 1
+    return calls
+
+
+@pytest.mark.flaky(reruns=2)
+def test_passes_on_third_attempt(counted):
+    counted["flaky"] += 1
+    assert counted["flaky"] == 3
+
+
+@pytest.mark.flaky(1)
+def test_always_fails():
+    assert False
+
+
+def test_setup_ran_once():
+    assert calls["setup"] == 1
+'''
+
+
+RERUN_DRIVER_TESTS = '''
+import pytest
+
+
+class SwitchTo:
+    def default_content(self):
+        pass
+
+
+class Driver:
+    """재실행 전 초기화에 필요한 메서드만 있는 가짜 드라이버"""
+
+    def __init__(self):
+        self.implicit_wait = 0
+        self.window_handles = ["main"]
+        self.switch_to = SwitchTo()
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def save_screenshot(self, path):
+        return False
+
+    def execute_script(self, script, *args):
+        pass
+
+    def delete_all_cookies(self):
+        pass
+
+    def get(self, url):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def set_window_size(self, width, height):
+        pass
+
+
+attempts = []
+
+
+@pytest.fixture
+def fake_driver():
+    return Driver()
+
+
+@pytest.mark.flaky(reruns=1)
+def test_rerun_starts_without_implicit_wait(fake_driver):
+    attempts.append(fake_driver.implicit_wait)
+    fake_driver.implicitly_wait(10)
+    assert attempts == [0, 0]
+'''
+
+
+def run_sample(tmp_path, source, *args):
+    """conftest 플러그인으로 예제 테스트 파일 실행 → (실행 결과, 통계 파일 경로)"""
+    (tmp_path / "test_flaky_sample.py").write_text(source)
+    stats_path = tmp_path / "flaky.json"
+    env = dict(os.environ, PYTHONPATH=ROOT, TEST_ORDER="none", REPORT_HTML_FILE="", TIMING_FILE="",
+               REPORT_STREAM_FILE=str(tmp_path / "results.jsonl"), FLAKY_STATS_FILE=str(stats_path),
+               RUN_HISTORY_FILE=str(tmp_path / "history.json"),
+               PERF_METRICS_FILE=str(tmp_path / "perf.jsonl"))
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-p", "conftest", "-p", "no:cacheprovider", "-q", *args,
+         "test_flaky_sample.py"],
+        cwd=tmp_path, env=env, capture_output=True, text=True,
+    )
+    return result, stats_path
+
+
+def test_flaky_marker_reruns_only_the_call(tmp_path):
+    result, stats_path = run_sample(tmp_path, FLAKY_TESTS)
+
+    assert "1 failed, 2 passed, 3 rerun" in result.stdout, result.stdout
+    stats = json.loads(stats_path.read_text())["tests"]
+    assert stats["test_flaky_sample.py::test_passes_on_third_attempt"]["flaky_passes"] == 1
+    assert stats["test_flaky_sample.py::test_always_fails"]["failures"] == 1
+    results = [json.loads(line) for line in (tmp_path / "results.jsonl").read_text().splitlines()]
+    assert {r["name"]: r["reruns"] for r in results} == {
+        "test_passes_on_third_attempt": 2, "test_always_fails": 1, "test_setup_ran_once": 0,
+    }
+
+
+MAXFAIL_TESTS = '''
+import pytest
+
+
+@pytest.mark.flaky(reruns=1)
+def test_always_fails():
+    assert False
+
+
+def test_not_reached():
+    pass
+'''
+
+
+def test_flaky_rerun_keeps_stock_protocol_options(tmp_path):
+    """재실행 중에도 --maxfail과 --setup-plan이 pytest 기본 동작대로 적용되는지 확인"""
+    result, _ = run_sample(tmp_path, MAXFAIL_TESTS, "--maxfail=1")
+    assert "1 failed, 1 rerun" in result.stdout, result.stdout
+    assert "test_not_reached" not in (tmp_path / "results.jsonl").read_text()
+
+    result, _ = run_sample(tmp_path, MAXFAIL_TESTS, "--setup-plan")
+    assert result.returncode == 0, result.stdout
+    assert "rerun" not in result.stdout
+
+
+def test_rerun_resets_driver_with_implicit_wait_off(tmp_path):
+    """재실행 전 초기화가 테스트가 켠 implicit wait을 0으로 되돌리는지 확인"""
+    result, _ = run_sample(tmp_path, RERUN_DRIVER_TESTS)
+
+    assert "1 passed, 1 rerun" in result.stdout, result.stdout
+
+
+def test_stats_accumulate_and_find_chronic_flakes(tmp_path):
+    path = str(tmp_path / "flaky.json")
+    for attempts in (1, 2, 1, 3, 1):
+        stats = FlakyStats(path)
+        stats.record("flaky", attempts, "passed")
+        stats.record("stable", 1, "passed")
+        stats.record("broken", 3, "failed")
+        stats.save()
+
+    stats = FlakyStats(path).load()
+    assert stats.tests["flaky"]["runs"] == 5
+    assert stats.tests["flaky"]["reruns"] == 3
+    assert stats.tests["flaky"]["flaky_rate"] == 0.4
+    assert stats.tests["broken"]["failures"] == 5
+    assert stats.tests["broken"]["flaky_rate"] == 0
+    assert stats.chronic(min_runs=5, rate=0.3) == ["flaky"]
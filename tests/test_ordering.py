@@ -0,0 +1,61 @@
+"""
+실패 우선 실행 순서 테스트
+"""
+import subprocess
+from types import SimpleNamespace
+from utils.ordering import CHANGED, FAILED, FLAKY, STABLE, changed_files, order_items
+from utils.run_history import RunHistory
+
+
+def make_history(path, runs):
+    """runs: [{nodeid: (소요 시간, 결과)}] 순서대로 저장한 이력"""
+    for run in runs:
+        history = RunHistory(path)
+        for nodeid, (duration, outcome) in run.items():
+            history.record(nodeid, duration, outcome)
+        history.save()
+    return RunHistory(path).load()
+
+
+def test_history_keeps_recent_outcomes(tmp_path):
+    path = str(tmp_path / "history.json")
+    runs = [{"a": (1.0, "passed")}] * (RunHistory.OUTCOME_WINDOW + 2) + [{"a": (1.0, "failed")}]
+    history = make_history(path, runs)
+
+    assert len(history.outcomes("a")) == RunHistory.OUTCOME_WINDOW
+    assert history.last_failed("a")
+    assert history.is_flaky("a")
+    assert history.outcomes("missing") == []
+
+
+def test_failed_and_flaky_first_then_fast_tests(tmp_path):
+    history = make_history(str(tmp_path / "history.json"), [
+        {"slow": (9.0, "passed"), "fast": (0.5, "passed"), "flaky": (5.0, "failed"), "broken": (8.0, "passed")},
+        {"slow": (9.0, "passed"), "fast": (0.5, "passed"), "flaky": (5.0, "passed"), "broken": (8.0, "failed")},
+    ])
+    items = [SimpleNamespace(nodeid=nodeid) for nodeid in
+             ("slow", "fast", "tests/test_new.py::test_x", "flaky", "broken", "tests/test_edit.py::test_y")]
+
+    ordered, counts = order_items(items, history, changed={"tests/test_edit.py"})
+
+    assert [item.nodeid for item in ordered] == [
+        "broken", "flaky", "tests/test_new.py::test_x", "tests/test_edit.py::test_y", "fast", "slow",
+    ]
+    assert counts == {STABLE: 2, CHANGED: 2, FLAKY: 1, FAILED: 1}
+
+
+def test_changed_files_from_git(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "kept.py").write_text("a = 1\n")
+    (tmp_path / "edited.py").write_text("b = 1\n")
+    git("add", ".")
+    git("-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init")
+    (tmp_path / "edited.py").write_text("b = 2\n")
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "tests" / "test_new.py").write_text("")
+
+    assert changed_files(str(tmp_path)) == {"edited.py", "tests/test_new.py"}
+    assert changed_files(str(tmp_path / "missing")) == set()
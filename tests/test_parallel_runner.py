@@ -0,0 +1,34 @@
+"""
+병렬 실행 스케줄링 테스트
+"""
+from utils.parallel_runner import partition_tests
+from utils.run_history import RunHistory
+
+
+def test_partition_balances_by_history(tmp_path):
+    """과거 소요 시간 기준으로 워커 부하가 균등하게 분배되는지 확인"""
+    history = RunHistory(str(tmp_path / "history.json"))
+    for nodeid, duration in {"a": 8.0, "b": 7.0, "c": 6.0, "d": 5.0, "e": 4.0}.items():
+        history.record(nodeid, duration)
+    history.save()
+
+    groups, loads = partition_tests(["a", "b", "c", "d", "e"], 2, history.load())
+
+    # 긴 테스트가 각 워커에서 먼저 실행되어야 함
+    assert [group[0] for group in groups] == ["a", "b"]
+    assert sorted(loads) == [13.0, 17.0]
+
+
+def test_history_merges_concurrent_saves(tmp_path):
+    """여러 프로세스의 저장 결과가 병합되는지 확인"""
+    path = str(tmp_path / "history.json")
+    first, second = RunHistory(path), RunHistory(path)
+    first.record("a", 2.0, "passed")
+    second.record("b", 4.0, "failed")
+    first.save()
+    second.save()
+
+    history = RunHistory(path).load()
+    assert history.duration("a") == 2.0
+    assert history.tests["b"]["last_outcome"] == "failed"
+    assert history.duration("missing", 1.5) == 1.5
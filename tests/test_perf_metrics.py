@@ -0,0 +1,72 @@
+"""
+페이지 성능 지표 수집 테스트 (가짜 드라이버 사용)
+"""
+from config.config import TestConfig
+from pages.base_page import BasePage
+from utils.perf_metrics import PAGE_METRICS_JS, PerfMetricsStore, collect_page_metrics
+
+PAGE_METRICS = {
+    "navigation": {"ttfb": 120.0, "dom_content_loaded": 800.0, "load": 1500.0, "transfer_size": 30000},
+    "resources": {"count": 3, "transfer_size": 50000, "encoded_body_size": 48000, "by_type": {}, "slowest": []},
+    "lcp": 950.0,
+}
+
+
+class MetricsDriver:
+    """성능 지표 스크립트와 CDP 호출에 응답하는 가짜 Chrome 드라이버"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.visited = []
+        self.cdp_calls = []
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def execute_async_script(self, script, *args):
+        if self.fail:
+            raise RuntimeError("script timeout")
+        assert script == PAGE_METRICS_JS
+        return dict(PAGE_METRICS)
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append(command)
+        if command == "Performance.getMetrics":
+            return {"metrics": [{"name": "Nodes", "value": 42}, {"name": "Unlisted", "value": 1}]}
+        return {}
+
+
+def test_collect_includes_cdp_metrics_on_chrome():
+    driver = MetricsDriver()
+    metrics = collect_page_metrics(driver)
+
+    assert metrics["navigation"]["ttfb"] == 120.0
+    assert metrics["lcp"] == 950.0
+    assert metrics["cdp"] == {"Nodes": 42}
+    assert driver.cdp_calls == ["Performance.enable", "Performance.getMetrics"]
+
+
+def test_navigate_to_records_metrics_per_test(tmp_path, monkeypatch):
+    path = str(tmp_path / "perf.jsonl")
+    monkeypatch.setattr(TestConfig, "PERF_METRICS_FILE", path)
+    page = BasePage(MetricsDriver())
+
+    assert page.navigate_to("https://example.com/") is None
+    metrics = page.navigate_to("https://example.com/a", collect_metrics=True)
+
+    assert metrics["resources"]["transfer_size"] == 50000
+    records = PerfMetricsStore(path).by_test()
+    test_id = "tests/test_perf_metrics.py::test_navigate_to_records_metrics_per_test"
+    assert [r["url"] for r in records[test_id]] == ["https://example.com/a"]
+
+
+def test_metric_failure_does_not_fail_navigation(tmp_path, monkeypatch):
+    monkeypatch.setattr(TestConfig, "PERF_METRICS_FILE", str(tmp_path / "perf.jsonl"))
+    driver = MetricsDriver(fail=True)
+
+    assert BasePage(driver).navigate_to("https://example.com/", collect_metrics=True) is None
+    assert driver.visited == ["https://example.com/"]
+    assert PerfMetricsStore(str(tmp_path / "perf.jsonl")).by_test() == {}
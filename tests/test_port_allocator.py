@@ -0,0 +1,68 @@
+"""
+디버깅 포트 할당기 테스트
+"""
+import os
+import pytest
+from utils.json_store import lock_file, unlock_file
+from utils.port_allocator import PortAllocator
+from utils.driver_factory import DriverFactory
+
+
+def test_allocated_ports_are_unique_and_released(tmp_path):
+    """예약된 포트가 겹치지 않고, 해제 시 잠금 파일이 삭제되는지 확인"""
+    allocator = PortAllocator(str(tmp_path))
+    ports = {allocator.allocate() for _ in range(5)}
+    assert len(ports) == 5
+    assert len(os.listdir(tmp_path)) == 5
+
+    for port in ports:
+        allocator.release(port)
+    assert os.listdir(tmp_path) == []
+
+
+def test_stale_lock_is_reclaimed(tmp_path):
+    """종료된 프로세스가 남긴 잠금 파일은 회수되는지 확인"""
+    allocator = PortAllocator(str(tmp_path))
+    lock_path = tmp_path / "45678.lock"
+    lock_path.write_text("999999999")
+
+    assert allocator._try_lock(45678)
+    assert lock_path.read_text() == str(os.getpid())
+
+
+def test_held_lock_is_not_reclaimed(tmp_path):
+    """예약 중인 포트는 다른 할당기가 가져갈 수 없고, 해제 후에만 예약되는지 확인"""
+    first, second = PortAllocator(str(tmp_path)), PortAllocator(str(tmp_path))
+
+    assert first._try_lock(45679)
+    assert not second._try_lock(45679)
+
+    first.release(45679)
+    assert second._try_lock(45679)
+    second.release(45679)
+    assert os.listdir(tmp_path) == []
+
+
+def test_lock_file_helper_blocks_other_handles(tmp_path):
+    """공용 잠금 도우미가 다른 핸들의 잠금을 막고, 해제 후에는 잠글 수 있는지 확인"""
+    path = tmp_path / "shared.lock"
+    with open(path, 'w') as first, open(path, 'w') as second:
+        lock_file(first)
+        with pytest.raises(BlockingIOError):
+            lock_file(second, blocking=False)
+
+        unlock_file(first)
+        lock_file(second, blocking=False)
+        unlock_file(second)
+
+
+def test_ubuntu_options_reserve_and_release_port():
+    """ubuntu 프로필 옵션이 디버깅 포트를 예약하고 정리 시 해제하는지 확인"""
+    options = DriverFactory._build_chrome_options(headless=True, profile='ubuntu')
+    ports = [int(arg.split('=', 1)[1]) for arg in options.arguments
+             if arg.startswith('--remote-debugging-port=')]
+    assert len(ports) == 1
+    assert ports[0] in DriverFactory._allocated_ports
+
+    DriverFactory._release_resources(options)
+    assert ports[0] not in DriverFactory._allocated_ports
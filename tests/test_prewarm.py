@@ -0,0 +1,155 @@
+"""
+드라이버 미리 실행 테스트 (실제 브라우저 대신 가짜 드라이버 사용)
+"""
+import time
+from types import SimpleNamespace
+import conftest
+from config.config import TestConfig
+from utils.driver_factory import DriverFactory
+from utils.prewarm import DriverPrewarmer, mem_available_mb
+
+
+class FakeDriver:
+    """실행에 delay초가 걸리는 드라이버"""
+
+    def __init__(self, delay=0.0):
+        time.sleep(delay)
+        self.window_handles = ["main"]
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+def write_meminfo(path, available_mb):
+    path.write_text(f"MemTotal:       16384000 kB\nMemAvailable:   {available_mb * 1024} kB\n")
+    return str(path)
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.time() + timeout
+    while not condition():
+        assert time.time() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+def test_take_returns_started_driver_and_refills(tmp_path):
+    meminfo = write_meminfo(tmp_path / "meminfo", 8000)
+    prewarmer = DriverPrewarmer(lambda: FakeDriver(0.05), FakeDriver.quit, count=1,
+                                min_available_mb=1024, meminfo=meminfo).start()
+    try:
+        # 실행 중인 드라이버가 있으면 새로 띄우지 않고 완료를 기다림
+        first = prewarmer.take()
+        assert isinstance(first, FakeDriver)
+        wait_for(lambda: prewarmer.stats["spawned"] == 2)
+        assert prewarmer.take() is not first
+        assert prewarmer.stats["hits"] == 2
+    finally:
+        prewarmer.stop()
+
+
+def test_low_memory_skips_spawning(tmp_path):
+    meminfo = write_meminfo(tmp_path / "meminfo", 500)
+    created = []
+    prewarmer = DriverPrewarmer(lambda: created.append(1) or FakeDriver(), FakeDriver.quit,
+                                count=2, min_available_mb=1024, meminfo=meminfo)
+    prewarmer.RETRY_INTERVAL = 0.01
+    prewarmer.start()
+    try:
+        wait_for(lambda: prewarmer.stats["low_memory"] >= 2)
+        assert prewarmer.take() is None
+        assert created == []
+
+        write_meminfo(tmp_path / "meminfo", 4000)
+        wait_for(lambda: prewarmer.stats["spawned"] == 2)
+    finally:
+        prewarmer.stop()
+
+
+def test_stop_quits_unused_and_dead_drivers_are_skipped():
+    prewarmer = DriverPrewarmer(FakeDriver, FakeDriver.quit, count=2).start()
+    wait_for(lambda: prewarmer.stats["spawned"] == 2)
+    dead, alive = prewarmer._ready
+    del dead.window_handles
+
+    assert prewarmer.take() is alive
+    assert dead.quit_called
+    wait_for(lambda: prewarmer.stats["spawned"] == 4)
+    unused = list(prewarmer._ready)
+    prewarmer.stop()
+    assert len(unused) == 2 and all(driver.quit_called for driver in unused)
+
+
+def test_stop_waits_for_in_flight_launch():
+    created = []
+
+    def create():
+        created.append(FakeDriver(delay=0.3))
+        return created[-1]
+
+    prewarmer = DriverPrewarmer(create, FakeDriver.quit).start()
+    wait_for(lambda: prewarmer._spawning == 1)
+    prewarmer.stop()
+
+    assert len(created) == 1 and created[0].quit_called
+    assert prewarmer._ready == [] and prewarmer.stats["spawned"] == 0
+
+
+def test_stop_wait_is_bounded_and_late_driver_is_still_quit():
+    created = []
+
+    def create():
+        created.append(FakeDriver(delay=0.5))
+        return created[-1]
+
+    prewarmer = DriverPrewarmer(create, FakeDriver.quit).start()
+    prewarmer.LAUNCH_TIMEOUT = 0.05
+    wait_for(lambda: prewarmer._spawning == 1)
+    started = time.time()
+    prewarmer.stop()
+
+    assert time.time() - started < 0.4
+    wait_for(lambda: created and created[0].quit_called)
+
+
+def test_mem_available_mb(tmp_path):
+    assert mem_available_mb(write_meminfo(tmp_path / "meminfo", 2048)) == 2048
+    assert mem_available_mb(str(tmp_path / "missing")) is None
+
+
+def test_get_driver_returns_prewarmed_session(monkeypatch):
+    started = []
+
+    def start_driver(browser, headless, profile):
+        started.append(profile)
+        return FakeDriver()
+
+    monkeypatch.setattr(DriverFactory, "_start_driver", staticmethod(start_driver))
+    monkeypatch.setattr(TestConfig, "DRIVER_PREWARM", 1)
+    monkeypatch.setattr(TestConfig, "BROWSER_DAEMON", "off")
+    try:
+        driver = DriverFactory.get_driver("chrome", headless=True)
+        assert DriverFactory._prewarmer.stats["hits"] == 1
+        wait_for(lambda: len(started) == 2)
+
+        # 미리 실행 중인 설정과 다르면 직접 실행
+        DriverFactory.get_driver("chrome", headless=True, profile="fast")
+        assert started[-1] == "fast"
+        assert isinstance(driver, FakeDriver)
+    finally:
+        DriverFactory.stop_prewarm()
+    assert DriverFactory._prewarmer is None
+
+
+def test_collect_only_does_not_prewarm(monkeypatch):
+    started = []
+    monkeypatch.setattr(DriverFactory, "start_prewarm", staticmethod(lambda: started.append(True)))
+    monkeypatch.setattr(TestConfig, "DRIVER_PREWARM", 1)
+    monkeypatch.setattr(TestConfig, "CONTEXT_ISOLATION", False)
+    items = [SimpleNamespace(fixturenames=["driver"])]
+
+    for collectonly in (True, False):
+        session = SimpleNamespace(config=SimpleNamespace(option=SimpleNamespace(collectonly=collectonly)),
+                                  items=items)
+        conftest.pytest_collection_finish(session)
+    assert started == [True]
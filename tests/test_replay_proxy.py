@@ -0,0 +1,97 @@
+"""
+HTTP 기록/재생 프록시 테스트 (로컬 픽스처 서버를 실제 서버로 사용)
+"""
+import http.client
+import shutil
+import ssl
+import pytest
+from benchmarks.page_load import SITE_DIR
+from config.config import TestConfig
+from utils.driver_factory import DriverFactory
+from utils.fixture_server import FixtureServer
+from utils.replay_proxy import RECORD, REPLAY, ReplayProxy
+
+needs_openssl = pytest.mark.skipif(shutil.which("openssl") is None, reason="openssl 명령 필요")
+
+
+def proxy_request(proxy, method, url, body=None):
+    """프록시에 절대 URL 요청 → (상태 코드, 헤더 dict, 본문)"""
+    connection = http.client.HTTPConnection(proxy.host, proxy.port, timeout=5)
+    try:
+        connection.request(method, url, body=body)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def test_record_then_replay_without_network(tmp_path):
+    archive = str(tmp_path / "archive")
+    with FixtureServer(SITE_DIR) as server:
+        url = server.url("index.html")
+        with open(f"{SITE_DIR}/index.html", "rb") as f:
+            expected = f.read()
+        with ReplayProxy(archive, RECORD) as proxy:
+            assert proxy_request(proxy, "GET", url)[2] == expected
+            assert proxy_request(proxy, "GET", server.url("missing.html"))[0] == 404
+            assert proxy.stats["recorded"] == 2
+
+    # 원래 서버가 종료된 뒤에도 기록된 응답 그대로 재생
+    with ReplayProxy(archive, REPLAY) as proxy:
+        status, headers, body = proxy_request(proxy, "GET", url)
+        assert (status, body) == (200, expected)
+        assert headers["Content-Length"] == str(len(expected))
+        assert proxy_request(proxy, "GET", server.url("missing.html"))[0] == 404
+
+        status, headers, _ = proxy_request(proxy, "GET", server.url("list.html"))
+        assert status == 404 and headers["X-Replay"] == "miss"
+        assert proxy_request(proxy, "POST", url, body=b"q=1")[0] == 404
+        assert proxy.stats == {"recorded": 0, "replayed": 2, "missed": 2, "intercepted": 0,
+                               "tunneled": 0, "refused": 0}
+
+
+def test_replay_refuses_https_tunnel(tmp_path):
+    with ReplayProxy(str(tmp_path), REPLAY) as proxy:
+        assert proxy_request(proxy, "CONNECT", "example.com:443")[0] == 502
+        assert proxy.stats["refused"] == 1
+
+
+@needs_openssl
+def test_replay_https_through_local_ca(tmp_path):
+    archive = str(tmp_path / "archive")
+    ca_dir = str(tmp_path / "ca")
+    with ReplayProxy(archive, REPLAY, ca_dir=ca_dir) as proxy:
+        proxy.archive.save("GET", "https://shop.example.test/items?page=2", b"", 200, "OK",
+                           [("Content-Type", "text/html")], b"<p>items</p>")
+
+        # 클라이언트는 프록시 CA만 신뢰하고 호스트 이름까지 검증
+        context = ssl.create_default_context(cafile=proxy.ca.cert_path)
+        connection = http.client.HTTPSConnection(proxy.host, proxy.port, timeout=10, context=context)
+        connection.set_tunnel("shop.example.test", 443)
+        try:
+            connection.request("GET", "/items?page=2")
+            response = connection.getresponse()
+            assert (response.status, response.read()) == (200, b"<p>items</p>")
+            connection.request("GET", "/missing")
+            response = connection.getresponse()
+            assert (response.status, response.getheader("X-Replay")) == (404, "miss")
+            response.read()
+        finally:
+            connection.close()
+        assert proxy.stats["intercepted"] == 1
+        assert proxy.stats["replayed"] == 1 and proxy.stats["refused"] == 0
+
+
+def test_driver_options_route_through_proxy(tmp_path, monkeypatch):
+    monkeypatch.setattr(TestConfig, "REPLAY_MODE", REPLAY)
+    monkeypatch.setattr(TestConfig, "REPLAY_ARCHIVE", str(tmp_path))
+    monkeypatch.setattr(TestConfig, "REPLAY_CA_DIR", str(tmp_path / "ca"))
+    options = DriverFactory._build_chrome_options(headless=True)
+    try:
+        proxy = DriverFactory.get_replay_proxy()
+        assert f"--proxy-server=http://{proxy.address}" in options.arguments
+        assert options.to_capabilities().get("acceptInsecureCerts", False) is (proxy.ca is not None)
+        assert DriverFactory.get_replay_proxy() is proxy
+    finally:
+        DriverFactory._release_resources(options)
+        DriverFactory.stop_replay_proxy()
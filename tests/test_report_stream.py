@@ -0,0 +1,71 @@
+"""
+결과 스트림 / 크기 제한 HTML 리포트 테스트 (브라우저 불필요)
+"""
+import os
+from utils.report_merge import merge_result_streams, write_html_report
+from utils.report_stream import ReportStream, read_results, split_nodeid
+from utils.screenshot_store import ScreenshotStore
+
+
+def test_split_nodeid_matches_junit_names():
+    assert split_nodeid("tests/test_a.py::TestA::test_one[1]") == ("tests.test_a.TestA", "test_one[1]")
+    assert split_nodeid("tests/test_a.py::test_two") == ("tests.test_a", "test_two")
+
+
+def test_stream_writes_each_result_immediately(tmp_path):
+    path = str(tmp_path / "results.jsonl")
+    stream = ReportStream(path).open()
+    stream.write("tests/test_a.py::test_one", "passed", 0.5)
+    # close 전에도 이미 파일에 기록되어 있어야 함
+    assert [r["name"] for r in read_results([path])] == ["test_one"]
+
+    stream.write("tests/test_a.py::test_two", "failed", 1.0, "x" * (ReportStream.MESSAGE_LIMIT + 1), worker="0")
+    stream.close()
+
+    results = read_results([path, str(tmp_path / "missing.jsonl")])
+    assert [r["outcome"] for r in results] == ["passed", "failed"]
+    assert len(results[1]["message"]) == ReportStream.MESSAGE_LIMIT
+    assert results[1]["worker"] == "0"
+
+
+def test_merge_result_streams(tmp_path):
+    paths = []
+    for worker in range(2):
+        path = str(tmp_path / f"w{worker}.jsonl")
+        stream = ReportStream(path).open()
+        stream.write(f"tests/test_a.py::test_{worker}", "passed", 0.1)
+        stream.close()
+        paths.append(path)
+
+    output = str(tmp_path / "merged.jsonl")
+    results = merge_result_streams(paths, output)
+    assert len(results) == 2
+    assert read_results([output]) == results
+
+
+def test_html_report_size_is_bounded(tmp_path):
+    screenshot_dir = str(tmp_path / "screenshots")
+    store = ScreenshotStore(screenshot_dir)
+    results = []
+    for i in range(200):
+        store.put(b"same-frame", test_name=f"tests.test_a.test_{i}", run="r1")
+        results.append({
+            "classname": "tests.test_a", "name": f"test_{i}", "outcome": "failed",
+            "duration": float(i), "message": "E" * 5000, "run": "r1",
+        })
+    results.append({"classname": "tests.test_a", "name": "test_ok", "outcome": "passed",
+                    "duration": 0.1, "message": ""})
+
+    small = str(tmp_path / "small.html")
+    large = str(tmp_path / "large.html")
+    write_html_report(results[:50], small, screenshot_dir, max_rows=20, max_message=100)
+    write_html_report(results, large, screenshot_dir, max_rows=20, max_message=100)
+
+    with open(large, encoding="utf-8") as f:
+        document = f.read()
+    assert document.count("<tr class=") == 20
+    assert 'loading="lazy"' in document
+    assert "base64" not in document
+    # 가장 오래 걸린 실패가 먼저 표시되고 통과한 테스트는 생략됨
+    assert "test_199" in document and "test_ok" not in document
+    assert abs(os.path.getsize(large) - os.path.getsize(small)) < 1000
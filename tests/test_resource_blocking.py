@@ -0,0 +1,87 @@
+"""
+네트워크 요청 차단 테스트 (가짜 드라이버 사용)
+"""
+import re
+import pytest
+from config.config import TestConfig
+from utils.driver_factory import DriverFactory
+from utils.resource_blocking import RESOURCE_CLASSES, blocked_url_patterns, chrome_prefs
+
+
+class CdpDriver:
+    """CDP 호출을 기록하는 가짜 Chrome 드라이버"""
+
+    def __init__(self):
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp_calls.append((command, params))
+        return {}
+
+
+def is_blocked(url, patterns):
+    """Network.setBlockedURLs와 같은 방식('*'만 와일드카드)으로 URL 차단 여부 확인"""
+    return any(re.fullmatch('.*'.join(map(re.escape, pattern.split('*'))), url) for pattern in patterns)
+
+
+def test_patterns_combine_classes_and_extra_patterns():
+    urls = blocked_url_patterns("images, fonts", ["*/banner/*", "*.png"])
+
+    assert urls[:len(RESOURCE_CLASSES["images"])] == RESOURCE_CLASSES["images"]
+    assert "*.woff2?*" in urls
+    assert urls[-1] == "*/banner/*"
+    assert urls.count("*.png") == 1
+
+
+def test_extension_patterns_are_anchored():
+    urls = blocked_url_patterns("images,fonts,media")
+
+    for url in ("https://cdn.example.com/logo.png", "https://cdn.example.com/logo.svg?v=3",
+                "https://cdn.example.com/font.woff2?hash=1", "https://video.example.com/seg001.ts?token=x"):
+        assert is_blocked(url, urls), url
+    for url in ("https://cdn.example.com/app.iconfont.js", "https://example.com/guide.png-tips.html",
+                "https://example.com/app.tsx", "https://example.com/search?q=logo.svg&page=2"):
+        assert not is_blocked(url, urls), url
+
+
+def test_unknown_class_is_rejected():
+    with pytest.raises(ValueError):
+        blocked_url_patterns(["images", "scripts"])
+
+
+def test_image_prefs_only_when_images_blocked():
+    assert chrome_prefs("images,ads") == {"profile.managed_default_content_settings.images": 2}
+    assert chrome_prefs(["fonts"]) == {}
+
+
+def test_block_and_unblock_through_cdp():
+    driver = CdpDriver()
+
+    urls = DriverFactory.block_resources(driver, ["analytics"], "*tracker*")
+    DriverFactory.unblock_resources(driver)
+
+    assert driver.cdp_calls == [
+        ("Network.enable", {}),
+        ("Network.setBlockedURLs", {"urls": urls}),
+        ("Network.setBlockedURLs", {"urls": []}),
+    ]
+    assert "*google-analytics.com*" in urls and urls[-1] == "*tracker*"
+
+
+def test_block_skipped_without_cdp_or_patterns():
+    driver = CdpDriver()
+
+    assert DriverFactory.block_resources(object(), ["images"]) == []
+    assert DriverFactory.block_resources(driver) == []
+    assert driver.cdp_calls == []
+
+
+def test_blocking_profile_uses_prefs_instead_of_ignored_switches(monkeypatch):
+    monkeypatch.setattr(TestConfig, "PROFILE_BLOCK_RESOURCES", "images,media")
+    options = DriverFactory._build_chrome_options(headless=True, profile="fast")
+    try:
+        assert options.experimental_options["prefs"] == {"profile.managed_default_content_settings.images": 2}
+        assert "--disable-images" not in options.arguments
+        assert "--disable-javascript" not in options.arguments
+    finally:
+        DriverFactory._release_resources(options)
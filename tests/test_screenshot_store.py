@@ -0,0 +1,75 @@
+"""
+ScreenshotStore 단위 테스트 (브라우저 불필요)
+"""
+import os
+from utils.screenshot_store import ScreenshotStore
+from utils.report_merge import find_failure_screenshots
+
+
+class TestScreenshotStore:
+    """ScreenshotStore 테스트"""
+
+    def test_identical_screenshots_are_stored_once(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        first = store.put(b'same-image', test_name='tests.test_a.test_one', url='u1')
+        second = store.put(b'same-image', test_name='tests.test_a.test_two', url='u2')
+
+        assert first == second
+        images = [name for name in os.listdir(tmp_path) if name.endswith('.png')]
+        assert len(images) == 1
+        assert [e['test'] for e in store.entries()] == ['tests.test_a.test_one', 'tests.test_a.test_two']
+
+    def test_different_screenshots_get_different_files(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        assert store.put(b'image-a') != store.put(b'image-b')
+
+    def test_entries_filter_by_test_and_truncate_error(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        store.put(b'a', test_name='t1', error_info='x' * (ScreenshotStore.ERROR_LIMIT + 10))
+        store.put(b'b', test_name='t2')
+
+        entry, = store.entries('t1')
+        assert len(entry['error']) == ScreenshotStore.ERROR_LIMIT
+        assert 'error' not in store.entries('t2')[0]
+
+    def test_unknown_format_rejected(self, tmp_path):
+        try:
+            ScreenshotStore(str(tmp_path), image_format='bmp')
+        except ValueError:
+            return
+        raise AssertionError("ValueError가 발생해야 합니다")
+
+    def test_report_links_failure_screenshots_from_index(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        store.put(b'a', test_name='tests.test_a.test_one', kind='failure', run='r1')
+        store.put(b'a', test_name='tests.test_a.test_one', kind='failure', run='r1')
+        store.put(b'b', test_name='tests.test_a.test_one', kind='manual', run='r1')
+        store.put(b'c', test_name='tests.test_b.test_one', kind='failure', run='r1')
+
+        result = {'classname': 'tests.test_a.TestA', 'name': 'test_one', 'outcome': 'failed', 'run': 'r1'}
+        files = find_failure_screenshots(result, str(tmp_path))
+
+        assert len(files) == 1
+        assert files[0] == store.entries()[0]['file']
+
+    def test_report_uses_only_current_run_newest_first(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        for i, run in enumerate(('old', 'old', 'old', 'new', 'new')):
+            store.put(f'frame-{i}'.encode(), test_name='tests.test_a.test_one', run=run, timestamp=i)
+        newest = store.entries()[-1]['file']
+
+        failed = {'classname': 'tests.test_a', 'name': 'test_one', 'outcome': 'failed', 'run': 'new'}
+        files = find_failure_screenshots(failed, str(tmp_path))
+        assert len(files) == 2 and files[0] == newest
+        assert find_failure_screenshots(dict(failed, outcome='passed'), str(tmp_path)) == []
+
+    def test_prune_drops_entries_for_deleted_files(self, tmp_path):
+        store = ScreenshotStore(str(tmp_path))
+        deleted = store.put(b'old', test_name='t1')
+        store.put(b'new', test_name='t2')
+        os.remove(deleted)
+
+        assert [e['test'] for e in store.prune()] == ['t2']
+        assert [e['test'] for e in store.entries()] == ['t2']
+        store.put(b'newer', test_name='t3')
+        assert [e['test'] for e in store.entries()] == ['t2', 't3']
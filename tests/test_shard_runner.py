@@ -0,0 +1,83 @@
+"""
+CI 샤딩 테스트
+"""
+import json
+import os
+import pytest
+from config.config import TestConfig
+from utils.run_history import RunHistory
+from utils.shard_runner import merge_shards, parse_shard, select_shard, shard_dir
+
+
+def test_parse_shard():
+    assert parse_shard("2/3") == (2, 3)
+    for value in ("0/3", "4/3", "1/0", "a/b", "3"):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_shards_cover_all_tests_and_ignore_collection_order(tmp_path):
+    """샤드끼리 겹치거나 빠지는 테스트가 없고, 수집 순서가 달라도 같은 분배인지 확인"""
+    history = RunHistory(str(tmp_path / "history.json"))
+    durations = {f"t{i}": float(i) for i in range(1, 10)}
+    for nodeid, duration in durations.items():
+        history.record(nodeid, duration)
+    history.save()
+    history.load()
+
+    shards = [select_shard(list(durations), index, 3, history) for index in (1, 2, 3)]
+    reordered = [select_shard(list(reversed(list(durations))), index, 3, history) for index in (1, 2, 3)]
+
+    assert shards == reordered
+    assert sorted(nodeid for nodeids, _ in shards for nodeid in nodeids) == sorted(durations)
+    assert max(load for _, load in shards) - min(load for _, load in shards) <= 2.0
+
+
+def write_shard(report_dir, index, results, total=2):
+    """샤드 결과 파일(shard.json, results.jsonl, junit.xml) 생성"""
+    directory = shard_dir(report_dir, index)
+    os.makedirs(directory)
+    with open(os.path.join(directory, "shard.json"), "w", encoding="utf-8") as f:
+        json.dump({"index": index, "total": total}, f)
+    with open(os.path.join(directory, "results.jsonl"), "w", encoding="utf-8") as f:
+        for nodeid, outcome, duration in results:
+            f.write(json.dumps({"nodeid": nodeid, "classname": "tests.test_a", "name": nodeid.split("::")[-1],
+                                "outcome": outcome, "duration": duration, "message": ""}) + "\n")
+    cases = "".join(f'<testcase classname="tests.test_a" name="{nodeid.split("::")[-1]}" time="{duration}"/>'
+                    for nodeid, _, duration in results)
+    with open(os.path.join(directory, "junit.xml"), "w", encoding="utf-8") as f:
+        f.write(f'<testsuite tests="{len(results)}" failures="0" errors="0" skipped="0" time="1">{cases}</testsuite>')
+
+
+def test_merge_shards_builds_reports_and_history(tmp_path, monkeypatch):
+    report_dir = str(tmp_path / "reports")
+    history_path = str(tmp_path / "history.json")
+    monkeypatch.setattr(TestConfig, "RUN_HISTORY_FILE", history_path)
+    monkeypatch.setattr(TestConfig, "SCREENSHOT_DIR", str(tmp_path / "screenshots"))
+    write_shard(report_dir, 1, [("tests/test_a.py::test_one", "passed", 2.0)])
+    write_shard(report_dir, 2, [("tests/test_a.py::test_two", "error", 3.0),
+                                ("tests/test_a.py::test_three", "passed", 1.0)])
+
+    results = merge_shards(report_dir)
+
+    assert len(results) == 3
+    for name in ("junit.xml", "results.jsonl", "report.html"):
+        assert os.path.exists(os.path.join(report_dir, name))
+    history = RunHistory(history_path).load()
+    assert history.duration("tests/test_a.py::test_two") == 3.0
+    assert history.tests["tests/test_a.py::test_two"]["last_outcome"] == "failed"
+
+
+def test_merge_ignores_shards_beyond_current_count(tmp_path, monkeypatch):
+    report_dir = str(tmp_path / "reports")
+    monkeypatch.setattr(TestConfig, "RUN_HISTORY_FILE", str(tmp_path / "history.json"))
+    monkeypatch.setattr(TestConfig, "SCREENSHOT_DIR", str(tmp_path / "screenshots"))
+    # 이전 실행(샤드 3개)의 s3가 남아 있는 상태에서 샤드 2개로 다시 실행
+    write_shard(report_dir, 3, [("tests/test_a.py::test_old", "error", 1.0)], total=3)
+    os.utime(os.path.join(shard_dir(report_dir, 3), "shard.json"), (0, 0))
+    for index in (1, 2):
+        write_shard(report_dir, index, [(f"tests/test_a.py::test_{index}", "passed", 1.0)])
+
+    assert [r["nodeid"] for r in merge_shards(report_dir, total=2)] == ["tests/test_a.py::test_1",
+                                                                         "tests/test_a.py::test_2"]
+    assert len(merge_shards(report_dir)) == 2
@@ -0,0 +1,52 @@
+"""
+TimingRecorder 단위 테스트
+"""
+import json
+import time
+from utils.timing import TimingRecorder, ACTION, LAUNCH, WAIT
+
+
+def test_nested_spans_record_self_time_only():
+    recorder = TimingRecorder()
+    recorder.start_test("t1")
+
+    @recorder.timed(WAIT)
+    def wait():
+        time.sleep(0.05)
+
+    @recorder.timed(ACTION)
+    def click():
+        wait()
+        time.sleep(0.01)
+
+    click()
+    recorder.end_test("t1", 0.1)
+
+    wait_time, wait_calls = recorder.tests["t1"][WAIT]
+    action_time, action_calls = recorder.tests["t1"][ACTION]
+    assert wait_calls == action_calls == 1
+    assert wait_time >= 0.05
+    # 클릭 안의 대기 시간은 동작 시간에 포함되지 않음
+    assert action_time < 0.04
+
+
+def test_summary_reports_overhead_share_and_slowest(tmp_path):
+    recorder = TimingRecorder()
+    recorder.start_session()
+    recorder.add(LAUNCH, 2.0, key="slow")
+    recorder.add(WAIT, 1.0, key="slow")
+    recorder.end_test("slow", 4.0)
+    recorder.end_test("fast", 1.0)
+    recorder.end_session()
+    recorder.session_end = recorder.session_start + 10.0
+
+    summary = recorder.summary(top=1)
+    assert summary["browser_overhead_ratio"] == 0.2
+    assert summary["wait"] == 1.0
+    assert [t["nodeid"] for t in summary["slowest"]] == ["slow"]
+    assert any("20.0%" in line for line in recorder.format_summary())
+
+    path = tmp_path / "timings.json"
+    recorder.write_json(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["tests"]["slow"]["phases"][LAUNCH] == {"seconds": 2.0, "calls": 1}
@@ -7,8 +7,6 @@ import pytest
 import os
 import time
 import traceback
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -20,43 +18,19 @@ class TestUbuntuServer:
     
     def setup_method(self):
         """각 테스트 메서드 실행 전 설정"""
-        # Ubuntu 서버에 최적화된 Chrome 옵션
-        options = Options()
-        options.add_argument('--headless')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-plugins')
-        options.add_argument('--disable-images')
-        options.add_argument('--disable-javascript')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument('--remote-debugging-port=9222')
-        options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        
-        # 사용자 데이터 디렉토리 충돌 방지
-        import tempfile
-        import uuid
-        user_data_dir = tempfile.mkdtemp(prefix=f"chrome_user_data_{uuid.uuid4().hex[:8]}_")
-        options.add_argument(f'--user-data-dir={user_data_dir}')
-        options.add_argument('--no-first-run')
-        options.add_argument('--no-default-browser-check')
-        
-        # 메모리 최적화
-        options.add_argument('--disable-background-timer-throttling')
-        options.add_argument('--disable-backgrounding-occluded-windows')
-        options.add_argument('--disable-renderer-backgrounding')
-        options.add_argument('--disable-features=TranslateUI')
-        options.add_argument('--disable-ipc-flooding-protection')
-        
-        self.driver = webdriver.Chrome(options=options)
-        self.driver.implicitly_wait(10)
+        # Ubuntu 서버에 최적화된 Chrome (디버깅 포트는 자동 예약)
+        self.driver = DriverFactory.get_ubuntu_driver()
         self.wait = WebDriverWait(self.driver, 20)
     
     def teardown_method(self):
         """각 테스트 메서드 실행 후 정리"""
         if hasattr(self, 'driver'):
-            self.driver.quit()
+            DriverFactory.quit_driver(self.driver)
+    
+    @pytest.fixture(autouse=True)
+    def _use_fixture_server(self, fixture_server):
+        """httpbin 대신 로컬 픽스처 서버 사용"""
+        self.server = fixture_server
     
     def _take_failure_screenshot(self, test_name):
         """테스트 실패 시 스크린샷 촬영"""
@@ -75,7 +49,7 @@ class TestUbuntuServer:
         test_name = "test_basic_connection"
         try:
             # 간단한 페이지 로드
-            self.driver.get("https://www.hanatour.com")
+            self.driver.get(self.server.base_url)
             
             # 페이지 제목 확인
             assert "httpbin" in self.driver.title.lower()
@@ -130,7 +104,7 @@ class TestUbuntuServer:
         test_name = "test_screenshot_capture"
         try:
             # 테스트 페이지 로드
-            self.driver.get("https://httpbin.org/html")
+            self.driver.get(self.server.url("html"))
             
             # 스크린샷 디렉토리 생성
             screenshot_dir = "reports/screenshots"
@@ -157,9 +131,9 @@ class TestUbuntuServer:
         try:
             # 여러 페이지를 순차적으로 로드하여 메모리 사용량 테스트
             test_urls = [
-                "https://httpbin.org/get",
-                "https://httpbin.org/headers",
-                "https://httpbin.org/user-agent"
+                self.server.url("get"),
+                self.server.url("headers"),
+                self.server.url("user-agent")
             ]
             
             for url in test_urls:
@@ -181,7 +155,7 @@ class TestUbuntuServer:
         test_name = "test_error_handling"
         try:
             # 존재하지 않는 페이지 접근
-            self.driver.get("https://httpbin.org/status/404")
+            self.driver.get(self.server.url("status/404"))
             
             # 404 상태 확인
             assert "404" in self.driver.page_source
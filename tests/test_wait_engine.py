@@ -0,0 +1,88 @@
+"""
+BasePage 대기 엔진 테스트
+실제 브라우저 없이 가짜 드라이버로 대기 동작을 확인합니다.
+"""
+import time
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+from pages.base_page import BasePage
+from pages.wait_engine import WaitEngine
+
+
+class FakeElement:
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+
+class FakeDriver:
+    """지정한 시점 이후에만 요소를 찾을 수 있는 가짜 드라이버"""
+
+    def __init__(self, appear_after=0.0, present=True):
+        self.created = time.monotonic()
+        self.appear_after = appear_after
+        self.present = present
+        self.implicit_wait = None
+        self.find_calls = 0
+
+    def implicitly_wait(self, seconds):
+        self.implicit_wait = seconds
+
+    def find_element(self, by, value):
+        self.find_calls += 1
+        if self.present and time.monotonic() - self.created >= self.appear_after:
+            return FakeElement()
+        raise NoSuchElementException(value)
+
+
+class SearchPage(BasePage):
+    """테스트용 페이지 객체"""
+
+
+def test_base_page_disables_implicit_wait():
+    """BasePage가 implicit wait을 끄는지 확인"""
+    driver = FakeDriver()
+    SearchPage(driver)
+    assert driver.implicit_wait == 0
+
+
+def test_until_backs_off_polling():
+    """폴링 간격이 점진적으로 늘어나 호출 횟수가 제한되는지 확인"""
+    driver = FakeDriver(present=False)
+    engine = WaitEngine(driver, 'page', initial_poll=0.01, max_poll=0.1, backoff=2)
+
+    with pytest.raises(TimeoutException):
+        engine.until(lambda d: d.find_element(By.ID, 'missing'), timeout=0.5)
+
+    # 고정 0.01초 폴링이면 약 50회, 증가 폴링이면 10회 남짓
+    assert driver.find_calls < 15
+
+
+def test_negative_check_uses_learned_budget(monkeypatch):
+    """timeout을 지정하지 않으면 한 번 찾은 요소는 학습된 시간만큼만 기다리고 실패하는지 확인"""
+    monkeypatch.setattr('config.config.TestConfig.WAIT_BUDGET_MIN', 0.2)
+    monkeypatch.setattr('config.config.TestConfig.EXPLICIT_WAIT', 5)
+    locator = (By.ID, 'results')
+
+    page = SearchPage(FakeDriver(appear_after=0.05))
+    assert page.is_element_present(locator)
+
+    page = SearchPage(FakeDriver(present=False))
+    start = time.monotonic()
+    assert not page.is_element_present(locator)
+    assert time.monotonic() - start < 1.0
+
+
+def test_explicit_timeout_is_not_shortened(monkeypatch):
+    """호출자가 지정한 timeout은 학습된 시간보다 길어도 그대로 기다리는지 확인"""
+    monkeypatch.setattr('config.config.TestConfig.WAIT_BUDGET_MIN', 0.2)
+    locator = (By.ID, 'suggestions')
+
+    page = SearchPage(FakeDriver(appear_after=0.05))
+    assert page.is_element_visible(locator, timeout=5)
+
+    page = SearchPage(FakeDriver(appear_after=0.6))
+    assert page.is_element_visible(locator, timeout=5)
@@ -0,0 +1,75 @@
+"""
+백그라운드 아티팩트 기록기
+실패 스크린샷 디코딩과 파일 쓰기를 스레드 풀에서 처리해 다음 테스트를 막지 않습니다.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+
+
+class ArtifactWriter:
+    """크기가 제한된 대기열을 가진 백그라운드 작업 실행기"""
+
+    def __init__(self, workers=2, max_pending=32):
+        """
+        ArtifactWriter 초기화
+
+        Args:
+            workers (int): 기록 스레드 수
+            max_pending (int): 대기 중인 작업 최대 개수 (가득 차면 submit이 대기)
+        """
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='artifact')
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._futures = set()
+        self._lock = threading.Lock()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        작업 예약
+
+        대기열이 가득 찬 경우 자리가 날 때까지 기다려 메모리 사용량을 제한합니다.
+
+        Args:
+            func (callable): 실행할 함수
+
+        Returns:
+            Future: 예약된 작업
+        """
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def flush(self, timeout=None):
+        """
+        예약된 작업이 모두 끝날 때까지 대기
+
+        Args:
+            timeout (float): 최대 대기 시간 (초)
+
+        Returns:
+            int: 제한 시간 안에 끝나지 않은 작업 수
+        """
+        with self._lock:
+            pending = list(self._futures)
+        _, not_done = wait(pending, timeout=timeout)
+        if not_done:
+            print(f"⚠️ 아티팩트 기록 {len(not_done)}건이 제한 시간 안에 끝나지 않았습니다")
+        return len(not_done)
+
+    def shutdown(self, timeout=None):
+        """남은 작업을 기록하고 스레드 풀 종료"""
+        self.flush(timeout)
+        self._executor.shutdown(wait=True)
+
+    def _on_done(self, future):
+        with self._lock:
+            self._futures.discard(future)
+        self._slots.release()
+        if not future.cancelled() and future.exception() is not None:
+            print(f"아티팩트 기록 실패: {future.exception()}")
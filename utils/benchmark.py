@@ -0,0 +1,263 @@
+"""
+페이지 로드 성능 벤치마크 도구
+시나리오를 워밍업 후 K번 반복 측정하고, 이상치를 제거한 백분위수를 기준선과 비교합니다.
+"""
+import json
+import math
+import os
+import platform
+import time
+
+
+def percentile(values, p):
+    """
+    백분위수 (선형 보간)
+
+    Args:
+        values (list): 측정값
+        p (float): 백분위 (0-100)
+
+    Returns:
+        float: 백분위수 (값이 없으면 None)
+    """
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * p / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def trim_outliers(values, factor=1.5):
+    """
+    사분위 범위(IQR) 밖의 이상치 제거
+
+    Args:
+        values (list): 측정값
+        factor (float): IQR 배수 (0이면 제거하지 않음)
+
+    Returns:
+        list: 이상치를 제거한 값 (측정값이 4개 미만이면 그대로)
+    """
+    if not factor or len(values) < 4:
+        return list(values)
+    q1, q3 = percentile(values, 25), percentile(values, 75)
+    margin = (q3 - q1) * factor
+    return [value for value in values if q1 - margin <= value <= q3 + margin]
+
+
+def summarize(values, factor=1.5):
+    """
+    측정값 요약 (이상치 제거 후 계산)
+
+    Args:
+        values (list): 측정값
+        factor (float): 이상치 제거 IQR 배수
+
+    Returns:
+        dict: count, trimmed, min, max, mean, p50, p90, p95, p99
+    """
+    kept = trim_outliers(values, factor)
+    if not kept:
+        return {'count': len(values), 'trimmed': len(values)}
+    return {
+        'count': len(values),
+        'trimmed': len(values) - len(kept),
+        'min': round(min(kept), 3),
+        'max': round(max(kept), 3),
+        'mean': round(sum(kept) / len(kept), 3),
+        'p50': round(percentile(kept, 50), 3),
+        'p90': round(percentile(kept, 90), 3),
+        'p95': round(percentile(kept, 95), 3),
+        'p99': round(percentile(kept, 99), 3),
+    }
+
+
+class BenchmarkRunner:
+    """시나리오 반복 측정기"""
+
+    def __init__(self, repeats=10, warmup=2, trim_factor=1.5):
+        """
+        BenchmarkRunner 초기화
+
+        Args:
+            repeats (int): 측정 반복 횟수
+            warmup (int): 결과에서 제외할 워밍업 실행 횟수
+            trim_factor (float): 이상치 제거 IQR 배수 (0이면 제거하지 않음)
+        """
+        self.repeats = max(1, int(repeats))
+        self.warmup = max(0, int(warmup))
+        self.trim_factor = trim_factor
+        self.samples = {}    # 시나리오 → {지표: [측정값]}
+
+    def measure(self, name, scenario):
+        """
+        시나리오 반복 실행
+
+        시나리오가 dict를 반환하면 각 값(ms)을 지표로 함께 기록합니다.
+        실행 시간은 'duration' 지표(ms)로 기록되며, 시나리오가 'duration'을 직접 반환하면
+        (예: 지표 수집 시간을 제외한 측정) 그 값을 사용합니다.
+
+        Args:
+            name (str): 시나리오 이름
+            scenario (callable): 인자 없이 호출되는 측정 대상
+        """
+        samples = self.samples.setdefault(name, {})
+        for iteration in range(self.warmup + self.repeats):
+            start = time.perf_counter()
+            extra = scenario() or {}
+            elapsed = (time.perf_counter() - start) * 1000
+            if iteration < self.warmup:
+                continue
+            extra = dict(extra)
+            samples.setdefault('duration', []).append(float(extra.pop('duration', elapsed)))
+            for metric, value in extra.items():
+                if isinstance(value, (int, float)):
+                    samples.setdefault(metric, []).append(float(value))
+
+    def results(self):
+        """
+        시나리오/지표별 요약
+
+        Returns:
+            dict: 시나리오 → 지표 → summarize 결과
+        """
+        return {
+            name: {metric: summarize(values, self.trim_factor) for metric, values in metrics.items()}
+            for name, metrics in self.samples.items()
+        }
+
+
+def compare_to_baseline(results, baseline, threshold=0.2, stat='p95', min_delta=0.0):
+    """
+    기준선 대비 성능 저하 확인
+
+    Args:
+        results (dict): BenchmarkRunner.results 결과
+        baseline (dict): 기준선 결과 (같은 형식)
+        threshold (float): 허용 증가율 (0.2면 기준선보다 20% 넘게 느려지면 저하)
+        stat (str): 비교할 통계값
+        min_delta (float): 저하로 판단할 최소 절대 증가량 (측정 단위, 아주 작은 값의 잡음 무시)
+
+    Returns:
+        list: 저하 항목 dict 리스트 (scenario, metric, baseline, current, change)
+    """
+    regressions = []
+    for name, metrics in results.items():
+        for metric, summary in metrics.items():
+            previous = baseline.get(name, {}).get(metric, {}).get(stat)
+            current = summary.get(stat)
+            if previous is None or current is None or previous <= 0:
+                continue
+            change = (current - previous) / previous
+            if change > threshold and current - previous > min_delta:
+                regressions.append({
+                    'scenario': name,
+                    'metric': metric,
+                    'baseline': previous,
+                    'current': current,
+                    'change': round(change, 4),
+                })
+    return regressions
+
+
+def load_baseline(path):
+    """
+    기준선 파일 읽기
+
+    Returns:
+        dict: write_benchmark_json 형식 데이터 (meta, results), 없으면 None
+    """
+    try:
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data.get('results'), dict) else None
+
+
+def write_benchmark_json(path, results, **meta):
+    """
+    벤치마크 결과를 기계 판독 가능한 JSON으로 저장 (기준선 파일과 같은 형식)
+
+    Args:
+        path (str): 저장 경로
+        results (dict): BenchmarkRunner.results 결과
+        **meta: 함께 기록할 정보 (반복 횟수, 저하 항목 등)
+    """
+    data = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'host': platform.node(),
+        'meta': meta,
+        'results': results,
+    }
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+
+
+def baseline_results(baseline_path, target):
+    """
+    같은 측정 대상(target)의 기준선 결과
+
+    Returns:
+        dict: 기준선 results (없거나 대상이 다르면 None)
+    """
+    stored = load_baseline(baseline_path)
+    if not stored or stored.get('meta', {}).get('target') != target:
+        return None
+    return stored['results']
+
+
+def finish_benchmark(results, target, baseline_path, output_path, threshold=0.2,
+                     update_baseline=False, min_delta=0.0, **meta):
+    """
+    결과를 기준선과 비교하고 결과 파일 저장 및 요약 출력
+
+    update_baseline일 때만 결과를 새 기준선으로 저장합니다 (기준선이 없으면 비교하지 않고 경고만 출력).
+    기준선의 측정 대상(target)이 다르면 비교하지 않습니다.
+
+    Args:
+        results (dict): BenchmarkRunner.results 결과
+        target (str): 측정 대상 (기준선과 같은 대상끼리만 비교)
+        baseline_path (str): 기준선 파일
+        output_path (str): 결과 파일
+        threshold (float): p95 허용 증가율
+        update_baseline (bool): 결과를 새 기준선으로 저장
+        min_delta (float): 저하로 판단할 최소 절대 증가량
+        **meta: 결과 파일에 함께 기록할 정보
+
+    Returns:
+        list: 성능 저하 항목 (compare_to_baseline 결과)
+    """
+    stored = None if update_baseline else load_baseline(baseline_path)
+    baseline = stored['results'] if stored else None
+    if stored and stored.get('meta', {}).get('target') != target:
+        print(f"⚠️ 기준선의 측정 대상이 다릅니다 ({stored.get('meta', {}).get('target')}): 비교하지 않습니다")
+        baseline = {}
+    regressions = compare_to_baseline(results, baseline or {}, threshold, min_delta=min_delta)
+
+    meta.update({
+        'target': target,
+        'threshold': threshold,
+        'min_delta': min_delta,
+        'baseline': baseline_path if baseline else None,
+        'regressions': regressions,
+    })
+    write_benchmark_json(output_path, results, **meta)
+
+    for name, metrics in results.items():
+        for metric, summary in metrics.items():
+            print(f"  {name:28} {metric:20} p50 {summary.get('p50')}  p95 {summary.get('p95')}"
+                  f"  (이상치 {summary['trimmed']}개 제외)")
+
+    if update_baseline:
+        write_benchmark_json(baseline_path, results, **dict(meta, regressions=[]))
+        print(f"📌 기준선 저장: {baseline_path}")
+    elif baseline is None:
+        print(f"⚠️ 기준선이 없어 비교하지 않았습니다: {baseline_path} (--update-baseline으로 저장 후 커밋)")
+    for regression in regressions:
+        print(f"❌ 성능 저하: {regression['scenario']}/{regression['metric']} p95 "
+              f"{regression['baseline']} → {regression['current']} (+{regression['change'] * 100:.1f}%)")
+    print(f"📊 벤치마크 결과: {output_path}")
+    return regressions
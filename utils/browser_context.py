@@ -0,0 +1,60 @@
+"""
+CDP 브라우저 컨텍스트 격리
+Chrome 프로세스 하나를 유지한 채 테스트마다 새 incognito 브라우저 컨텍스트를 만들어
+쿠키, storage, 캐시를 격리합니다. 브라우저를 새로 띄우는 것보다 훨씬 빠릅니다.
+"""
+import time
+
+
+class BrowserContext:
+    """테스트 하나에 할당되는 격리된 브라우저 컨텍스트"""
+
+    def __init__(self, driver, context_id, target_id, host_handle):
+        self.driver = driver
+        self.context_id = context_id
+        self.target_id = target_id
+        self.host_handle = host_handle
+
+    @classmethod
+    def open(cls, driver, window_size=None, timeout=5):
+        """
+        새 브라우저 컨텍스트와 탭을 만들고 드라이버를 그 탭으로 전환
+
+        Args:
+            driver: Chrome WebDriver (execute_cdp_cmd 지원 필요)
+            window_size (tuple): 새 탭의 창 크기 (width, height)
+            timeout (float): 새 탭이 window handle로 보일 때까지 기다릴 시간 (초)
+
+        Returns:
+            BrowserContext: 열린 컨텍스트
+        """
+        host_handle = driver.current_window_handle
+        context_id = driver.execute_cdp_cmd(
+            'Target.createBrowserContext', {'disposeOnDetach': True}
+        )['browserContextId']
+
+        params = {'url': 'about:blank', 'browserContextId': context_id}
+        if window_size:
+            params['width'], params['height'] = window_size
+        target_id = driver.execute_cdp_cmd('Target.createTarget', params)['targetId']
+
+        # ChromeDriver는 DevTools target id를 window handle로 사용
+        deadline = time.monotonic() + timeout
+        while target_id not in driver.window_handles:
+            if time.monotonic() > deadline:
+                driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context_id})
+                raise RuntimeError(f"새 브라우저 컨텍스트의 탭을 찾을 수 없습니다: {target_id}")
+            time.sleep(0.05)
+
+        driver.switch_to.window(target_id)
+        return cls(driver, context_id, target_id, host_handle)
+
+    def close(self):
+        """컨텍스트와 그 안의 모든 탭을 폐기하고 원래 탭으로 복귀"""
+        try:
+            # CDP 명령은 현재 탭을 통해 전달되므로 먼저 호스트 탭으로 전환
+            self.driver.switch_to.window(self.host_handle)
+        finally:
+            self.driver.execute_cdp_cmd(
+                'Target.disposeBrowserContext', {'browserContextId': self.context_id}
+            )
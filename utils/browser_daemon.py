@@ -0,0 +1,352 @@
+"""
+상주 브라우저 데몬
+미리 실행해 둔 Chrome/chromedriver 세션을 pytest 실행 사이에도 유지하고, 로컬 Unix 소켓으로 대여합니다.
+테스트 프로세스는 새 브라우저를 띄우는 대신 대여받은 세션(chromedriver 주소 + session id)에 연결하므로
+개발 중 테스트 하나를 다시 실행할 때 브라우저 실행과 드라이버 설정 시간이 들지 않습니다.
+
+소켓은 실행한 사용자만 접근할 수 있도록(0600) 만들고, 클라이언트는 자신이 소유한 소켓에만 연결합니다.
+
+프로토콜 (JSON 한 줄 요청/응답):
+    {"cmd": "acquire", "config": {...}} → {"ok": true, "executor_url": ..., "session_id": ..., "capabilities": {...}}
+        연결이 유지되는 동안 대여 상태이며, 연결이 끊기면 상태를 초기화해 반납됩니다.
+        요청한 브라우저 설정(config)이 데몬 세션의 설정과 다르면 {"ok": false, "error": "config", "config": {...}}
+    {"cmd": "status"}  → {"ok": true, "size": N, "idle": M, "config": {...}}
+    {"cmd": "shutdown"} → {"ok": true}
+
+사용법:
+    python run_tests.py --daemon [--daemon-size=2]
+"""
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+
+# Unix 소켓과 소유자 확인(getuid)이 없는 플랫폼(Windows)에서는 데몬을 사용하지 않음
+SUPPORTED = hasattr(socket, 'AF_UNIX') and hasattr(os, 'getuid')
+
+
+def request(socket_path, message, timeout=2):
+    """
+    데몬에 요청을 보내고 응답 수신
+
+    Args:
+        socket_path (str): 데몬 소켓 경로
+        message (dict): 요청
+        timeout (float): 연결/응답 타임아웃 (초)
+
+    Returns:
+        tuple: (응답 dict, 열린 소켓) - 대여(acquire) 중에는 소켓을 닫지 않아야 함
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+        reader = sock.makefile('rb')
+        line = reader.readline()
+        reader.close()
+    except OSError:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return json.loads(line or b'{}'), sock
+
+
+class AttachedDriver(RemoteWebDriver):
+    """데몬이 대여한 기존 chromedriver 세션에 연결한 WebDriver (quit하면 브라우저를 끄지 않고 반납)"""
+
+    def __init__(self, executor_url, session_id, capabilities, lease):
+        """
+        AttachedDriver 초기화
+
+        Args:
+            executor_url (str): chromedriver 주소
+            session_id (str): 대여받은 세션 id
+            capabilities (dict): 세션 capabilities
+            lease (socket.socket): 대여 연결 (닫으면 반납)
+        """
+        self._attach = (session_id, capabilities)
+        self._lease = lease
+        super().__init__(command_executor=executor_url, options=ChromeOptions())
+
+    def start_session(self, capabilities):
+        # 새 세션을 만들지 않고 대여받은 세션 사용
+        self.session_id, self.caps = self._attach
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        """Chrome DevTools Protocol 명령 실행 (ChromeDriver와 동일)"""
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def quit(self):
+        """세션을 종료하지 않고 데몬에 반납"""
+        if self._lease is not None:
+            self._lease.close()
+            self._lease = None
+
+
+def is_own_socket(socket_path):
+    """현재 사용자가 소유한 소켓인지 확인 (다른 사용자가 만든 소켓의 세션은 사용하지 않음)"""
+    if not SUPPORTED:
+        return False
+    try:
+        return os.stat(socket_path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def attach(socket_path, config=None):
+    """
+    데몬에서 유휴 세션을 대여해 연결
+
+    Args:
+        socket_path (str): 데몬 소켓 경로
+        config (dict): 요청하는 브라우저 설정 (데몬 세션 설정과 다르면 대여하지 않음)
+
+    Returns:
+        AttachedDriver: 연결된 드라이버 (데몬이 없거나, 유휴 세션이 없거나, 설정이 다르면 None)
+    """
+    try:
+        response, lease = request(socket_path, {'cmd': 'acquire', 'config': config})
+    except (OSError, ValueError):
+        return None
+    if not response.get('ok'):
+        lease.close()
+        if response.get('error') == 'config':
+            print(f"⚠️ 브라우저 데몬 설정({response.get('config')})이 요청({config})과 달라 새 브라우저를 실행합니다")
+        else:
+            print("⚠️ 브라우저 데몬에 유휴 세션이 없어 새 브라우저를 실행합니다")
+        return None
+    try:
+        return AttachedDriver(response['executor_url'], response['session_id'], response['capabilities'], lease)
+    except Exception:
+        lease.close()
+        raise
+
+
+class _LeaseHandler(socketserver.StreamRequestHandler):
+    """연결 하나 = 요청 하나 (acquire는 연결이 끊길 때까지 대여)"""
+
+    def handle(self):
+        daemon = self.server.daemon
+        try:
+            message = json.loads(self.rfile.readline() or b'{}')
+        except ValueError:
+            message = {}
+        command = message.get('cmd')
+
+        if command == 'status':
+            self._reply({'ok': True, **daemon.status(), 'config': daemon.config})
+        elif command == 'shutdown':
+            self._reply({'ok': True})
+            threading.Thread(target=daemon.stop, daemon=True).start()
+        elif command == 'acquire':
+            if message.get('config') != daemon.config:
+                self._reply({'ok': False, 'error': 'config', 'config': daemon.config})
+                return
+            slot = daemon.acquire()
+            if slot is None:
+                self._reply({'ok': False, 'error': 'busy'})
+                return
+            try:
+                driver = slot['driver']
+                self._reply({
+                    'ok': True,
+                    'executor_url': driver.command_executor._url,
+                    'session_id': driver.session_id,
+                    'capabilities': driver.capabilities,
+                })
+                # 클라이언트가 연결을 닫을 때까지 대기
+                while self.rfile.read(4096):
+                    pass
+            except OSError:
+                pass
+            finally:
+                daemon.release(slot)
+        else:
+            self._reply({'ok': False, 'error': f"unknown command: {command}"})
+
+    def _reply(self, data):
+        self.wfile.write(json.dumps(data).encode('utf-8') + b'\n')
+        self.wfile.flush()
+
+
+def _reset_returned(driver):
+    """반납된 드라이버의 요청 차단 해제 후 상태 초기화"""
+    from utils.driver_factory import DriverFactory
+    DriverFactory.unblock_resources(driver)
+    DriverFactory.reset_driver(driver)
+
+
+class BrowserDaemon:
+    """미리 실행한 브라우저 세션을 Unix 소켓으로 대여하는 서버"""
+
+    def __init__(self, socket_path, size=1, create=None, reset=None, destroy=None, config=None):
+        """
+        BrowserDaemon 초기화
+
+        Args:
+            socket_path (str): Unix 소켓 경로
+            size (int): 유지할 브라우저 수
+            create (callable): 드라이버 생성 함수 (기본값: DriverFactory.get_driver)
+            reset (callable): 반납 시 상태 초기화 함수 (기본값: 네트워크 차단 해제 후 DriverFactory.reset_driver)
+            destroy (callable): 드라이버 종료 함수 (기본값: DriverFactory.quit_driver)
+            config (dict): 세션의 브라우저 설정 (대여 요청의 설정과 같아야 대여,
+                기본값: DriverFactory.daemon_config()로 현재 설정에서 계산)
+        """
+        if create is None or reset is None or destroy is None or config is None:
+            from utils.driver_factory import DriverFactory
+            create = create or (lambda: DriverFactory.get_driver('chrome'))
+            reset = reset or _reset_returned
+            destroy = destroy or DriverFactory.quit_driver
+            config = config or DriverFactory.daemon_config()
+        self.config = config
+        self.socket_path = socket_path
+        self.size = max(1, int(size))
+        self._create = create
+        self._reset = reset
+        self._destroy = destroy
+        self._slots = []
+        self._lock = threading.Lock()
+        self._server = None
+        self._stopped = threading.Event()
+
+    def start(self):
+        """브라우저를 미리 실행하고 소켓 대기 시작 (이미 실행 중인 데몬이 있거나 지원하지 않는 플랫폼이면 RuntimeError)"""
+        if not SUPPORTED:
+            raise RuntimeError("브라우저 데몬은 Unix 소켓을 지원하는 플랫폼에서만 실행할 수 있습니다")
+        if os.path.exists(self.socket_path):
+            try:
+                request(self.socket_path, {'cmd': 'status'})[1].close()
+                raise RuntimeError(f"이미 실행 중인 브라우저 데몬이 있습니다: {self.socket_path}")
+            except OSError:
+                os.remove(self.socket_path)
+
+        for _ in range(self.size):
+            self._slots.append({'driver': self._create(), 'busy': False})
+        self._server = socketserver.ThreadingUnixStreamServer(self.socket_path, _LeaseHandler,
+                                                              bind_and_activate=False)
+        # 다른 사용자가 세션을 대여(브라우저 조작)하지 못하도록 소켓은 소유자만 접근 가능하게 생성
+        umask = os.umask(0o177)
+        try:
+            self._server.server_bind()
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, 0o600)
+        self._server.server_activate()
+        self._server.daemon_threads = True
+        self._server.daemon = self
+        threading.Thread(target=self._server.serve_forever, name='browser-daemon', daemon=True).start()
+        return self
+
+    def status(self):
+        """전체/유휴 세션 수"""
+        with self._lock:
+            return {'size': len(self._slots), 'idle': sum(1 for slot in self._slots if not slot['busy'])}
+
+    def acquire(self):
+        """
+        유휴 세션 대여 (응답하지 않는 브라우저는 새로 실행해 교체)
+
+        Returns:
+            dict: 슬롯 (driver, busy), 유휴 세션이 없으면 None
+        """
+        with self._lock:
+            slot = next((slot for slot in self._slots if not slot['busy']), None)
+            if slot is None:
+                return None
+            slot['busy'] = True
+        try:
+            slot['driver'].window_handles
+        except Exception:
+            self._replace(slot)
+        return slot
+
+    def release(self, slot):
+        """반납된 세션 상태 초기화 (실패하면 브라우저 교체)"""
+        try:
+            self._reset(slot['driver'])
+        except Exception as e:
+            print(f"반납된 브라우저 초기화 실패, 새로 실행합니다: {e}")
+            self._replace(slot)
+        with self._lock:
+            slot['busy'] = False
+
+    def _replace(self, slot):
+        try:
+            self._destroy(slot['driver'])
+        except Exception:
+            pass
+        slot['driver'] = self._create()
+
+    def wait(self):
+        """stop이 호출될 때까지 대기"""
+        while not self._stopped.wait(1):
+            pass
+
+    def stop(self):
+        """소켓 서버와 모든 브라우저 종료"""
+        if self._stopped.is_set():
+            return
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        for slot in self._slots:
+            try:
+                self._destroy(slot['driver'])
+            except Exception:
+                pass
+        self._slots = []
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+def main(argv=None):
+    """명령행 실행: 데몬 시작 (--stop: 실행 중인 데몬 종료, --status: 상태 확인)"""
+    from config.config import TestConfig
+    socket_path = TestConfig.BROWSER_DAEMON_SOCKET
+    size = TestConfig.BROWSER_DAEMON_SIZE
+    action = 'start'
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--daemon-size="):
+            size = int(arg.split("=")[1])
+        elif arg in ("--stop", "--status"):
+            action = arg[2:]
+
+    if not SUPPORTED:
+        print("❌ 브라우저 데몬은 Unix 소켓을 지원하는 플랫폼(Linux/macOS)에서만 사용할 수 있습니다")
+        return 1
+
+    if action != 'start':
+        try:
+            response, sock = request(socket_path, {'cmd': 'shutdown' if action == 'stop' else 'status'})
+            sock.close()
+        except OSError:
+            print(f"❌ 실행 중인 브라우저 데몬이 없습니다: {socket_path}")
+            return 1
+        print(f"🔥 브라우저 데몬 {'종료 요청' if action == 'stop' else '상태'}: {response}")
+        return 0
+
+    # 데몬 자신은 새 브라우저를 실행해야 하므로 데몬 연결과 미리 실행 사용 안 함
+    TestConfig.BROWSER_DAEMON = 'off'
+    TestConfig.DRIVER_PREWARM = 0
+    daemon = BrowserDaemon(socket_path, size)
+    print(f"🔥 브라우저 {daemon.size}개 실행 중...")
+    daemon.start()
+    print(f"🔥 브라우저 데몬 대기 중: {socket_path} (Ctrl+C로 종료)")
+    try:
+        daemon.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.stop()
+        print("🧹 브라우저 데몬 종료")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
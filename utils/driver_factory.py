@@ -5,10 +5,19 @@ from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 from config.config import TestConfig
+from utils.driver_pool import DriverPool
+from utils.port_allocator import PortAllocator
+from utils.driver_resolver import DriverResolver
+from utils.driver_strategy import DriverStrategyProbe
+from utils.browser_context import BrowserContext
+from utils.screenshot_store import ScreenshotStore
+from utils.replay_proxy import ReplayProxy
+from utils import browser_daemon
+from utils.prewarm import DriverPrewarmer
+from utils.resource_blocking import blocked_url_patterns, chrome_prefs, apply_blocking, clear_blocking
+from utils.timing import timings, timed, LAUNCH, CONFIGURE, TEARDOWN
+import base64
 import os
 import time
 import traceback
@@ -17,27 +26,282 @@ import traceback
 class DriverFactory:
     """WebDriver 팩토리 클래스"""
     
+    # 세션 단위로 공유되는 드라이버 풀
+    _pool = None
+    
+    # 컨텍스트 격리 모드에서 공유하는 Chrome 드라이버 (프로세스당 하나)
+    _context_host = None
+    
+    # 프로세스 간 디버깅 포트 예약
+    _port_allocator = PortAllocator(TestConfig.PORT_LOCK_DIR)
+    _allocated_ports = set()
+    
+    # 드라이버 실행 파일 캐시 (프로세스당 한 번만 확인)
+    _resolver = DriverResolver(TestConfig.DRIVER_CACHE_DIR, offline=TestConfig.DRIVER_OFFLINE)
+    
+    # 성공한 드라이버 실행 전략 기억 (세션 + 디스크 TTL)
+    _strategy_probe = DriverStrategyProbe(
+        _resolver,
+        os.path.join(TestConfig.DRIVER_CACHE_DIR, 'strategy.json'),
+        ttl=TestConfig.DRIVER_STRATEGY_TTL,
+    )
+    
+    # 내용 주소 기반 스크린샷 저장소 (get_screenshot_store로 접근)
+    _screenshot_store = None
+    
+    # 다음 드라이버를 미리 실행해 두는 백그라운드 스레드와 대상 (browser, headless, profile)
+    _prewarmer = None
+    _prewarm_key = None
+    
+    # HTTP 기록/재생 프록시 (REPLAY_MODE 설정 시 get_replay_proxy로 시작)
+    _replay_proxy = None
+    
+    # 리소스 차단을 적용하는 Chrome 옵션 프로필 (PROFILE_BLOCK_RESOURCES)
+    _BLOCKING_PROFILES = ('ubuntu', 'fast')
+    
+    _DRIVER_CLASSES = {
+        'chrome': (webdriver.Chrome, ChromeService),
+        'firefox': (webdriver.Firefox, FirefoxService),
+        'edge': (webdriver.Edge, EdgeService),
+    }
+    
     @staticmethod
-    def get_driver(browser=None, headless=None):
-        """WebDriver 인스턴스 생성"""
+    @timed(LAUNCH)
+    def get_driver(browser=None, headless=None, profile=None):
+        """
+        WebDriver 인스턴스 생성
+        
+        Args:
+            browser (str): 브라우저 (기본값: TestConfig.BROWSER)
+            headless (bool): 헤드리스 여부 (기본값: TestConfig.HEADLESS)
+            profile (str): 옵션 프로필 (chrome 전용, 'ubuntu': 서버용 최적화 옵션,
+                'fast': 이미지/폰트/미디어/분석/광고 요청 차단)
+        """
         browser = browser or TestConfig.BROWSER
         headless = headless if headless is not None else TestConfig.HEADLESS
+        if browser not in DriverFactory._DRIVER_CLASSES:
+            raise ValueError(f"지원하지 않는 브라우저: {browser}")
         
+        if browser == 'chrome' and profile is None:
+            driver = DriverFactory.attach_daemon_driver(headless)
+            if driver is not None:
+                return driver
+        
+        prewarmer = DriverFactory.start_prewarm(browser, headless, profile)
+        if prewarmer is not None:
+            driver = prewarmer.take()
+            if driver is not None:
+                return driver
+        return DriverFactory._start_driver(browser, headless, profile)
+    
+    @staticmethod
+    def _start_driver(browser, headless, profile):
+        """브라우저 실행과 설정"""
         if browser == 'chrome':
-            driver = DriverFactory._create_chrome_driver(headless)
+            driver = DriverFactory._create_chrome_driver(headless, profile)
         elif browser == 'firefox':
             driver = DriverFactory._create_firefox_driver(headless)
-        elif browser == 'edge':
-            driver = DriverFactory._create_edge_driver(headless)
         else:
-            raise ValueError(f"지원하지 않는 브라우저: {browser}")
+            driver = DriverFactory._create_edge_driver(headless)
         
         DriverFactory._configure_driver(driver)
+        if browser == 'chrome' and profile in DriverFactory._BLOCKING_PROFILES:
+            DriverFactory.block_resources(driver, TestConfig.PROFILE_BLOCK_RESOURCES)
         return driver
     
     @staticmethod
-    def _create_chrome_driver(headless=False):
-        """Chrome WebDriver 생성"""
+    def get_ubuntu_driver():
+        """Ubuntu 서버(헤드리스)에 최적화된 Chrome WebDriver 생성"""
+        return DriverFactory.get_driver('chrome', headless=True, profile='ubuntu')
+    
+    @staticmethod
+    def start_prewarm(browser=None, headless=None, profile=None):
+        """
+        DRIVER_PREWARM이 설정되어 있으면 다음 드라이버 미리 실행 시작 (프로세스당 한 가지 설정만)
+        
+        Args:
+            browser (str): 브라우저 (기본값: TestConfig.BROWSER)
+            headless (bool): 헤드리스 여부 (기본값: TestConfig.HEADLESS)
+            profile (str): 옵션 프로필
+            
+        Returns:
+            DriverPrewarmer: 이 설정의 드라이버를 미리 실행하는 스레드 (사용 안 함/다른 설정이면 None)
+        """
+        if TestConfig.DRIVER_PREWARM <= 0:
+            return None
+        key = (browser or TestConfig.BROWSER,
+               headless if headless is not None else TestConfig.HEADLESS,
+               profile)
+        if DriverFactory._prewarmer is None:
+            DriverFactory._prewarm_key = key
+            DriverFactory._prewarmer = DriverPrewarmer(
+                create=lambda: DriverFactory._prewarm_driver(*key),
+                destroy=DriverFactory.quit_driver,
+                count=TestConfig.DRIVER_PREWARM,
+                min_available_mb=TestConfig.DRIVER_PREWARM_MIN_AVAILABLE_MB,
+            ).start()
+            print(f"⚡ 드라이버 미리 실행 시작: {key[0]} {TestConfig.DRIVER_PREWARM}개 "
+                  f"(최소 여유 메모리 {TestConfig.DRIVER_PREWARM_MIN_AVAILABLE_MB}MB)")
+        if DriverFactory._prewarm_key != key:
+            return None
+        return DriverFactory._prewarmer
+    
+    @staticmethod
+    def _prewarm_driver(browser, headless, profile):
+        """미리 실행 스레드에서 드라이버 생성 (테스트와 겹쳐 실행되므로 테스트 타이밍에 기록하지 않음)"""
+        timings.mute_thread()
+        return DriverFactory._start_driver(browser, headless, profile)
+    
+    @staticmethod
+    def stop_prewarm():
+        """미리 실행을 멈추고 사용되지 않은 드라이버 종료"""
+        prewarmer = DriverFactory._prewarmer
+        if prewarmer is not None:
+            prewarmer.stop()
+            DriverFactory._prewarmer = None
+            DriverFactory._prewarm_key = None
+            stats = prewarmer.stats
+            print(f"⚡ 드라이버 미리 실행 종료: 실행 {stats['spawned']}, 사용 {stats['hits']}, "
+                  f"직접 실행 {stats['misses']}, 메모리 부족 대기 {stats['low_memory']}, 실패 {stats['failed']}")
+    
+    @staticmethod
+    def attach_daemon_driver(headless=None):
+        """
+        브라우저 데몬(run_tests.py --daemon)이 실행 중이면 유휴 세션을 대여
+        
+        데몬 세션은 이미 설정이 끝난 상태라 실행/설정 단계를 모두 건너뜁니다.
+        quit하면 브라우저를 종료하지 않고 데몬에 반납합니다.
+        
+        Args:
+            headless (bool): 요청한 헤드리스 여부 (기본값: TestConfig.HEADLESS, 데몬 세션과 다르면 대여 안 함)
+        
+        Returns:
+            WebDriver: 대여한 드라이버 (데몬 사용 안 함/미실행/유휴 세션 없음/설정이 다르면 None)
+        """
+        # 기록/재생 프록시는 프로세스마다 따로 시작되므로 데몬 세션과 함께 쓸 수 없음
+        if TestConfig.BROWSER_DAEMON == 'off' or TestConfig.REPLAY_MODE or not browser_daemon.SUPPORTED:
+            return None
+        socket_path = TestConfig.BROWSER_DAEMON_SOCKET
+        if not os.path.exists(socket_path):
+            return None
+        if not browser_daemon.is_own_socket(socket_path):
+            print(f"⚠️ 다른 사용자의 브라우저 데몬 소켓이라 사용하지 않습니다: {socket_path}")
+            return None
+        return browser_daemon.attach(socket_path, DriverFactory.daemon_config(headless))
+    
+    @staticmethod
+    def daemon_config(headless=None):
+        """
+        데몬 세션과 비교할 브라우저 설정 (같아야 데몬 세션을 대여)
+        
+        Args:
+            headless (bool): 헤드리스 여부 (기본값: TestConfig.HEADLESS)
+        
+        Returns:
+            dict: 브라우저, 헤드리스 여부, 창 크기, 페이지 로드 타임아웃
+        """
+        return {
+            'browser': 'chrome',
+            'headless': TestConfig.HEADLESS if headless is None else bool(headless),
+            'window_size': [TestConfig.WINDOW_WIDTH, TestConfig.WINDOW_HEIGHT],
+            'page_load_timeout': TestConfig.PAGE_LOAD_TIMEOUT,
+        }
+    
+    @staticmethod
+    def get_replay_proxy():
+        """REPLAY_MODE가 설정되어 있으면 기록/재생 프록시 반환 (프로세스당 하나, 최초 호출 시 시작)"""
+        mode = TestConfig.REPLAY_MODE
+        if not mode:
+            return None
+        proxy = DriverFactory._replay_proxy
+        if proxy is None or proxy.mode != mode:
+            DriverFactory.stop_replay_proxy()
+            proxy = ReplayProxy(TestConfig.REPLAY_ARCHIVE, mode, ca_dir=TestConfig.REPLAY_CA_DIR).start()
+            DriverFactory._replay_proxy = proxy
+            print(f"🔁 HTTP {mode} 프록시 시작: {proxy.address} (아카이브: {TestConfig.REPLAY_ARCHIVE})")
+        return proxy
+    
+    @staticmethod
+    def stop_replay_proxy():
+        """기록/재생 프록시 종료"""
+        proxy = DriverFactory._replay_proxy
+        if proxy is not None:
+            proxy.stop()
+            DriverFactory._replay_proxy = None
+            stats = proxy.stats
+            print(f"🔁 HTTP {proxy.mode} 프록시 종료: 기록 {stats['recorded']}, 재생 {stats['replayed']}, "
+                  f"미기록 {stats['missed']}, HTTPS 복호화 {stats['intercepted']}, "
+                  f"HTTPS 통과 {stats['tunneled']}, HTTPS 거부 {stats['refused']}")
+    
+    @staticmethod
+    def _apply_replay_proxy(browser, options):
+        """기록/재생 프록시를 브라우저 옵션에 설정 (localhost 요청은 프록시를 거치지 않음)"""
+        proxy = DriverFactory.get_replay_proxy()
+        if proxy is None:
+            return
+        if proxy.ca is not None:
+            # HTTPS는 프록시의 로컬 CA가 발급한 인증서로 응답하므로 인증서 오류 무시
+            options.accept_insecure_certs = True
+        if browser == 'firefox':
+            options.set_preference('network.proxy.type', 1)
+            for scheme in ('http', 'ssl'):
+                options.set_preference(f'network.proxy.{scheme}', proxy.host)
+                options.set_preference(f'network.proxy.{scheme}_port', proxy.port)
+        else:
+            options.add_argument(f'--proxy-server=http://{proxy.address}')
+    
+    @staticmethod
+    def block_resources(driver, classes=None, patterns=None):
+        """
+        리소스 분류/URL 패턴에 해당하는 네트워크 요청 차단 (Chrome CDP Network.setBlockedURLs)
+        
+        Args:
+            driver: WebDriver 인스턴스
+            classes (list|str): 리소스 분류 (images, fonts, media, analytics, ads)
+            patterns (list|str): 추가 URL 패턴 ('*'는 임의 문자열)
+            
+        Returns:
+            list: 차단한 URL 패턴 (CDP를 지원하지 않는 브라우저면 빈 리스트)
+        """
+        urls = blocked_url_patterns(classes, patterns)
+        if not urls:
+            return []
+        if not apply_blocking(driver, urls):
+            print("⚠️ 네트워크 요청 차단은 Chrome/Edge 전용입니다: 차단하지 않음")
+            return []
+        return urls
+    
+    @staticmethod
+    def unblock_resources(driver):
+        """block_resources로 설정한 요청 차단 해제 (풀에 반납하기 전에 호출)"""
+        try:
+            clear_blocking(driver)
+        except Exception as e:
+            print(f"요청 차단 해제 실패: {e}")
+    
+    @staticmethod
+    def allocate_debugging_port():
+        """다른 프로세스와 겹치지 않는 원격 디버깅 포트 예약"""
+        port = DriverFactory._port_allocator.allocate()
+        DriverFactory._allocated_ports.add(port)
+        return port
+    
+    @staticmethod
+    def release_debugging_port(port):
+        """allocate_debugging_port로 예약한 원격 디버깅 포트 해제"""
+        if port in DriverFactory._allocated_ports:
+            DriverFactory._allocated_ports.discard(port)
+            DriverFactory._port_allocator.release(port)
+    
+    @staticmethod
+    def _build_chrome_options(headless=False, profile=None):
+        """
+        Chrome 옵션 생성
+        
+        Args:
+            headless (bool): 헤드리스 여부
+            profile (str): 옵션 프로필 ('ubuntu', 'fast')
+        """
         options = TestConfig.get_browser_options()
         if headless:
             options.add_argument('--headless')
@@ -56,75 +320,46 @@ class DriverFactory:
         # 사용자 데이터 디렉토리 충돌 방지
         import tempfile
         import uuid
-        user_data_dir = tempfile.mkdtemp(prefix=f"chrome_user_data_{uuid.uuid4().hex[:8]}_")
+        worker_prefix = f"w{TestConfig.WORKER_ID}_" if TestConfig.WORKER_ID else ""
+        user_data_dir = tempfile.mkdtemp(prefix=f"chrome_user_data_{worker_prefix}{uuid.uuid4().hex[:8]}_")
         options.add_argument(f'--user-data-dir={user_data_dir}')
         options.add_argument('--no-first-run')
         options.add_argument('--no-default-browser-check')
-
-        # 시스템에 설치된 ChromeDriver를 우선적으로 사용
+        DriverFactory._apply_replay_proxy('chrome', options)
+        
+        # 이미지는 실행 시점 설정으로도 차단 (나머지 분류는 get_driver에서 CDP로 차단)
+        if profile in DriverFactory._BLOCKING_PROFILES:
+            prefs = chrome_prefs(TestConfig.PROFILE_BLOCK_RESOURCES)
+            if prefs:
+                options.add_experimental_option('prefs', prefs)
+        
+        if profile == 'ubuntu':
+            # 메모리 최적화
+            options.add_argument('--disable-background-timer-throttling')
+            options.add_argument('--disable-backgrounding-occluded-windows')
+            options.add_argument('--disable-renderer-backgrounding')
+            options.add_argument('--disable-features=TranslateUI')
+            options.add_argument('--disable-ipc-flooding-protection')
+        
+        # 원격 디버깅 포트: 고정값 또는 자동 예약 (ubuntu 프로필은 항상 자동 예약)
+        debugging_port = TestConfig.REMOTE_DEBUGGING_PORT
+        if debugging_port == 'auto' or (profile == 'ubuntu' and not debugging_port):
+            debugging_port = DriverFactory.allocate_debugging_port()
+            options.add_argument(f'--remote-debugging-port={debugging_port}')
+        elif debugging_port:
+            options.add_argument(f'--remote-debugging-port={debugging_port}')
+        
+        return options
+    
+    @staticmethod
+    def _create_chrome_driver(headless=False, profile=None):
+        """Chrome WebDriver 생성"""
+        options = DriverFactory._build_chrome_options(headless, profile)
         try:
-            driver = webdriver.Chrome(options=options)
-            DriverFactory._configure_driver(driver)
-            return driver
-        except Exception as e:
-            print(f"시스템 ChromeDriver 실패: {e}")
-            # 대안: ChromeDriverManager 사용 (캐시 정리 포함)
-            try:
-                # webdriver-manager 캐시 정리
-                import os
-                import shutil
-                wdm_cache_dir = os.path.expanduser("~/.wdm")
-                if os.path.exists(wdm_cache_dir):
-                    print(f"webdriver-manager 캐시 정리 중: {wdm_cache_dir}")
-                    shutil.rmtree(wdm_cache_dir)
-                
-                # ChromeDriverManager로 새로 다운로드
-                driver_path = ChromeDriverManager().install()
-                
-                # 실제 chromedriver 실행 파일 확인
-                if os.path.isdir(driver_path):
-                    # 디렉토리인 경우 chromedriver 파일 찾기
-                    for root, dirs, files in os.walk(driver_path):
-                        for file in files:
-                            if file == 'chromedriver' or file.startswith('chromedriver-'):
-                                driver_path = os.path.join(root, file)
-                                break
-                        if driver_path != ChromeDriverManager().install():
-                            break
-                
-                # 실행 권한 부여
-                if os.path.exists(driver_path):
-                    os.chmod(driver_path, 0o755)
-                    print(f"ChromeDriver 경로: {driver_path}")
-                
-                service = ChromeService(driver_path)
-                driver = webdriver.Chrome(service=service, options=options)
-                DriverFactory._configure_driver(driver)
-                return driver
-            except Exception as e2:
-                print(f"ChromeDriverManager도 실패: {e2}")
-                # 마지막 대안: 직접 chromedriver 경로 시도
-                try:
-                    # 일반적인 chromedriver 경로들 시도
-                    possible_paths = [
-                        '/usr/bin/chromedriver',
-                        '/usr/local/bin/chromedriver',
-                        '/snap/bin/chromedriver',
-                        'chromedriver'
-                    ]
-                    
-                    for path in possible_paths:
-                        if os.path.exists(path) and os.access(path, os.X_OK):
-                            print(f"직접 ChromeDriver 사용: {path}")
-                            service = ChromeService(path)
-                            driver = webdriver.Chrome(service=service, options=options)
-                            DriverFactory._configure_driver(driver)
-                            return driver
-                    
-                    raise Exception("사용 가능한 ChromeDriver를 찾을 수 없습니다")
-                except Exception as e3:
-                    print(f"직접 ChromeDriver 시도도 실패: {e3}")
-                    raise
+            return DriverFactory._launch('chrome', options)
+        except Exception:
+            DriverFactory._release_resources(options)
+            raise
     
     @staticmethod
     def _create_firefox_driver(headless=False):
@@ -132,23 +367,8 @@ class DriverFactory:
         options = TestConfig.get_browser_options()
         if headless:
             options.add_argument('--headless')
-        
-        try:
-            driver = webdriver.Firefox(options=options)
-            DriverFactory._configure_driver(driver)
-            return driver
-        except Exception as e:
-            print(f"시스템 GeckoDriver 실패: {e}")
-            # 대안: GeckoDriverManager 사용
-            try:
-                driver_path = GeckoDriverManager().install()
-                service = FirefoxService(driver_path)
-                driver = webdriver.Firefox(service=service, options=options)
-                DriverFactory._configure_driver(driver)
-                return driver
-            except Exception as e2:
-                print(f"GeckoDriverManager도 실패: {e2}")
-                raise
+        DriverFactory._apply_replay_proxy('firefox', options)
+        return DriverFactory._launch('firefox', options)
     
     @staticmethod
     def _create_edge_driver(headless=False):
@@ -156,90 +376,275 @@ class DriverFactory:
         options = TestConfig.get_browser_options()
         if headless:
             options.add_argument('--headless')
+        DriverFactory._apply_replay_proxy('edge', options)
+        return DriverFactory._launch('edge', options)
+    
+    @staticmethod
+    def _launch(browser, options):
+        """
+        기억된 드라이버 실행 전략으로 브라우저 실행
         
-        try:
-            driver = webdriver.Edge(options=options)
-            DriverFactory._configure_driver(driver)
-            return driver
-        except Exception as e:
-            print(f"시스템 EdgeDriver 실패: {e}")
-            # 대안: EdgeChromiumDriverManager 사용
+        전략이 실패한 경우에만 probe로 다음 전략을 찾고, 성공한 전략을 기억합니다.
+        
+        Args:
+            browser (str): chrome / firefox / edge
+            options: 브라우저 옵션
+        """
+        driver_class, service_class = DriverFactory._DRIVER_CLASSES[browser]
+        last_error = None
+        
+        for strategy, driver_path in DriverFactory._strategy_probe.candidates(browser):
             try:
-                driver_path = EdgeChromiumDriverManager().install()
-                service = EdgeService(driver_path)
-                driver = webdriver.Edge(service=service, options=options)
-                DriverFactory._configure_driver(driver)
-                return driver
-            except Exception as e2:
-                print(f"EdgeChromiumDriverManager도 실패: {e2}")
-                raise
+                service = service_class(driver_path) if driver_path else service_class()
+                driver = driver_class(service=service, options=options)
+            except Exception as e:
+                print(f"{browser} 드라이버 실행 실패 ({strategy}): {e}")
+                DriverFactory._strategy_probe.invalidate(browser)
+                last_error = e
+                continue
+            
+            DriverFactory._strategy_probe.remember(browser, strategy, driver_path)
+            driver.options = options
+            return driver
+        
+        raise last_error or Exception(f"사용 가능한 {browser} 드라이버를 찾을 수 없습니다")
     
     @staticmethod
+    @timed(CONFIGURE)
     def _configure_driver(driver):
-        """WebDriver 설정"""
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
+        """WebDriver 설정 (모든 대기는 BasePage의 WaitEngine이 처리하므로 implicit wait은 항상 0)"""
+        driver.implicitly_wait(0)
         driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
         driver.set_window_size(TestConfig.WINDOW_WIDTH, TestConfig.WINDOW_HEIGHT)
     
     @staticmethod
+    @timed(TEARDOWN)
     def quit_driver(driver):
         """WebDriver 종료"""
         if driver:
             try:
-                # 임시 사용자 데이터 디렉토리 정리
-                if hasattr(driver, 'options') and driver.options:
-                    for argument in driver.options.arguments:
-                        if argument.startswith('--user-data-dir='):
-                            import shutil
-                            import os
-                            user_data_dir = argument.split('=', 1)[1]
-                            if os.path.exists(user_data_dir):
-                                try:
-                                    shutil.rmtree(user_data_dir)
-                                    print(f"임시 디렉토리 정리됨: {user_data_dir}")
-                                except Exception as e:
-                                    print(f"임시 디렉토리 정리 실패: {e}")
-                            break
-                
                 driver.quit()
             except Exception as e:
                 print(f"드라이버 종료 중 오류: {e}")
+            
+            # 임시 사용자 데이터 디렉토리 정리 및 디버깅 포트 해제
+            if getattr(driver, 'options', None):
+                DriverFactory._release_resources(driver.options)
     
     @staticmethod
-    def take_screenshot_on_failure(driver, test_name=None, error_info=None):
-        """테스트 실패 시 스크린샷 촬영"""
-        try:
-            # 스크린샷 디렉토리 생성
-            screenshot_dir = TestConfig.SCREENSHOT_DIR
-            os.makedirs(screenshot_dir, exist_ok=True)
-            
-            # 파일명 생성
-            timestamp = int(time.time())
-            test_name = test_name or f"test_{timestamp}"
-            filename = f"failure_{test_name}_{timestamp}.png"
-            filepath = os.path.join(screenshot_dir, filename)
-            
-            # 스크린샷 촬영
-            driver.save_screenshot(filepath)
-            
-            # 오류 정보 로그 파일 생성
-            log_filename = f"failure_{test_name}_{timestamp}.log"
-            log_filepath = os.path.join(screenshot_dir, log_filename)
-            
-            with open(log_filepath, 'w', encoding='utf-8') as f:
-                f.write(f"테스트 실패 시간: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                f.write(f"테스트명: {test_name}\n")
-                f.write(f"현재 URL: {driver.current_url}\n")
-                f.write(f"페이지 제목: {driver.title}\n")
-                if error_info:
-                    f.write(f"오류 정보:\n{error_info}\n")
-                f.write(f"스크린샷 파일: {filepath}\n")
+    def _release_resources(options):
+        """옵션에 할당된 임시 사용자 데이터 디렉토리와 디버깅 포트 정리"""
+        import shutil
+        for argument in options.arguments:
+            if argument.startswith('--user-data-dir='):
+                user_data_dir = argument.split('=', 1)[1]
+                if os.path.exists(user_data_dir):
+                    try:
+                        shutil.rmtree(user_data_dir)
+                        print(f"임시 디렉토리 정리됨: {user_data_dir}")
+                    except Exception as e:
+                        print(f"임시 디렉토리 정리 실패: {e}")
+            elif argument.startswith('--remote-debugging-port='):
+                DriverFactory.release_debugging_port(int(argument.split('=', 1)[1]))
+    
+    @staticmethod
+    def get_pool():
+        """세션 공유 드라이버 풀 반환 (최초 호출 시 생성)"""
+        if DriverFactory._pool is None:
+            DriverFactory._pool = DriverPool(
+                create=DriverFactory.get_driver,
+                destroy=DriverFactory.quit_driver,
+                max_size=TestConfig.DRIVER_POOL_SIZE,
+                idle_timeout=TestConfig.DRIVER_POOL_IDLE_TIMEOUT,
+                window_size=(TestConfig.WINDOW_WIDTH, TestConfig.WINDOW_HEIGHT),
+                configure=DriverFactory._configure_driver,
+            )
+        return DriverFactory._pool
+    
+    @staticmethod
+    def acquire_driver(reuse=None):
+        """
+        테스트용 WebDriver 획득
+        
+        Args:
+            reuse (bool): 풀 재사용 여부 (기본값: TestConfig.DRIVER_REUSE)
             
-            print(f"❌ 테스트 실패 스크린샷 저장: {filepath}")
-            print(f"❌ 오류 로그 저장: {log_filepath}")
+        Returns:
+            WebDriver: 풀에서 대여했거나 새로 생성한 드라이버
+        """
+        reuse = reuse if reuse is not None else TestConfig.DRIVER_REUSE
+        if reuse:
+            return DriverFactory.get_pool().checkout()
+        return DriverFactory.get_driver()
+    
+    @staticmethod
+    @timed(TEARDOWN)
+    def release_driver(driver, reuse=None):
+        """
+        acquire_driver로 획득한 WebDriver 반납
+        
+        Args:
+            driver: 반납할 WebDriver
+            reuse (bool): 풀 재사용 여부 (기본값: TestConfig.DRIVER_REUSE)
+        """
+        reuse = reuse if reuse is not None else TestConfig.DRIVER_REUSE
+        if reuse:
+            DriverFactory.get_pool().checkin(driver)
+        else:
+            DriverFactory.quit_driver(driver)
+    
+    @staticmethod
+    def reset_driver(driver, close_windows=True):
+        """
+        브라우저를 다시 띄우지 않고 상태만 초기화 (풀 반납 시와 같은 쿠키/storage/about:blank 초기화)
+        
+        Args:
+            driver: 초기화할 WebDriver
+            close_windows (bool): 첫 번째 창 외의 창 닫기
+        """
+        DriverFactory.get_pool().reset(driver, close_windows)
+    
+    @staticmethod
+    def close_pool():
+        """드라이버 풀의 모든 드라이버 종료"""
+        if DriverFactory._pool is not None:
+            pool = DriverFactory._pool
+            pool.close_all()
+            print(f"♻️ 드라이버 풀 종료: 생성 {pool.stats['created']}회, 재사용 {pool.stats['reused']}회")
+            DriverFactory._pool = None
+    
+    @staticmethod
+    def get_context_host():
+        """컨텍스트 격리 모드용 Chrome 드라이버 반환 (프로세스당 하나, 최초 호출 시 생성)"""
+        host = DriverFactory._context_host
+        if host is not None:
+            try:
+                host.window_handles
+            except Exception:
+                print("컨텍스트 호스트 드라이버가 종료되어 다시 생성합니다")
+                DriverFactory.close_context_host()
+                host = None
+        if host is None:
+            host = DriverFactory.get_driver('chrome')
+            DriverFactory._context_host = host
+        return host
+    
+    @staticmethod
+    @timed(LAUNCH)
+    def open_isolated_context():
+        """
+        공유 Chrome 드라이버에 새 incognito 브라우저 컨텍스트 열기
+        
+        쿠키, storage, 캐시가 다른 테스트와 격리되며 브라우저 재실행 없이 수 밀리초 안에 준비됩니다.
+        
+        Returns:
+            BrowserContext: 열린 컨텍스트 (context.driver로 사용)
+        """
+        host = DriverFactory.get_context_host()
+        return BrowserContext.open(host, window_size=(TestConfig.WINDOW_WIDTH, TestConfig.WINDOW_HEIGHT))
+    
+    @staticmethod
+    @timed(TEARDOWN)
+    def close_isolated_context(context):
+        """
+        브라우저 컨텍스트 폐기 (실패하면 다음 테스트를 위해 호스트 드라이버 재생성)
+        
+        Args:
+            context (BrowserContext): open_isolated_context로 연 컨텍스트
+        """
+        try:
+            context.close()
+        except Exception as e:
+            print(f"브라우저 컨텍스트 정리 실패, 호스트 드라이버를 종료합니다: {e}")
+            DriverFactory.close_context_host()
+    
+    @staticmethod
+    def close_context_host():
+        """컨텍스트 격리 모드의 공유 드라이버 종료"""
+        if DriverFactory._context_host is not None:
+            DriverFactory.quit_driver(DriverFactory._context_host)
+            DriverFactory._context_host = None
+    
+    @staticmethod
+    def capture_failure(driver, test_name=None, error_info=None):
+        """
+        실패 시점의 브라우저 상태 수집 (테스트 스레드에서 실행)
+        
+        스크린샷은 base64로 한 번만 받고, URL과 제목은 스크립트 한 번으로 읽습니다.
+        파일 기록은 write_failure_artifacts에서 수행합니다.
+        
+        Args:
+            driver: WebDriver 인스턴스
+            test_name (str): 테스트 이름
+            error_info (str): 오류 정보
             
-            return filepath
+        Returns:
+            dict: 스크린샷(base64), URL, 제목 등 기록에 필요한 정보
+        """
+        timestamp = time.time()
+        screenshot = driver.get_screenshot_as_base64()
+        try:
+            url, title = driver.execute_script("return [location.href, document.title];")
+        except Exception:
+            url, title = driver.current_url, driver.title
+        
+        return {
+            'test_name': test_name or f"test_{int(timestamp)}",
+            'timestamp': timestamp,
+            'run': TestConfig.RUN_ID,
+            'screenshot': screenshot,
+            'url': url,
+            'title': title,
+            'error_info': error_info,
+        }
+    
+    @staticmethod
+    def get_screenshot_store():
+        """스크린샷 저장소 반환 (SCREENSHOT_DIR이 바뀌면 새로 생성)"""
+        store = DriverFactory._screenshot_store
+        if store is None or store.root != TestConfig.SCREENSHOT_DIR:
+            store = ScreenshotStore(
+                TestConfig.SCREENSHOT_DIR,
+                image_format=TestConfig.SCREENSHOT_FORMAT,
+                quality=TestConfig.SCREENSHOT_QUALITY,
+                max_width=TestConfig.SCREENSHOT_MAX_WIDTH,
+            )
+            DriverFactory._screenshot_store = store
+        return store
+    
+    @staticmethod
+    def write_failure_artifacts(payload):
+        """
+        capture_failure 결과를 스크린샷 저장소에 기록 (백그라운드 스레드에서 실행 가능)
+        
+        같은 화면의 스크린샷은 한 번만 저장되고, 테스트명/URL/제목/오류 정보는
+        저장소 인덱스(index.jsonl)에 남습니다.
+        
+        Args:
+            payload (dict): capture_failure가 반환한 정보
             
+        Returns:
+            str: 스크린샷 파일 경로
+        """
+        filepath = DriverFactory.get_screenshot_store().put(
+            base64.b64decode(payload['screenshot']),
+            test_name=payload['test_name'],
+            url=payload['url'],
+            title=payload['title'],
+            kind='failure',
+            error_info=payload['error_info'],
+            timestamp=payload['timestamp'],
+            run=payload.get('run'),
+        )
+        print(f"❌ 테스트 실패 스크린샷 저장: {filepath}")
+        return filepath
+    
+    @staticmethod
+    def take_screenshot_on_failure(driver, test_name=None, error_info=None):
+        """테스트 실패 시 스크린샷 촬영 (수집과 기록을 동기적으로 수행)"""
+        try:
+            payload = DriverFactory.capture_failure(driver, test_name, error_info)
+            return DriverFactory.write_failure_artifacts(payload)
         except Exception as e:
             print(f"스크린샷 촬영 실패: {e}")
             return None
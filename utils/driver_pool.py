@@ -0,0 +1,220 @@
+"""
+WebDriver 풀
+테스트마다 브라우저를 새로 띄우지 않고, 세션 동안 드라이버를 재사용합니다.
+"""
+import threading
+import time
+
+
+class DriverPool:
+    """checkout/checkin 방식으로 WebDriver를 재사용하는 풀"""
+
+    def __init__(self, create, destroy, max_size=2, idle_timeout=300,
+                 window_size=(1920, 1080), configure=None):
+        """
+        DriverPool 초기화
+
+        Args:
+            create (callable): 새 드라이버를 생성하는 함수
+            destroy (callable): 드라이버를 종료하는 함수
+            max_size (int): 동시에 유지할 최대 드라이버 수
+            idle_timeout (int): 유휴 드라이버를 종료하기까지의 시간 (초)
+            window_size (tuple): checkin 시 복원할 창 크기 (width, height)
+            configure (callable): checkin 시 타임아웃 등 드라이버 설정을 복원하는 함수
+        """
+        self._create = create
+        self._destroy = destroy
+        self.max_size = max(1, int(max_size))
+        self.idle_timeout = idle_timeout
+        self.window_size = window_size
+        self._configure = configure
+
+        self._lock = threading.Condition()
+        self._idle = []          # [(driver, 반납 시각)]
+        self._in_use = set()     # 사용 중인 드라이버 id
+        self._size = 0           # 생성되어 살아있는 드라이버 수 (생성 중 포함)
+        self._closed = False     # close_all 이후에는 반납된 드라이버를 보관하지 않고 종료
+
+        self.stats = {'created': 0, 'reused': 0, 'evicted': 0, 'discarded': 0}
+
+    @property
+    def size(self):
+        """현재 풀이 보유한 드라이버 수"""
+        return self._size
+
+    def checkout(self, timeout=None):
+        """
+        드라이버 대여
+
+        유휴 드라이버가 있으면 상태 확인 후 재사용하고,
+        없으면 max_size 한도 안에서 새로 생성합니다.
+
+        Args:
+            timeout (float): 풀이 가득 찼을 때 반납을 기다릴 시간 (초, None이면 무제한)
+
+        Returns:
+            WebDriver: 대여한 드라이버
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            self._evict_idle()
+
+            with self._lock:
+                if self._idle:
+                    driver, _ = self._idle.pop()
+                elif self._size < self.max_size:
+                    driver = None
+                    self._size += 1
+                else:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"드라이버 풀 대기 시간 초과 (max_size={self.max_size})")
+                    self._lock.wait(remaining)
+                    continue
+
+            if driver is not None:
+                if self._is_healthy(driver):
+                    with self._lock:
+                        self._in_use.add(id(driver))
+                        self.stats['reused'] += 1
+                    return driver
+                self._discard(driver)
+                continue
+
+            try:
+                driver = self._create()
+            except Exception:
+                with self._lock:
+                    self._size -= 1
+                    self._lock.notify()
+                raise
+
+            with self._lock:
+                self._in_use.add(id(driver))
+                self.stats['created'] += 1
+            return driver
+
+    def checkin(self, driver):
+        """
+        드라이버 반납
+
+        쿠키, local/session storage를 비우고 about:blank로 이동한 뒤
+        창 크기를 복원합니다. 초기화에 실패한 드라이버와 풀이 닫힌 뒤 반납된 드라이버는 폐기하고,
+        이 풀이 대여하지 않은 드라이버(풀을 닫고 다시 만든 뒤 반납된 드라이버 등)는 종료합니다.
+
+        Args:
+            driver: checkout으로 대여한 WebDriver
+        """
+        if driver is None:
+            return
+
+        with self._lock:
+            if any(idle is driver for idle, _ in self._idle):
+                return
+            owned = id(driver) in self._in_use
+            self._in_use.discard(id(driver))
+            closed = self._closed
+
+        if not owned:
+            self._safe_destroy(driver)
+            return
+        if closed:
+            self._discard(driver)
+            return
+
+        try:
+            self.reset(driver)
+        except Exception as e:
+            print(f"드라이버 상태 초기화 실패, 폐기합니다: {e}")
+            self._discard(driver)
+            return
+
+        with self._lock:
+            self._idle.append((driver, time.monotonic()))
+            self._lock.notify()
+
+    def reset(self, driver, close_windows=True):
+        """
+        드라이버 상태 초기화
+
+        Args:
+            driver: 초기화할 WebDriver
+            close_windows (bool): 첫 번째 창 외의 창 닫기 (컨텍스트 격리 모드에서는 False)
+        """
+        handles = driver.window_handles if close_windows else []
+        if len(handles) > 1:
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+        driver.switch_to.default_content()
+
+        try:
+            driver.execute_script(
+                "try { window.localStorage.clear(); } catch (e) {}"
+                "try { window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except Exception:
+            pass
+
+        if hasattr(driver, 'execute_cdp_cmd'):
+            # 현재 도메인뿐 아니라 모든 도메인의 쿠키 삭제
+            driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        driver.delete_all_cookies()
+
+        driver.get('about:blank')
+        if self._configure:
+            self._configure(driver)
+        elif self.window_size:
+            driver.set_window_size(*self.window_size)
+
+    def close_all(self):
+        """유휴 드라이버를 모두 종료하고 풀 닫기 (사용 중인 드라이버는 반납될 때 종료)"""
+        with self._lock:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver, _ in idle:
+            self._discard(driver)
+
+    def _evict_idle(self):
+        """idle_timeout이 지난 유휴 드라이버 종료 (종료는 lock 밖에서 처리해 다른 대여/반납을 막지 않음)"""
+        if not self.idle_timeout:
+            return
+        with self._lock:
+            now = time.monotonic()
+            expired = [entry for entry in self._idle if now - entry[1] > self.idle_timeout]
+            if not expired:
+                return
+            self._idle = [entry for entry in self._idle if entry not in expired]
+
+        for driver, _ in expired:
+            self._safe_destroy(driver)
+
+        with self._lock:
+            self.stats['evicted'] += len(expired)
+            self._size -= len(expired)
+            self._lock.notify_all()
+
+    def _discard(self, driver):
+        """드라이버 폐기 후 풀 크기 감소"""
+        self._safe_destroy(driver)
+        with self._lock:
+            self.stats['discarded'] += 1
+            self._size -= 1
+            self._lock.notify()
+
+    def _safe_destroy(self, driver):
+        try:
+            self._destroy(driver)
+        except Exception as e:
+            print(f"드라이버 종료 중 오류: {e}")
+
+    @staticmethod
+    def _is_healthy(driver):
+        """드라이버 세션이 살아있는지 확인"""
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
@@ -0,0 +1,191 @@
+"""
+드라이버 실행 파일 resolver
+브라우저 메이저 버전별로 드라이버를 캐시해 재다운로드 없이 재사용합니다.
+캐시 디렉토리를 미리 채워두면 네트워크 없이도 동작합니다.
+
+캐시 구조:
+    {cache_dir}/{browser}/{major}/{driver 실행 파일}
+    {cache_dir}/{browser}/{major}/metadata.json
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from contextlib import contextmanager
+from utils.json_store import lock_file, unlock_file
+
+
+# 브라우저별 실행 파일/드라이버 정보
+BROWSER_SPECS = {
+    'chrome': {
+        'binaries': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser',
+                     '/Applications/Google Chrome.app/Contents/MacOS/Google Chrome'],
+        'driver': 'chromedriver',
+    },
+    'firefox': {
+        'binaries': ['firefox', '/Applications/Firefox.app/Contents/MacOS/firefox'],
+        'driver': 'geckodriver',
+    },
+    'edge': {
+        'binaries': ['microsoft-edge', 'microsoft-edge-stable',
+                     '/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge'],
+        'driver': 'msedgedriver',
+    },
+}
+
+
+class DriverResolver:
+    """브라우저 버전별 드라이버 실행 파일 캐시"""
+
+    def __init__(self, cache_dir, offline=False):
+        """
+        DriverResolver 초기화
+
+        Args:
+            cache_dir (str): 드라이버 캐시 디렉토리
+            offline (bool): True면 다운로드하지 않고 캐시만 사용
+        """
+        self.cache_dir = os.path.expanduser(cache_dir)
+        self.offline = offline
+        self._versions = {}
+        self._paths = {}
+
+    def browser_version(self, browser):
+        """
+        설치된 브라우저 버전 확인 (프로세스당 한 번만 실행)
+
+        Args:
+            browser (str): chrome / firefox / edge
+
+        Returns:
+            str: 버전 문자열 (확인 실패 시 None)
+        """
+        if browser not in self._versions:
+            self._versions[browser] = self._probe_version(browser)
+        return self._versions[browser]
+
+    def resolve(self, browser):
+        """
+        드라이버 실행 파일 경로 반환 (프로세스당 한 번만 확인)
+
+        Args:
+            browser (str): chrome / firefox / edge
+
+        Returns:
+            str: 드라이버 실행 파일 경로
+        """
+        if browser not in self._paths:
+            self._paths[browser] = self._resolve(browser)
+        return self._paths[browser]
+
+    def _resolve(self, browser):
+        spec = BROWSER_SPECS[browser]
+        version = self.browser_version(browser)
+        major = version.split('.')[0] if version else None
+
+        cached = self._cached_driver(browser, major)
+        if cached:
+            print(f"캐시된 {spec['driver']} 사용: {cached}")
+            return cached
+
+        if self.offline:
+            raise FileNotFoundError(
+                f"오프라인 모드: {self.cache_dir}/{browser}/{major or '<major>'}/{spec['driver']} 가 없습니다"
+            )
+
+        with self._locked(browser):
+            # 다른 프로세스가 먼저 받아둔 경우
+            cached = self._cached_driver(browser, major)
+            if cached:
+                return cached
+
+            downloaded = self._download(browser)
+            major = major or 'unknown'
+            target_dir = os.path.join(self.cache_dir, browser, major)
+            os.makedirs(target_dir, exist_ok=True)
+            target = os.path.join(target_dir, spec['driver'])
+            shutil.copy2(downloaded, target + '.tmp')
+            os.chmod(target + '.tmp', 0o755)
+            os.replace(target + '.tmp', target)
+
+            with open(os.path.join(target_dir, 'metadata.json'), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'browser_version': version,
+                    'source': downloaded,
+                    'cached_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+                }, f, ensure_ascii=False, indent=2)
+
+            print(f"{spec['driver']} 캐시 저장: {target}")
+            return target
+
+    def _cached_driver(self, browser, major):
+        """캐시에서 드라이버 찾기 (버전을 모르면 가장 높은 버전, 없으면 버전 미상으로 받아둔 드라이버 사용)"""
+        browser_dir = os.path.join(self.cache_dir, browser)
+        if major:
+            candidates = [major]
+        elif os.path.isdir(browser_dir):
+            candidates = sorted(
+                (name for name in os.listdir(browser_dir) if name.isdigit()),
+                key=int, reverse=True,
+            ) + ['unknown']
+        else:
+            candidates = []
+
+        for candidate in candidates:
+            path = os.path.join(browser_dir, candidate, BROWSER_SPECS[browser]['driver'])
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                return path
+        return None
+
+    def _download(self, browser):
+        """webdriver-manager로 한 번만 다운로드하고 실제 실행 파일 경로 반환"""
+        if browser == 'chrome':
+            from webdriver_manager.chrome import ChromeDriverManager as Manager
+        elif browser == 'firefox':
+            from webdriver_manager.firefox import GeckoDriverManager as Manager
+        else:
+            from webdriver_manager.microsoft import EdgeChromiumDriverManager as Manager
+
+        installed = Manager().install()
+        driver_name = BROWSER_SPECS[browser]['driver']
+        if os.path.basename(installed).startswith(driver_name) and os.path.isfile(installed):
+            return installed
+
+        # 반환 경로가 실행 파일이 아닌 경우 (예: THIRD_PARTY_NOTICES) 같은 디렉토리에서 찾기
+        search_root = installed if os.path.isdir(installed) else os.path.dirname(installed)
+        for root, _, files in os.walk(search_root):
+            for name in files:
+                if name == driver_name or name == f"{driver_name}.exe":
+                    return os.path.join(root, name)
+        raise FileNotFoundError(f"{driver_name} 실행 파일을 찾을 수 없습니다: {installed}")
+
+    @staticmethod
+    def _probe_version(browser):
+        for binary in BROWSER_SPECS[browser]['binaries']:
+            executable = binary if os.path.isabs(binary) else shutil.which(binary)
+            if not executable or not os.path.exists(executable):
+                continue
+            try:
+                output = subprocess.run(
+                    [executable, '--version'], capture_output=True, text=True, timeout=10
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                continue
+            match = re.search(r'(\d+(?:\.\d+)+)', output)
+            if match:
+                return match.group(1)
+        return None
+
+    @contextmanager
+    def _locked(self, browser):
+        """같은 브라우저 캐시를 동시에 채우지 않도록 잠금"""
+        browser_dir = os.path.join(self.cache_dir, browser)
+        os.makedirs(browser_dir, exist_ok=True)
+        with open(os.path.join(browser_dir, '.lock'), 'w') as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
@@ -0,0 +1,133 @@
+"""
+드라이버 실행 전략 probe
+브라우저를 띄우지 않고 사용 가능한 드라이버 실행 방식을 찾고,
+성공한 전략을 세션(메모리)과 디스크(TTL)에 기억해 다음 실행부터 바로 사용합니다.
+
+전략 순서:
+    system           PATH에 있는 드라이버
+    cache            버전별 드라이버 캐시 (DriverResolver)
+    path             일반적인 설치 경로
+    selenium-manager Selenium 내장 드라이버 관리자 (마지막 수단, 오프라인 모드 제외)
+"""
+import json
+import os
+import shutil
+import time
+from utils.driver_resolver import BROWSER_SPECS
+
+
+# 일반적인 드라이버 설치 디렉토리
+COMMON_DRIVER_DIRS = ['/usr/bin', '/usr/local/bin', '/snap/bin']
+
+
+class DriverStrategyProbe:
+    """브라우저별 드라이버 실행 전략 선택 및 기억"""
+
+    def __init__(self, resolver, state_file, ttl=3600):
+        """
+        DriverStrategyProbe 초기화
+
+        Args:
+            resolver (DriverResolver): 드라이버 실행 파일 캐시
+            state_file (str): 전략을 기억할 파일 경로
+            ttl (int): 디스크에 기억한 전략의 유효 시간 (초, 0이면 디스크 사용 안 함)
+        """
+        self.resolver = resolver
+        self.state_file = os.path.expanduser(state_file)
+        self.ttl = ttl
+        self._winners = {}
+
+    def candidates(self, browser):
+        """
+        시도할 (전략, 드라이버 경로) 순서 반환
+
+        기억된 전략이 있으면 그것만 먼저 반환하고,
+        실패한 경우에만 나머지 전략을 차례로 확인합니다.
+
+        Args:
+            browser (str): chrome / firefox / edge
+
+        Yields:
+            tuple: (전략 이름, 드라이버 경로 또는 None)
+        """
+        winner = self._winners.get(browser) or self._load(browser)
+        tried = set()
+        if winner:
+            self._winners[browser] = winner
+            tried.add(winner)
+            yield winner
+
+        for candidate in self._probe(browser):
+            if candidate not in tried:
+                tried.add(candidate)
+                yield candidate
+
+    def remember(self, browser, strategy, driver_path):
+        """성공한 전략 기억"""
+        winner = (strategy, driver_path)
+        if self._winners.get(browser) == winner:
+            return
+        self._winners[browser] = winner
+        if not self.ttl:
+            return
+        state = self._read()
+        state[browser] = {'strategy': strategy, 'driver_path': driver_path, 'probed_at': time.time()}
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"드라이버 전략 저장 실패: {e}")
+
+    def invalidate(self, browser):
+        """실패한 전략 삭제"""
+        self._winners.pop(browser, None)
+        state = self._read()
+        if state.pop(browser, None) is not None:
+            try:
+                with open(self.state_file, 'w', encoding='utf-8') as f:
+                    json.dump(state, f, ensure_ascii=False, indent=2)
+            except OSError:
+                pass
+
+    def _probe(self, browser):
+        """브라우저 실행 없이 사용 가능한 전략 확인 (필요할 때만 다음 단계 확인)"""
+        driver_name = BROWSER_SPECS[browser]['driver']
+
+        system_path = shutil.which(driver_name)
+        if system_path:
+            yield ('system', system_path)
+
+        try:
+            yield ('cache', self.resolver.resolve(browser))
+        except Exception as e:
+            print(f"캐시된 {driver_name} 없음: {e}")
+
+        for directory in COMMON_DRIVER_DIRS:
+            path = os.path.join(directory, driver_name)
+            if os.path.isfile(path) and os.access(path, os.X_OK):
+                yield ('path', path)
+                break
+
+        # Selenium Manager는 네트워크를 사용하므로 오프라인 모드에서는 제외
+        if not getattr(self.resolver, 'offline', False):
+            yield ('selenium-manager', None)
+
+    def _load(self, browser):
+        """디스크에 기억된 전략 읽기 (TTL 초과 또는 경로가 사라진 경우 무시)"""
+        if not self.ttl:
+            return None
+        entry = self._read().get(browser)
+        if not entry or time.time() - entry.get('probed_at', 0) > self.ttl:
+            return None
+        driver_path = entry.get('driver_path')
+        if driver_path and not os.path.exists(driver_path):
+            return None
+        return (entry['strategy'], driver_path)
+
+    def _read(self):
+        try:
+            with open(self.state_file, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
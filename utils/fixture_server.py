@@ -0,0 +1,205 @@
+"""
+로컬 픽스처 웹 서버
+네트워크 없이 테스트/벤치마크할 수 있도록 정적 페이지와 httpbin 호환 엔드포인트를 임의 포트로 제공합니다.
+
+내장 엔드포인트: /get, /post, /headers, /user-agent, /html, /status/<code>, /delay/<초>
+"""
+import functools
+import json
+import re
+import threading
+import time
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+# /delay/<초> 최대 대기 시간
+MAX_DELAY = 10
+
+HTML_PAGE = """<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8"><title>Herman Melville - Moby-Dick</title></head>
+<body>
+<h1>Herman Melville - Moby-Dick</h1>
+<div>
+<p>Availing himself of the mild, summer-cool weather that now reigned in these latitudes,
+and in preparation for the peculiarly active pursuits shortly to be anticipated,
+Perth, the begrimed, blistered old blacksmith, had not removed his portable forge to the hold again.</p>
+</div>
+</body>
+</html>
+"""
+
+
+def _json_response(data):
+    return HTTPStatus.OK, 'application/json', json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+def _echo(handler, body=None):
+    """요청 정보를 httpbin /get, /post 형식으로 반환"""
+    query = parse_qs(urlsplit(handler.path).query)
+    data = {
+        'args': {name: values[0] if len(values) == 1 else values for name, values in query.items()},
+        'headers': dict(handler.headers.items()),
+        'origin': handler.client_address[0],
+        'url': f"http://{handler.headers.get('Host', '')}{handler.path}",
+    }
+    if body is not None:
+        text = body.decode('utf-8', errors='replace')
+        data['data'] = text
+        data['form'] = {name: values[0] for name, values in parse_qs(text).items()}
+        try:
+            data['json'] = json.loads(text)
+        except ValueError:
+            data['json'] = None
+    return _json_response(data)
+
+
+def _status(handler, code):
+    """지정한 상태 코드 응답 (3xx는 /get으로 리다이렉트)"""
+    code = int(code)
+    try:
+        phrase = HTTPStatus(code).phrase
+    except ValueError:
+        phrase = ''
+    headers = {'Location': '/get'} if 300 <= code < 400 else {}
+    body = f"<html><head><title>{code} {phrase}</title></head><body><h1>{code} {phrase}</h1></body></html>"
+    if code < 200 or code in (204, 304):
+        body = ''
+    return code, 'text/html; charset=utf-8', body, headers
+
+
+def _delay(handler, seconds):
+    """지정한 시간(최대 MAX_DELAY초) 뒤 응답"""
+    time.sleep(min(float(seconds), MAX_DELAY))
+    return _echo(handler)
+
+
+# (메서드, 경로 정규식) → 핸들러(handler, *그룹) -> (상태, Content-Type, 본문[, 헤더])
+BUILTIN_ROUTES = [
+    ('GET', r'/get', _echo),
+    ('POST', r'/post', lambda handler: _echo(handler, handler.read_body())),
+    ('GET', r'/headers', lambda handler: _json_response({'headers': dict(handler.headers.items())})),
+    ('GET', r'/user-agent', lambda handler: _json_response({'user-agent': handler.headers.get('User-Agent')})),
+    ('GET', r'/html', lambda handler: (HTTPStatus.OK, 'text/html; charset=utf-8', HTML_PAGE)),
+    ('GET', r'/status/(\d{3})', _status),
+    ('GET', r'/delay/(\d+(?:\.\d+)?)', _delay),
+]
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """요청 로그를 출력하지 않고, 등록된 엔드포인트를 정적 파일보다 먼저 처리하는 핸들러"""
+
+    def __init__(self, *args, routes=(), **kwargs):
+        self.routes = routes
+        super().__init__(*args, **kwargs)
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_body(self):
+        """요청 본문 읽기"""
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _dispatch(self, method):
+        """일치하는 엔드포인트가 있으면 응답하고 True 반환"""
+        path = urlsplit(self.path).path
+        for route_method, pattern, func in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method != method or not match:
+                continue
+            status, content_type, body, *rest = func(self, *match.groups())
+            if isinstance(body, str):
+                body = body.encode('utf-8')
+            self.send_response(int(status))
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            for name, value in (rest[0] if rest else {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            if self.command != 'HEAD':
+                self.wfile.write(body)
+            return True
+        return False
+
+    def do_GET(self):
+        if not self._dispatch('GET'):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._dispatch('GET'):
+            super().do_HEAD()
+
+    def do_POST(self):
+        if not self._dispatch('POST'):
+            self.send_error(HTTPStatus.METHOD_NOT_ALLOWED)
+
+
+class FixtureServer:
+    """백그라운드 스레드에서 동작하는 정적 파일 + 엔드포인트 서버"""
+
+    def __init__(self, root, host='127.0.0.1', port=0):
+        """
+        FixtureServer 초기화
+
+        Args:
+            root (str): 제공할 디렉토리
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.root = root
+        self.host = host
+        self.port = port
+        self._routes = [(method, re.compile(pattern), func) for method, pattern, func in BUILTIN_ROUTES]
+        self._server = None
+        self._thread = None
+
+    def route(self, path, func, method='GET'):
+        """
+        엔드포인트 등록 (같은 경로면 내장 엔드포인트와 정적 파일보다 우선)
+
+        Args:
+            path (str): 경로 정규식 (전체 일치, 그룹은 func 인자로 전달)
+            func (callable): func(handler, *groups) -> (상태 코드, Content-Type, 본문[, 헤더 dict])
+            method (str): GET / POST
+        """
+        self._routes.insert(0, (method.upper(), re.compile(path), func))
+        return self
+
+    @property
+    def base_url(self):
+        """서버 주소 (예: http://127.0.0.1:54321)"""
+        return f"http://{self.host}:{self.port}"
+
+    def url(self, path=''):
+        """서버 기준 URL"""
+        return f"{self.base_url}/{path.lstrip('/')}"
+
+    def start(self):
+        """서버 시작"""
+        if self._server is not None:
+            return self
+        handler = functools.partial(_QuietHandler, directory=self.root, routes=self._routes)
+        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='fixture-server', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,81 @@
+"""
+불안정(flaky) 테스트 통계
+flaky 마커로 재실행된 테스트의 시도 횟수와 최종 결과를 실행마다 누적해,
+재실행해야 통과하는 경우가 잦은 테스트를 격리(quarantine) 후보로 찾을 수 있게 합니다.
+"""
+import time
+from utils.json_store import JsonTestStore
+
+
+class FlakyStats(JsonTestStore):
+    """테스트 nodeid별 재실행 통계를 보관하는 JSON 저장소"""
+
+    TMP_PREFIX = '.flaky_'
+
+    def __init__(self, path):
+        """
+        FlakyStats 초기화
+
+        Args:
+            path (str): 통계 파일 경로
+        """
+        super().__init__(path)
+        self._pending = []
+        self._session = []
+
+    def record(self, nodeid, attempts, outcome):
+        """
+        flaky 테스트 실행 결과 기록 (save 호출 시 파일에 반영)
+
+        Args:
+            nodeid (str): pytest nodeid
+            attempts (int): 총 실행 횟수 (1이면 재실행 없음)
+            outcome (str): 최종 결과 (passed / failed / skipped)
+        """
+        self._pending.append((nodeid, attempts, outcome))
+        self._session.append((nodeid, attempts, outcome))
+
+    def session_results(self):
+        """
+        이번 세션에서 재실행이 필요했던 테스트
+
+        Returns:
+            list: (nodeid, 실행 횟수, 최종 결과) 리스트
+        """
+        return [result for result in self._session if result[1] > 1]
+
+    def save(self):
+        """기록된 결과를 파일에 병합 저장 (여러 프로세스가 동시에 저장해도 안전)"""
+        if not self._pending:
+            return
+        with self._locked():
+            tests = self._read()
+            for nodeid, attempts, outcome in self._pending:
+                entry = tests.setdefault(nodeid, {'runs': 0, 'reruns': 0, 'flaky_passes': 0, 'failures': 0})
+                entry['runs'] += 1
+                entry['reruns'] += attempts - 1
+                if outcome == 'passed' and attempts > 1:
+                    entry['flaky_passes'] += 1
+                elif outcome == 'failed':
+                    entry['failures'] += 1
+                # 매번 실패하는 테스트는 불안정한 것이 아니라 깨진 것이므로 재실행 후 통과한 경우만 반영
+                entry['flaky_rate'] = round(entry['flaky_passes'] / entry['runs'], 3)
+                entry['last_run'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+            self._write(tests)
+            self.tests = tests
+        self._pending = []
+
+    def chronic(self, min_runs=5, rate=0.3):
+        """
+        격리 후보 (충분히 실행되었고 재실행 후 통과한 비율이 높은 테스트)
+
+        Args:
+            min_runs (int): 최소 실행 횟수
+            rate (float): 재실행 후 통과한 실행의 비율 기준
+
+        Returns:
+            list: 비율이 높은 순서의 nodeid 리스트
+        """
+        candidates = [(entry['flaky_rate'], nodeid) for nodeid, entry in self.tests.items()
+                      if entry['runs'] >= min_runs and entry.get('flaky_rate', 0) >= rate]
+        return [nodeid for _, nodeid in sorted(candidates, reverse=True)]
@@ -0,0 +1,112 @@
+"""
+테스트별 JSON 저장소 공통 기능
+실행 이력과 flaky 통계처럼 여러 프로세스가 같은 파일에 결과를 병합하는 저장소의
+읽기, 원자적 쓰기, 파일 잠금을 한곳에서 처리합니다.
+"""
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows에는 fcntl이 없으므로 msvcrt 바이트 잠금 사용
+    fcntl = None
+    import msvcrt
+
+
+def lock_file(f, blocking=True):
+    """
+    열린 파일에 프로세스 간 배타 잠금 설정 (POSIX: fcntl.flock, Windows: msvcrt.locking)
+
+    Args:
+        f: 파일 객체 또는 파일 디스크립터
+        blocking (bool): False면 다른 프로세스가 잠근 경우 기다리지 않고 BlockingIOError
+    """
+    fd = f if isinstance(f, int) else f.fileno()
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+    while True:
+        try:
+            _msvcrt_locking(fd, msvcrt.LK_NBLCK)
+            return
+        except OSError:
+            if not blocking:
+                raise BlockingIOError(f"이미 잠긴 파일입니다 (fd {fd})")
+            time.sleep(0.05)
+
+
+def unlock_file(f):
+    """
+    lock_file로 설정한 잠금 해제
+
+    Args:
+        f: 파일 객체 또는 파일 디스크립터
+    """
+    fd = f if isinstance(f, int) else f.fileno()
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        _msvcrt_locking(fd, msvcrt.LK_UNLCK)
+
+
+def _msvcrt_locking(fd, mode):
+    # msvcrt.locking은 현재 위치부터 잠그므로 항상 첫 바이트를 잠그고 위치를 되돌림
+    position = os.lseek(fd, 0, os.SEEK_CUR)
+    os.lseek(fd, 0, os.SEEK_SET)
+    try:
+        msvcrt.locking(fd, mode, 1)
+    finally:
+        os.lseek(fd, position, os.SEEK_SET)
+
+
+class JsonTestStore:
+    """테스트 nodeid별 항목을 {'tests': {...}} 형식의 JSON 파일로 보관하는 저장소"""
+
+    # 저장 중 임시 파일 이름 접두사
+    TMP_PREFIX = '.store_'
+
+    def __init__(self, path):
+        """
+        JsonTestStore 초기화
+
+        Args:
+            path (str): 저장 파일 경로
+        """
+        self.path = path
+        self.tests = {}
+
+    def load(self):
+        """저장 파일 읽기 (없거나 손상된 경우 빈 저장소)"""
+        self.tests = self._read()
+        return self
+
+    def _read(self):
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                return json.load(f).get('tests', {})
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, tests):
+        # 읽는 쪽이 쓰다 만 파일을 보지 않도록 임시 파일로 쓴 뒤 교체
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=self.TMP_PREFIX)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'tests': tests}, f, ensure_ascii=False, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    @contextmanager
+    def _locked(self):
+        # 읽기-병합-쓰기 사이에 다른 프로세스가 저장하지 않도록 잠금 파일로 직렬화
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path + '.lock', 'w') as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
@@ -0,0 +1,84 @@
+"""
+실패 우선 테스트 실행 순서
+실행 이력을 기준으로 최근 실패한 테스트, 불안정한(flaky) 테스트, 변경된 파일/새 테스트를 먼저 실행하고
+나머지는 빠른 테스트부터 실행해 배포가 깨졌을 때 실패 신호를 최대한 빨리 받습니다.
+"""
+import subprocess
+
+# 우선순위 그룹 (작을수록 먼저 실행)
+FAILED = 0
+FLAKY = 1
+CHANGED = 2
+STABLE = 3
+
+GROUP_NAMES = {FAILED: '최근 실패', FLAKY: '불안정', CHANGED: '변경/새 테스트', STABLE: '안정'}
+
+
+def changed_files(root='.'):
+    """
+    git 작업 트리에서 변경되었거나 새로 추가된 파일 목록
+
+    Returns:
+        set: 저장소 루트 기준 경로 (git을 사용할 수 없으면 빈 집합)
+    """
+    try:
+        result = subprocess.run(
+            ['git', 'status', '--porcelain', '--untracked-files=all'],
+            cwd=root, capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return set()
+    if result.returncode != 0:
+        return set()
+    files = set()
+    for line in result.stdout.splitlines():
+        path = line[3:]
+        # 이름 변경: "R  old -> new"
+        files.add(path.split(' -> ')[-1].strip('"'))
+    return files
+
+
+def priority_group(nodeid, history, changed=()):
+    """
+    테스트의 우선순위 그룹
+
+    Args:
+        nodeid (str): pytest nodeid
+        history (RunHistory): 실행 이력
+        changed (set): 변경된 파일 경로
+
+    Returns:
+        int: FAILED / FLAKY / CHANGED / STABLE
+    """
+    if history.last_failed(nodeid):
+        return FAILED
+    if history.is_flaky(nodeid):
+        return FLAKY
+    if nodeid.split('::')[0] in changed or history.duration(nodeid) is None:
+        return CHANGED
+    return STABLE
+
+
+def order_items(items, history, changed=()):
+    """
+    테스트 아이템을 실패 우선 + 빠른 테스트 우선으로 정렬
+
+    같은 그룹 안에서는 예상 소요 시간이 짧은 순서이며, 같으면 수집 순서를 유지합니다.
+
+    Args:
+        items (list): pytest 아이템 (nodeid 속성 필요)
+        history (RunHistory): 실행 이력
+        changed (set): 변경된 파일 경로
+
+    Returns:
+        tuple: (정렬된 아이템 리스트, 그룹별 테스트 수 dict)
+    """
+    default = history.default_duration()
+    keyed = []
+    counts = {}
+    for item in items:
+        group = priority_group(item.nodeid, history, changed)
+        counts[group] = counts.get(group, 0) + 1
+        keyed.append(((group, history.duration(item.nodeid, default)), item))
+    keyed.sort(key=lambda pair: pair[0])
+    return [item for _, item in keyed], counts
@@ -0,0 +1,146 @@
+"""
+병렬 테스트 실행기
+수집된 테스트를 과거 소요 시간 기준으로 워커 프로세스에 분배해 동시에 실행합니다.
+"""
+import os
+import subprocess
+import sys
+import time
+from config.config import TestConfig
+from utils.run_history import RunHistory
+from utils.perf_metrics import PerfMetricsStore
+from utils.report_merge import merge_junit_reports, merge_result_streams, write_html_report
+
+
+def collect_test_ids(test_path, env=None):
+    """
+    pytest --collect-only로 테스트 nodeid 목록 수집
+
+    Args:
+        test_path (str): 테스트 경로
+        env (dict): 환경 변수
+
+    Returns:
+        list: nodeid 리스트
+    """
+    cmd = [sys.executable, "-m", "pytest", "--collect-only", "-q", test_path]
+    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    return [line.strip() for line in result.stdout.splitlines() if '::' in line]
+
+
+def partition_tests(test_ids, buckets, history):
+    """
+    예상 소요 시간이 긴 테스트부터 가장 한가한 버킷에 배정 (LPT 스케줄링)
+
+    Args:
+        test_ids (list): nodeid 리스트
+        buckets (int): 버킷(워커/샤드) 수
+        history (RunHistory): 실행 이력
+
+    Returns:
+        tuple: (버킷별 nodeid 리스트, 버킷별 예상 소요 시간)
+    """
+    default = history.default_duration()
+    ordered = sorted(test_ids, key=lambda nodeid: history.duration(nodeid, default), reverse=True)
+
+    groups = [[] for _ in range(buckets)]
+    loads = [0.0] * buckets
+    for nodeid in ordered:
+        index = loads.index(min(loads))
+        groups[index].append(nodeid)
+        loads[index] += history.duration(nodeid, default)
+    return groups, loads
+
+
+def run_parallel(test_path, workers, env, report_dir="reports"):
+    """
+    워커 프로세스로 테스트 병렬 실행
+
+    각 워커는 드라이버 1개짜리 풀을 사용해 브라우저를 끝까지 재사용하고,
+    워커마다 자동 예약된 별도의 디버깅 포트를 사용합니다.
+
+    Args:
+        test_path (str): 테스트 경로
+        workers (int): 워커 수
+        env (dict): 환경 변수
+        report_dir (str): 리포트 디렉토리
+
+    Returns:
+        bool: 모든 워커 성공 여부
+    """
+    test_ids = collect_test_ids(test_path, env)
+    if not test_ids:
+        print("❌ 실행할 테스트를 찾을 수 없습니다.")
+        return False
+
+    history = RunHistory(TestConfig.RUN_HISTORY_FILE).load()
+    groups, loads = partition_tests(test_ids, workers, history)
+
+    # 워커들이 같은 파일에 기록하므로 이전 실행의 성능 지표는 미리 삭제
+    PerfMetricsStore(TestConfig.PERF_METRICS_FILE).reset()
+
+    start = time.time()
+    processes = []
+    junit_paths = []
+    stream_paths = []
+    for worker_id, nodeids in enumerate(groups):
+        if not nodeids:
+            continue
+        worker_dir = os.path.join(report_dir, "workers", f"w{worker_id}")
+        os.makedirs(worker_dir, exist_ok=True)
+        junit_path = os.path.join(worker_dir, "junit.xml")
+        junit_paths.append(junit_path)
+        stream_path = os.path.join(worker_dir, "results.jsonl")
+        stream_paths.append(stream_path)
+
+        worker_env = dict(env)
+        worker_env.update({
+            'WORKER_ID': str(worker_id),
+            'DRIVER_REUSE': 'true',
+            'DRIVER_POOL_SIZE': '1',
+            'REMOTE_DEBUGGING_PORT': 'auto',
+            # 워커는 결과 스트림만 기록하고 HTML은 병합 후 한 번만 생성
+            'REPORT_STREAM_FILE': stream_path,
+            'REPORT_HTML_FILE': '',
+            'TIMING_FILE': os.path.join(worker_dir, "timings.json"),
+        })
+        cmd = [sys.executable, "-m", "pytest", "-v", f"--junitxml={junit_path}", *nodeids]
+        log_file = open(os.path.join(worker_dir, "output.log"), "w", encoding="utf-8")
+        print(f"🧵 워커 {worker_id}: {len(nodeids)}개 테스트 (예상 {loads[worker_id]:.1f}초)")
+        processes.append((worker_id, subprocess.Popen(cmd, env=worker_env, stdout=log_file,
+                                                      stderr=subprocess.STDOUT), log_file))
+
+    success = True
+    for worker_id, process, log_file in processes:
+        returncode = process.wait()
+        log_file.close()
+        # 종료 코드 5: 실행된 테스트 없음
+        if returncode not in (0, 5):
+            success = False
+            print(f"❌ 워커 {worker_id} 실패 (종료 코드 {returncode})")
+        else:
+            print(f"✅ 워커 {worker_id} 완료")
+    print(f"⏱️ 병렬 실행 시간: {time.time() - start:.1f}초")
+
+    merge_junit_reports(junit_paths, os.path.join(report_dir, "junit.xml"))
+    results_path = os.path.join(report_dir, "results.jsonl")
+    results = merge_result_streams(stream_paths, results_path)
+    write_html_report(results, os.path.join(report_dir, "report.html"), TestConfig.SCREENSHOT_DIR,
+                      source=results_path)
+    return success
+
+
+def main(argv=None):
+    """명령행 실행: python -m utils.parallel_runner [테스트 경로] --workers=N"""
+    test_path = "tests/"
+    workers = os.cpu_count() or 1
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--workers="):
+            workers = int(arg.split("=")[1])
+        elif not arg.startswith("--"):
+            test_path = arg
+    return 0 if run_parallel(test_path, max(1, workers), os.environ.copy()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+"""
+브라우저 측 페이지 성능 지표 수집
+Navigation Timing, Resource Timing, LCP와 Chrome CDP Performance.getMetrics 값을 모아
+테스트별로 JSONL 결과 파일에 기록합니다.
+"""
+import json
+import os
+import time
+from utils.json_store import lock_file, unlock_file
+
+# arguments[0]: 느린 리소스 목록 최대 개수 → {navigation, resources, lcp} (단위: ms, byte)
+PAGE_METRICS_JS = """
+var limit = arguments[0], done = arguments[arguments.length - 1];
+
+function collect(lcp) {
+    var result = {navigation: null, resources: null, lcp: lcp};
+    var nav = performance.getEntriesByType('navigation')[0];
+    if (nav) {
+        result.navigation = {
+            type: nav.type,
+            protocol: nav.nextHopProtocol,
+            ttfb: nav.responseStart,
+            dom_interactive: nav.domInteractive,
+            dom_content_loaded: nav.domContentLoadedEventEnd,
+            load: nav.loadEventEnd,
+            transfer_size: nav.transferSize,
+            encoded_body_size: nav.encodedBodySize,
+            decoded_body_size: nav.decodedBodySize
+        };
+    }
+    var entries = performance.getEntriesByType('resource');
+    var byType = {}, transfer = 0, encoded = 0;
+    for (var i = 0; i < entries.length; i++) {
+        var entry = entries[i], type = entry.initiatorType || 'other';
+        byType[type] = byType[type] || {count: 0, transfer_size: 0};
+        byType[type].count += 1;
+        byType[type].transfer_size += entry.transferSize || 0;
+        transfer += entry.transferSize || 0;
+        encoded += entry.encodedBodySize || 0;
+    }
+    var slowest = entries.slice().sort(function (a, b) { return b.duration - a.duration; })
+        .slice(0, limit).map(function (entry) {
+            return {name: entry.name, type: entry.initiatorType,
+                    duration: entry.duration, transfer_size: entry.transferSize};
+        });
+    result.resources = {count: entries.length, transfer_size: transfer,
+                        encoded_body_size: encoded, by_type: byType, slowest: slowest};
+    done(result);
+}
+
+var types = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+if (types.indexOf('largest-contentful-paint') === -1) {
+    collect(null);
+} else {
+    var lcp = null;
+    var update = function (list) {
+        var items = list.getEntries();
+        if (items.length) {
+            var last = items[items.length - 1];
+            lcp = last.renderTime || last.loadTime || last.startTime;
+        }
+    };
+    var observer = new PerformanceObserver(update);
+    observer.observe({type: 'largest-contentful-paint', buffered: true});
+    // buffered 항목은 비동기로 전달되므로 잠깐 기다린 뒤 남은 항목까지 반영
+    setTimeout(function () {
+        update({getEntries: function () { return observer.takeRecords(); }});
+        observer.disconnect();
+        collect(lcp);
+    }, 50);
+}
+"""
+
+# CDP Performance.getMetrics 중 기록할 항목
+CDP_METRICS = (
+    'Documents', 'Nodes', 'JSEventListeners', 'LayoutCount', 'RecalcStyleCount',
+    'LayoutDuration', 'RecalcStyleDuration', 'ScriptDuration', 'TaskDuration',
+    'JSHeapUsedSize', 'JSHeapTotalSize',
+)
+
+
+def current_test_name():
+    """실행 중인 pytest 테스트 nodeid (테스트 밖이면 None)"""
+    current = os.environ.get('PYTEST_CURRENT_TEST')
+    if not current:
+        return None
+    return current.rsplit(' ', 1)[0]
+
+
+def collect_page_metrics(driver, resource_limit=10):
+    """
+    현재 페이지의 성능 지표 수집
+
+    Args:
+        driver: WebDriver 인스턴스
+        resource_limit (int): 기록할 느린 리소스 최대 개수
+
+    Returns:
+        dict: navigation / resources / lcp (ms, byte) 및 Chrome이면 cdp 지표
+    """
+    metrics = driver.execute_async_script(PAGE_METRICS_JS, resource_limit) or {}
+
+    if hasattr(driver, 'execute_cdp_cmd'):
+        # 이미 활성화된 경우에도 안전하게 호출 가능
+        driver.execute_cdp_cmd('Performance.enable', {})
+        response = driver.execute_cdp_cmd('Performance.getMetrics', {})
+        values = {item['name']: item['value'] for item in response.get('metrics', [])}
+        metrics['cdp'] = {name: values[name] for name in CDP_METRICS if name in values}
+    return metrics
+
+
+class PerfMetricsStore:
+    """테스트별 페이지 성능 지표를 JSONL로 누적하는 저장소"""
+
+    def __init__(self, path):
+        """
+        PerfMetricsStore 초기화
+
+        Args:
+            path (str): JSONL 파일 경로
+        """
+        self.path = path
+
+    def reset(self):
+        """이전 실행 결과 삭제"""
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def record(self, url, metrics, test_name=None):
+        """
+        지표 한 건 기록 (여러 워커 프로세스가 같은 파일에 기록해도 안전)
+
+        Args:
+            url (str): 이동한 URL
+            metrics (dict): collect_page_metrics 결과
+            test_name (str): 테스트 nodeid (기본값: 실행 중인 테스트)
+        """
+        record = {
+            'test': test_name or current_test_name(),
+            'url': url,
+            'timestamp': time.time(),
+        }
+        record.update(metrics)
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            lock_file(f)
+            try:
+                f.write(line)
+            finally:
+                unlock_file(f)
+
+    def by_test(self):
+        """
+        기록된 지표를 테스트별로 묶어 반환
+
+        Returns:
+            dict: 테스트 nodeid → 기록 리스트 (기록 순서)
+        """
+        grouped = {}
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    grouped.setdefault(record.get('test'), []).append(record)
+        except OSError:
+            pass
+        return grouped
@@ -0,0 +1,90 @@
+"""
+디버깅 포트 할당기
+같은 호스트의 여러 프로세스가 브라우저를 동시에 띄워도 포트가 겹치지 않도록
+잠금 파일로 포트를 예약합니다.
+"""
+import os
+import socket
+from utils.json_store import lock_file
+
+
+class PortAllocator:
+    """잠금 파일 기반의 프로세스 간 포트 예약"""
+
+    def __init__(self, lock_dir, attempts=50):
+        """
+        PortAllocator 초기화
+
+        Args:
+            lock_dir (str): 포트 잠금 파일 디렉토리 (호스트 내 프로세스가 공유)
+            attempts (int): 포트 예약 최대 시도 횟수
+        """
+        self.lock_dir = lock_dir
+        self.attempts = attempts
+        self._held = {}   # 포트 → 잠금을 유지하는 파일 디스크립터
+
+    def allocate(self):
+        """
+        사용 가능한 포트 예약
+
+        OS에서 빈 포트를 받은 뒤 잠금 파일에 flock을 걸어 예약합니다.
+        잠금은 예약하는 동안 유지되고, 프로세스가 비정상 종료되면 OS가 해제하므로
+        남은 잠금 파일을 회수하는 과정에서 두 프로세스가 같은 포트를 받는 일이 없습니다.
+
+        Returns:
+            int: 예약된 포트
+        """
+        os.makedirs(self.lock_dir, exist_ok=True)
+        for _ in range(self.attempts):
+            port = self._free_port()
+            if self._try_lock(port):
+                return port
+        raise RuntimeError(f"사용 가능한 디버깅 포트를 예약하지 못했습니다 ({self.attempts}회 시도)")
+
+    def release(self, port):
+        """
+        포트 예약 해제
+
+        Args:
+            port (int): allocate로 예약한 포트
+        """
+        fd = self._held.pop(port, None)
+        if fd is None:
+            return
+        # 잠금을 쥔 채로 파일을 지워야 다른 프로세스가 지워질 파일에 잠금을 걸지 않음
+        try:
+            os.remove(self._lock_path(port))
+        except OSError:
+            # 이미 지워졌거나, Windows처럼 열린 파일을 지울 수 없는 경우 (다음 예약 때 다시 잠금)
+            pass
+        os.close(fd)
+
+    def _try_lock(self, port):
+        path = self._lock_path(port)
+        fd = os.open(path, os.O_CREAT | os.O_RDWR, 0o644)
+        try:
+            lock_file(fd, blocking=False)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        # 잠금을 거는 사이 다른 프로세스가 해제하며 파일을 지웠으면 지워진 파일의 잠금이므로 무효
+        try:
+            current = os.stat(path)
+        except FileNotFoundError:
+            current = None
+        if current is None or current.st_ino != os.fstat(fd).st_ino:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._held[port] = fd
+        return True
+
+    def _lock_path(self, port):
+        return os.path.join(self.lock_dir, f"{port}.lock")
+
+    @staticmethod
+    def _free_port():
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
@@ -0,0 +1,186 @@
+"""
+드라이버 미리 실행 (pre-warm)
+테스트가 실행되는 동안 백그라운드 스레드가 다음 테스트에서 쓸 브라우저를 미리 띄워 두어,
+브라우저 실행 시간이 테스트 실행 시간과 겹치도록 합니다.
+미리 띄울 개수와 최소 여유 메모리(/proc/meminfo의 MemAvailable)를 넘지 않는 범위에서만 실행합니다.
+"""
+import threading
+import time
+
+
+def mem_available_mb(meminfo='/proc/meminfo'):
+    """
+    사용 가능한 메모리 (MemAvailable)
+
+    Returns:
+        float: MB 단위 여유 메모리 (확인할 수 없는 환경이면 None)
+    """
+    try:
+        with open(meminfo, encoding='ascii') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) / 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class DriverPrewarmer:
+    """다음 드라이버를 백그라운드에서 미리 실행해 보관하는 스레드"""
+
+    # 메모리 부족/실행 실패 후 다시 시도하기까지 대기 시간 (초)
+    RETRY_INTERVAL = 5
+    # 연속으로 이만큼 실행에 실패하면 미리 실행 중단
+    MAX_FAILURES = 3
+    # stop에서 실행 중인 브라우저가 끝나 종료될 때까지 기다리는 최대 시간 (초)
+    LAUNCH_TIMEOUT = 60
+
+    def __init__(self, create, destroy, count=1, min_available_mb=0, meminfo='/proc/meminfo'):
+        """
+        DriverPrewarmer 초기화
+
+        Args:
+            create (callable): 새 드라이버를 생성하는 함수
+            destroy (callable): 드라이버를 종료하는 함수
+            count (int): 미리 띄워 둘 드라이버 수
+            min_available_mb (int): 새 브라우저를 띄우기 위한 최소 여유 메모리 (MB, 0이면 확인 안 함)
+            meminfo (str): 여유 메모리를 읽을 파일
+        """
+        self._create = create
+        self._destroy = destroy
+        self.count = max(1, int(count))
+        self.min_available_mb = min_available_mb
+        self._meminfo = meminfo
+
+        self._lock = threading.Condition()
+        self._ready = []
+        self._spawning = 0
+        self._failures = 0
+        self._low_memory = False
+        self._stopped = False
+        self._thread = None
+
+        self.stats = {'spawned': 0, 'hits': 0, 'misses': 0, 'low_memory': 0, 'failed': 0}
+
+    def start(self):
+        """백그라운드 실행 시작"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='driver-prewarm', daemon=True)
+            self._thread.start()
+        return self
+
+    def take(self):
+        """
+        미리 실행된 드라이버 꺼내기 (실행 중인 드라이버가 있으면 완료될 때까지 대기)
+
+        꺼낸 자리는 백그라운드에서 다시 채웁니다.
+
+        Returns:
+            WebDriver: 미리 실행된 드라이버 (없으면 None - 호출자가 직접 실행)
+        """
+        while True:
+            with self._lock:
+                while not self._ready and not self._stopped and self._will_spawn_locked():
+                    self._lock.wait()
+                if not self._ready:
+                    self.stats['misses'] += 1
+                    return None
+                driver = self._ready.pop(0)
+                self._lock.notify_all()
+
+            # 대기하는 동안 브라우저가 종료되었으면 폐기하고 다음 드라이버 사용
+            try:
+                driver.window_handles
+            except Exception:
+                self._quietly_destroy(driver)
+                continue
+            with self._lock:
+                self.stats['hits'] += 1
+            return driver
+
+    def stop(self):
+        """
+        백그라운드 실행을 멈추고 사용되지 않은 드라이버 종료
+
+        실행 중인 브라우저는 실행이 끝나는 대로 종료되며, 세션 종료 후 브라우저가 남지 않도록
+        LAUNCH_TIMEOUT초까지 그 종료를 기다립니다.
+        """
+        with self._lock:
+            self._stopped = True
+            ready, self._ready = self._ready, []
+            self._lock.notify_all()
+        for driver in ready:
+            self._quietly_destroy(driver)
+        deadline = time.monotonic() + self.LAUNCH_TIMEOUT
+        with self._lock:
+            while self._spawning:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    print(f"⚠️ 미리 실행 중인 브라우저가 {self.LAUNCH_TIMEOUT}초 안에 끝나지 않아 기다리지 않고 종료합니다")
+                    return
+                self._lock.wait(remaining)
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._stopped and len(self._ready) + self._spawning >= self.count:
+                    self._lock.wait()
+                if self._stopped:
+                    return
+                self._low_memory = not self._has_memory()
+                if self._low_memory:
+                    self.stats['low_memory'] += 1
+                    self._lock.notify_all()
+                    self._lock.wait(self.RETRY_INTERVAL)
+                    continue
+                self._spawning += 1
+
+            try:
+                driver = self._create()
+            except Exception as e:
+                print(f"⚠️ 드라이버 미리 실행 실패: {e}")
+                driver = None
+
+            with self._lock:
+                keep = driver is not None and not self._stopped
+                if keep:
+                    self.stats['spawned'] += 1
+                    self._ready.append(driver)
+            if driver is not None and not keep:
+                # stop 이후에 실행이 끝난 드라이버 (stop은 실행 중 카운트가 줄어들 때까지 기다림)
+                self._quietly_destroy(driver)
+
+            with self._lock:
+                self._spawning -= 1
+                if driver is None:
+                    self.stats['failed'] += 1
+                    self._failures += 1
+                    if self._failures >= self.MAX_FAILURES:
+                        self._stopped = True
+                else:
+                    self._failures = 0
+                stopped = self._stopped
+                self._lock.notify_all()
+                if driver is None and not stopped:
+                    self._lock.wait(self.RETRY_INTERVAL)
+
+    def _will_spawn_locked(self):
+        # 실행 중이거나, 곧 실행할 예정이면(빈 자리 있음, 메모리 충분, 직전 실행 성공) 기다릴 가치가 있음
+        if self._spawning:
+            return True
+        return (self._thread is not None and len(self._ready) < self.count
+                and not self._low_memory and not self._failures)
+
+    def _has_memory(self):
+        if not self.min_available_mb:
+            return True
+        available = mem_available_mb(self._meminfo)
+        return available is None or available >= self.min_available_mb
+
+    def _quietly_destroy(self, driver):
+        try:
+            self._destroy(driver)
+        except Exception:
+            pass
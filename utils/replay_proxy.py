@@ -0,0 +1,482 @@
+"""
+HTTP 기록/재생 프록시
+브라우저의 HTTP 요청을 로컬 프록시로 받아 기록 모드에서는 실제 서버 응답을 디스크 아카이브에 저장하고,
+재생 모드에서는 네트워크 없이 아카이브의 응답만 돌려줍니다.
+
+HTTPS(CONNECT) 요청은 로컬 인증 기관(CA)으로 접속한 호스트의 인증서를 발급해 복호화한 뒤
+https:// URL 기준으로 기록/재생합니다 (openssl 명령 필요, 브라우저는 인증서 오류를 무시하도록 실행).
+CA 디렉토리를 지정하지 않았거나 openssl이 없으면 기록 모드에서는 그대로 터널링하고, 재생 모드에서는 거부합니다.
+
+사용법:
+    python -m utils.replay_proxy --mode=record|replay [--archive=recordings] [--port=8899]
+                                 [--ca-dir=~/.cache/seleniumtest/replay_ca]
+"""
+import hashlib
+import http.client
+import ipaddress
+import json
+import os
+import select
+import shutil
+import socket
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from utils.json_store import lock_file, unlock_file
+
+RECORD = 'record'
+REPLAY = 'replay'
+
+# 프록시가 전달하지 않는 연결 단위 헤더
+HOP_BY_HOP = {
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'proxy-connection',
+    'te', 'trailer', 'transfer-encoding', 'upgrade',
+}
+
+
+def request_key(method, url, body=b''):
+    """
+    요청 식별 키 (메서드, URL, 본문 해시)
+
+    Returns:
+        str: 아카이브 파일 이름으로 쓰는 sha256 해시
+    """
+    digest = hashlib.sha256()
+    digest.update(method.upper().encode())
+    digest.update(b' ')
+    digest.update(url.encode())
+    if body:
+        digest.update(b'\n')
+        digest.update(hashlib.sha256(body).digest())
+    return digest.hexdigest()
+
+
+class ReplayArchive:
+    """요청 키별 응답을 {key}.json(메타데이터) + {key}.body(본문)로 저장하는 아카이브"""
+
+    def __init__(self, root):
+        """
+        ReplayArchive 초기화
+
+        Args:
+            root (str): 아카이브 디렉토리
+        """
+        self.root = root
+
+    def _path(self, key, ext):
+        return os.path.join(self.root, key[:2], f"{key}.{ext}")
+
+    def _write(self, path, data):
+        # 여러 워커 프로세스가 같은 아카이브에 기록해도 안전하도록 임시 파일로 쓴 뒤 교체
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def save(self, method, url, request_body, status, reason, headers, body):
+        """
+        응답 저장 (같은 요청은 마지막 응답으로 덮어씀)
+
+        Args:
+            method (str): 요청 메서드
+            url (str): 요청 URL
+            request_body (bytes): 요청 본문
+            status (int): 응답 상태 코드
+            reason (str): 응답 상태 문구
+            headers (list): 응답 헤더 (이름, 값) 리스트
+            body (bytes): 응답 본문
+
+        Returns:
+            str: 요청 키
+        """
+        key = request_key(method, url, request_body)
+        meta = {
+            'method': method,
+            'url': url,
+            'status': status,
+            'reason': reason,
+            'headers': headers,
+            'recorded': time.time(),
+        }
+        self._write(self._path(key, 'body'), body)
+        self._write(self._path(key, 'json'), json.dumps(meta, ensure_ascii=False, indent=1).encode('utf-8'))
+        return key
+
+    def load(self, method, url, request_body=b''):
+        """
+        저장된 응답 읽기
+
+        Returns:
+            tuple: (메타데이터 dict, 본문 bytes), 없으면 None
+        """
+        key = request_key(method, url, request_body)
+        try:
+            with open(self._path(key, 'json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(self._path(key, 'body'), 'rb') as f:
+                body = f.read()
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+
+class CertificateAuthority:
+    """HTTPS 복호화용 로컬 인증 기관 (openssl 명령으로 CA와 호스트별 인증서 발급)"""
+
+    def __init__(self, directory):
+        """
+        CertificateAuthority 초기화
+
+        Args:
+            directory (str): CA 키/인증서와 호스트 인증서를 저장할 디렉토리 (여러 프로세스가 공유 가능)
+        """
+        self.directory = os.path.expanduser(directory)
+        self.cert_path = os.path.join(self.directory, 'ca.pem')
+        self.key_path = os.path.join(self.directory, 'ca.key')
+        self._host_key_path = os.path.join(self.directory, 'host.key')
+        self._contexts = {}
+        self._lock = threading.Lock()
+
+    def _openssl(self, *args):
+        subprocess.run(['openssl', *args], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    @contextmanager
+    def _locked(self):
+        # 여러 워커 프로세스가 동시에 같은 인증서를 만들지 않도록 파일 잠금
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        with open(os.path.join(self.directory, '.lock'), 'a') as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
+
+    def ensure(self):
+        """CA 키/인증서와 호스트 인증서용 키가 없으면 생성"""
+        if os.path.exists(self.cert_path) and os.path.exists(self._host_key_path):
+            return
+        with self._locked():
+            if not os.path.exists(self.cert_path):
+                tmp_key, tmp_cert = f"{self.key_path}.tmp", f"{self.cert_path}.tmp"
+                self._openssl('req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-sha256', '-days', '3650',
+                              '-subj', '/CN=Selenium Replay Proxy CA', '-keyout', tmp_key, '-out', tmp_cert,
+                              '-addext', 'basicConstraints=critical,CA:TRUE',
+                              '-addext', 'keyUsage=critical,keyCertSign,cRLSign')
+                os.replace(tmp_key, self.key_path)
+                os.replace(tmp_cert, self.cert_path)
+            if not os.path.exists(self._host_key_path):
+                self._openssl('genrsa', '-out', f"{self._host_key_path}.tmp", '2048')
+                os.replace(f"{self._host_key_path}.tmp", self._host_key_path)
+
+    def host_cert(self, host):
+        """
+        호스트 인증서 경로 (없으면 CA로 서명해 생성, 모든 호스트가 같은 키 사용)
+
+        Args:
+            host (str): 호스트 이름 또는 IP 주소
+
+        Returns:
+            tuple: (인증서 경로, 키 경로)
+        """
+        self.ensure()
+        try:
+            san = f"IP:{ipaddress.ip_address(host)}"
+        except ValueError:
+            san = f"DNS:{host}"
+        path = os.path.join(self.directory, 'hosts', f"{host.replace(':', '_')}.pem")
+        if not os.path.exists(path):
+            with self._locked():
+                if not os.path.exists(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    with tempfile.TemporaryDirectory(dir=self.directory) as work:
+                        csr, ext = os.path.join(work, 'host.csr'), os.path.join(work, 'host.ext')
+                        with open(ext, 'w') as f:
+                            f.write(f"subjectAltName={san}\nextendedKeyUsage=serverAuth\n")
+                        self._openssl('req', '-new', '-key', self._host_key_path, '-subj', f"/CN={host}",
+                                      '-out', csr)
+                        self._openssl('x509', '-req', '-in', csr, '-CA', self.cert_path, '-CAkey', self.key_path,
+                                      '-set_serial', str(int.from_bytes(os.urandom(8), 'big')),
+                                      '-days', '397', '-sha256', '-extfile', ext, '-out', f"{path}.tmp")
+                    os.replace(f"{path}.tmp", path)
+        return path, self._host_key_path
+
+    def server_context(self, host):
+        """호스트 인증서를 사용하는 서버용 SSLContext (호스트별로 캐시)"""
+        with self._lock:
+            context = self._contexts.get(host)
+        if context is None:
+            cert, key = self.host_cert(host)
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(cert, key)
+            with self._lock:
+                context = self._contexts.setdefault(host, context)
+        return context
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    """절대 URL 요청(프록시 요청)과 복호화한 HTTPS 요청을 기록/재생하는 핸들러"""
+
+    protocol_version = 'HTTP/1.1'
+    # 복호화 중인 HTTPS 연결의 원본 주소 (예: https://example.com), 일반 프록시 요청이면 None
+    origin = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        proxy = self.server.proxy
+        length = int(self.headers.get('Content-Length') or 0)
+        request_body = self.rfile.read(length) if length else b''
+        url = self.path
+        if self.origin and url.startswith('/'):
+            url = self.origin + url
+        elif not url.startswith('http://'):
+            self._send(400, 'Bad Request', [], b'absolute http:// URL required')
+            return
+
+        if proxy.mode == REPLAY:
+            stored = proxy.archive.load(self.command, url, request_body)
+            if stored is None:
+                proxy.count('missed')
+                self._send(404, 'Not Recorded', [('X-Replay', 'miss')], f"not recorded: {url}".encode())
+                return
+            meta, body = stored
+            proxy.count('replayed')
+            self._send(meta['status'], meta['reason'], meta['headers'], body)
+            return
+
+        try:
+            status, reason, headers, body = proxy.fetch(self.command, url, self.headers, request_body)
+        except OSError as e:
+            self._send(502, 'Bad Gateway', [], f"upstream error: {e}".encode())
+            return
+        proxy.archive.save(self.command, url, request_body, status, reason, headers, body)
+        proxy.count('recorded')
+        self._send(status, reason, headers, body)
+
+    def _send(self, status, reason, headers, body):
+        self.send_response(status, reason)
+        for name, value in headers:
+            if name.lower() not in HOP_BY_HOP and name.lower() != 'content-length':
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+    def do_CONNECT(self):
+        """HTTPS 연결 (CA가 있으면 복호화해 기록/재생, 없으면 기록 모드에서만 그대로 터널링)"""
+        proxy = self.server.proxy
+        host, _, port = self.path.partition(':')
+        if proxy.ca is not None:
+            self._intercept(host, int(port or 443))
+            return
+        if proxy.mode == REPLAY:
+            proxy.count('refused')
+            self._send(502, 'HTTPS Not Replayable', [], b'')
+            self.close_connection = True
+            return
+
+        try:
+            upstream = socket.create_connection((host, int(port or 443)), timeout=proxy.timeout)
+        except OSError as e:
+            self._send(502, 'Bad Gateway', [], f"upstream error: {e}".encode())
+            return
+        proxy.count('tunneled')
+        self.send_response(200, 'Connection Established')
+        self.end_headers()
+        self.close_connection = True
+        _relay(self.connection, upstream)
+
+    def _intercept(self, host, port):
+        """호스트 인증서로 TLS를 종료하고 연결이 끝날 때까지 안쪽 HTTP 요청을 처리"""
+        proxy = self.server.proxy
+        self.close_connection = True
+        try:
+            context = proxy.ca.server_context(host)
+        except (OSError, subprocess.CalledProcessError) as e:
+            self._send(502, 'Bad Gateway', [], f"certificate error: {e}".encode())
+            return
+        self.send_response(200, 'Connection Established')
+        self.end_headers()
+        try:
+            tls = context.wrap_socket(self.connection, server_side=True)
+        except OSError:
+            return
+        proxy.count('intercepted')
+        tls.settimeout(proxy.timeout)
+        plain_files = self.rfile, self.wfile
+        self.rfile, self.wfile = tls.makefile('rb', self.rbufsize), tls.makefile('wb')
+        self.origin = f"https://{host}" if port == 443 else f"https://{host}:{port}"
+        try:
+            self.close_connection = False
+            while not self.close_connection:
+                self.handle_one_request()
+        finally:
+            self.close_connection = True
+            for f in (self.wfile, self.rfile):
+                try:
+                    f.close()
+                except OSError:
+                    pass
+            self.rfile, self.wfile = plain_files
+            tls.close()
+
+
+def _relay(client, upstream):
+    """두 소켓 사이에서 한쪽이 닫힐 때까지 데이터 전달"""
+    sockets = [client, upstream]
+    try:
+        while True:
+            readable, _, errored = select.select(sockets, [], sockets, 60)
+            if errored or not readable:
+                return
+            for sock in readable:
+                data = sock.recv(65536)
+                if not data:
+                    return
+                (upstream if sock is client else client).sendall(data)
+    except OSError:
+        pass
+    finally:
+        upstream.close()
+
+
+class ReplayProxy:
+    """백그라운드 스레드 풀에서 동작하는 기록/재생 HTTP 프록시"""
+
+    def __init__(self, archive_dir, mode=REPLAY, host='127.0.0.1', port=0, timeout=30, ca_dir=None):
+        """
+        ReplayProxy 초기화
+
+        Args:
+            archive_dir (str): 아카이브 디렉토리
+            mode (str): 'record' (실제 서버 응답 저장) / 'replay' (아카이브 응답만 사용)
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 빈 포트 자동 선택)
+            timeout (float): 기록 모드의 실제 서버 연결 타임아웃 (초)
+            ca_dir (str): HTTPS 복호화용 CA 디렉토리 (None이면 HTTPS는 터널링/거부)
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"지원하지 않는 프록시 모드: {mode} (record / replay)")
+        self.archive = ReplayArchive(archive_dir)
+        self.mode = mode
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.stats = {'recorded': 0, 'replayed': 0, 'missed': 0, 'intercepted': 0, 'tunneled': 0, 'refused': 0}
+        # 기록 모드에서 실제 HTTPS 서버 인증서 검증에 사용
+        self.upstream_context = ssl.create_default_context()
+        self.ca = None
+        if ca_dir:
+            if shutil.which('openssl'):
+                self.ca = CertificateAuthority(ca_dir)
+            else:
+                print("⚠️ openssl이 없어 HTTPS를 복호화하지 않습니다 (record: 그대로 통과, replay: 거부)")
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def address(self):
+        """브라우저 프록시 설정에 사용할 주소 (예: 127.0.0.1:54321)"""
+        return f"{self.host}:{self.port}"
+
+    def count(self, name):
+        """통계 증가 (요청 처리 스레드에서 호출)"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def fetch(self, method, url, headers, body):
+        """
+        실제 서버에 요청 전달 (리다이렉트는 따라가지 않음)
+
+        Returns:
+            tuple: (상태 코드, 상태 문구, 헤더 리스트, 본문)
+        """
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        forward = {name: value for name, value in headers.items() if name.lower() not in HOP_BY_HOP}
+        if parts.scheme == 'https':
+            connection = http.client.HTTPSConnection(parts.hostname, parts.port or 443, timeout=self.timeout,
+                                                     context=self.upstream_context)
+        else:
+            connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=self.timeout)
+        try:
+            connection.request(method, path, body=body or None, headers=forward)
+            response = connection.getresponse()
+            return response.status, response.reason, response.getheaders(), response.read()
+        finally:
+            connection.close()
+
+    def start(self):
+        """프록시 시작"""
+        if self._server is not None:
+            return self
+        if self.ca is not None:
+            self.ca.ensure()
+        self._server = ThreadingHTTPServer((self.host, self.port), _ProxyHandler)
+        self._server.daemon_threads = True
+        self._server.proxy = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name='replay-proxy', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """프록시 종료"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def main(argv=None):
+    """명령행 실행: 프록시를 띄우고 Ctrl+C까지 대기"""
+    options = {'mode': REPLAY, 'archive_dir': 'recordings', 'port': 8899, 'ca_dir': '~/.cache/seleniumtest/replay_ca'}
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--mode="):
+            options['mode'] = arg.split("=")[1]
+        elif arg.startswith("--archive="):
+            options['archive_dir'] = arg.split("=", 1)[1]
+        elif arg.startswith("--port="):
+            options['port'] = int(arg.split("=")[1])
+        elif arg.startswith("--ca-dir="):
+            options['ca_dir'] = arg.split("=", 1)[1]
+    proxy = ReplayProxy(**options).start()
+    print(f"🔁 {proxy.mode} 프록시 실행 중: http://{proxy.address} (아카이브: {options['archive_dir']})")
+    if proxy.ca is not None:
+        print(f"🔐 HTTPS 복호화 CA: {proxy.ca.cert_path} (브라우저는 인증서 오류 무시 필요)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        proxy.stop()
+        print(f"📊 {proxy.stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+워커별 테스트 리포트 병합
+여러 프로세스가 만든 JUnit XML과 JSONL 결과를 하나로 합치고, 크기가 제한된 HTML 리포트를 생성합니다.
+"""
+import html
+import json
+import os
+import time
+import xml.etree.ElementTree as ET
+from utils.screenshot_store import ScreenshotStore
+from utils.report_stream import read_results
+
+
+def merge_junit_reports(paths, output_path):
+    """
+    JUnit XML 리포트 병합
+
+    Args:
+        paths (list): 병합할 JUnit XML 파일 경로들
+        output_path (str): 병합 결과 파일 경로
+
+    Returns:
+        list: 병합된 테스트 결과 (dict 리스트)
+    """
+    merged = ET.Element('testsuite', name='pytest')
+    totals = {'tests': 0, 'failures': 0, 'errors': 0, 'skipped': 0}
+    elapsed = 0.0
+
+    for path in paths:
+        if not os.path.exists(path):
+            print(f"⚠️ 리포트 없음: {path}")
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == 'testsuite' else root.findall('testsuite')
+        for suite in suites:
+            for key in totals:
+                totals[key] += int(suite.get(key, 0))
+            elapsed = max(elapsed, float(suite.get('time', 0)))
+            for case in suite.findall('testcase'):
+                merged.append(case)
+
+    for key, value in totals.items():
+        merged.set(key, str(value))
+    merged.set('time', f"{elapsed:.3f}")
+
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    ET.ElementTree(merged).write(output_path, encoding='utf-8', xml_declaration=True)
+
+    return [_case_result(case) for case in merged.findall('testcase')]
+
+
+def merge_result_streams(paths, output_path):
+    """
+    워커별 JSONL 결과를 하나의 파일로 병합
+
+    Args:
+        paths (list): 워커별 JSONL 파일 경로
+        output_path (str): 병합 결과 파일 경로
+
+    Returns:
+        list: 병합된 결과 dict 리스트
+    """
+    results = read_results(paths)
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for result in results:
+            f.write(json.dumps(result, ensure_ascii=False) + '\n')
+    return results
+
+
+def _case_result(case):
+    """testcase 요소를 결과 dict로 변환"""
+    outcome, message = 'passed', ''
+    for tag, name in (('failure', 'failed'), ('error', 'error'), ('skipped', 'skipped')):
+        child = case.find(tag)
+        if child is not None:
+            outcome = name
+            message = child.get('message', '') or (child.text or '')
+            break
+    return {
+        'classname': case.get('classname', ''),
+        'name': case.get('name', ''),
+        'duration': float(case.get('time', 0)),
+        'outcome': outcome,
+        'message': message,
+    }
+
+
+def find_failure_screenshots(result, screenshot_dir, entries=None):
+    """
+    테스트에 해당하는 실패 스크린샷 파일 찾기
+
+    같은 실행(run)에서 촬영된 스크린샷만 연결하며, 통과/건너뛴 테스트에는 연결하지 않습니다.
+
+    Args:
+        result (dict): 테스트 결과
+        screenshot_dir (str): 스크린샷 디렉토리
+        entries (list): 스크린샷 저장소 인덱스 항목 (없으면 screenshot_dir에서 읽음)
+
+    Returns:
+        list: 최근 촬영 순서의 스크린샷 파일명 리스트 (중복 제거)
+    """
+    run = result.get('run')
+    if not run or result.get('outcome') in ('passed', 'skipped'):
+        return []
+    if entries is None:
+        entries = ScreenshotStore(screenshot_dir).entries()
+    suffix = f".{result['name']}"
+    matched = []
+    for entry in entries:
+        test_name = entry.get('test') or ''
+        if entry.get('kind') != 'failure' or entry.get('run') != run or not test_name.endswith(suffix):
+            continue
+        if result['classname'].startswith(test_name[:-len(suffix)]):
+            matched.append(entry)
+    matched.sort(key=lambda entry: entry.get('timestamp') or 0, reverse=True)
+    files = []
+    for entry in matched:
+        if entry['file'] not in files:
+            files.append(entry['file'])
+    return files
+
+
+def write_html_report(results, output_path, screenshot_dir, max_rows=500, max_message=2000,
+                      max_screenshots=3, source=None):
+    """
+    테스트 결과로 HTML 리포트 생성
+
+    스크린샷은 파일로 링크하고 lazy 로딩하며, 행 수와 메시지 길이를 제한하므로
+    실패가 아무리 많아도 리포트 크기는 일정 범위를 넘지 않습니다.
+    실패/오류가 먼저, 같은 결과끼리는 오래 걸린 테스트가 먼저 표시됩니다.
+
+    Args:
+        results (list): 결과 dict 리스트 (merge_junit_reports 또는 JSONL 결과)
+        output_path (str): HTML 파일 경로
+        screenshot_dir (str): 스크린샷 디렉토리
+        max_rows (int): 표시할 최대 행 수
+        max_message (int): 행마다 표시할 메시지 최대 길이
+        max_screenshots (int): 행마다 표시할 스크린샷 최대 개수
+        source (str): 전체 결과 JSONL 경로 (지정하면 리포트에 링크)
+    """
+    report_dir = os.path.dirname(os.path.abspath(output_path))
+    counts = {}
+    for result in results:
+        counts[result['outcome']] = counts.get(result['outcome'], 0) + 1
+
+    order = {'failed': 0, 'error': 0, 'skipped': 1, 'passed': 2}
+    shown = sorted(results, key=lambda r: (order.get(r['outcome'], 1), -r['duration']))[:max_rows]
+    # 기간 기준 정리로 지워진 이미지는 인덱스에서도 제거
+    entries = ScreenshotStore(screenshot_dir).prune()
+
+    rows = []
+    for result in shown:
+        images = []
+        for name in find_failure_screenshots(result, screenshot_dir, entries)[:max_screenshots]:
+            src = html.escape(os.path.relpath(os.path.join(screenshot_dir, name), report_dir))
+            images.append(f'<a href="{src}"><img src="{src}" loading="lazy" alt="📸"></a>')
+        message = result['message'] or ''
+        if len(message) > max_message:
+            message = message[:max_message] + f"\n... ({len(message) - max_message}자 생략)"
+        rows.append(
+            f'<tr class="{result["outcome"]}">'
+            f'<td>{html.escape(result["classname"])}::{html.escape(result["name"])}</td>'
+            f'<td>{result["outcome"]}</td>'
+            f'<td>{result["duration"]:.2f}s</td>'
+            f'<td><pre>{html.escape(message)}</pre>{"".join(images)}</td>'
+            '</tr>'
+        )
+
+    notes = []
+    if len(results) > len(shown):
+        notes.append(f"{len(results) - len(shown)}개 결과는 생략되었습니다.")
+    if source:
+        href = html.escape(os.path.relpath(os.path.abspath(source), report_dir))
+        notes.append(f'전체 결과: <a href="{href}">{html.escape(os.path.basename(source))}</a>')
+
+    summary = ', '.join(f"{outcome}: {count}" for outcome, count in sorted(counts.items()))
+    document = f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>테스트 리포트</title>
+<style>
+body {{ font-family: sans-serif; margin: 20px; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }}
+tr.passed td:nth-child(2) {{ color: #2e7d32; }}
+tr.failed td:nth-child(2), tr.error td:nth-child(2) {{ color: #c62828; }}
+tr.skipped td:nth-child(2) {{ color: #9e9e9e; }}
+pre {{ margin: 0; white-space: pre-wrap; }}
+img {{ max-width: 320px; margin: 4px 4px 0 0; border: 1px solid #ddd; }}
+</style>
+</head>
+<body>
+<h1>테스트 리포트</h1>
+<p>생성 시간: {time.strftime('%Y-%m-%d %H:%M:%S')} / 총 {len(results)}개 ({summary})</p>
+<p>{' / '.join(notes)}</p>
+<table>
+<tr><th>테스트</th><th>결과</th><th>소요 시간</th><th>메시지</th></tr>
+{''.join(rows)}
+</table>
+</body>
+</html>
+"""
+    os.makedirs(report_dir, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(document)
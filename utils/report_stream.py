@@ -0,0 +1,111 @@
+"""
+스트리밍 테스트 결과 기록기
+테스트가 끝날 때마다 결과를 JSONL 한 줄로 추가해, 세션이 중간에 끊겨도 결과가 남습니다.
+"""
+import json
+import os
+import threading
+import time
+
+
+def split_nodeid(nodeid):
+    """
+    pytest nodeid를 JUnit 형식의 (classname, name)으로 변환
+
+    Args:
+        nodeid (str): 예) tests/test_example.py::TestExample::test_case
+
+    Returns:
+        tuple: (classname, name) 예) ('tests.test_example.TestExample', 'test_case')
+    """
+    path, _, rest = nodeid.partition('::')
+    if path.endswith('.py'):
+        path = path[:-3]
+    names = path.replace('\\', '/').split('/')
+    if rest:
+        names.extend(rest.split('::'))
+    return '.'.join(names[:-1]), names[-1]
+
+
+def read_results(paths):
+    """
+    JSONL 결과 파일 읽기 (없는 파일과 손상된 줄은 건너뜀)
+
+    Args:
+        paths (list): JSONL 파일 경로들
+
+    Returns:
+        list: 결과 dict 리스트
+    """
+    results = []
+    for path in paths:
+        try:
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        results.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            continue
+    return results
+
+
+class ReportStream:
+    """테스트 결과를 JSONL 파일에 한 줄씩 추가하는 기록기"""
+
+    # 결과 한 줄에 남길 오류 메시지 최대 길이
+    MESSAGE_LIMIT = 8000
+
+    def __init__(self, path):
+        """
+        ReportStream 초기화
+
+        Args:
+            path (str): JSONL 파일 경로
+        """
+        self.path = path
+        self._file = None
+        self._lock = threading.Lock()
+
+    def open(self):
+        """파일을 새로 만들어 기록 시작 (이전 실행 결과는 지움)"""
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def write(self, nodeid, outcome, duration, message='', **extra):
+        """
+        테스트 결과 한 줄 기록 (바로 디스크에 반영)
+
+        Args:
+            nodeid (str): pytest nodeid
+            outcome (str): passed / failed / error / skipped
+            duration (float): 소요 시간 (초)
+            message (str): 실패/건너뜀 사유
+            **extra: 추가로 기록할 필드
+        """
+        if self._file is None:
+            return
+        classname, name = split_nodeid(nodeid)
+        record = {
+            'nodeid': nodeid,
+            'classname': classname,
+            'name': name,
+            'outcome': outcome,
+            'duration': round(duration, 4),
+            'message': (message or '')[:self.MESSAGE_LIMIT],
+            'timestamp': time.time(),
+        }
+        record.update(extra)
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def close(self):
+        """기록 종료"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
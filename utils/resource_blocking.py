@@ -0,0 +1,108 @@
+"""
+네트워크 요청 차단
+이미지, 폰트, 미디어, 분석/광고 도메인 요청을 Chrome CDP Network.setBlockedURLs로 차단해
+무거운 페이지의 로드 시간을 줄입니다. 이미지는 Chrome 설정(prefs)으로도 차단할 수 있습니다.
+"""
+
+
+def _extension_patterns(*extensions):
+    """
+    확장자로 끝나는 URL 패턴 (쿼리 문자열 포함)
+
+    '*.png*'처럼 뒤를 열어 두면 'app.iconfont.js', 'guide.png-tips.html' 같은 URL도 차단되므로
+    경로가 확장자로 끝나거나 확장자 바로 뒤에 쿼리가 오는 경우만 차단합니다.
+    """
+    patterns = []
+    for extension in extensions:
+        patterns.extend([f'*.{extension}', f'*.{extension}?*'])
+    return patterns
+
+
+# 리소스 분류 → Network.setBlockedURLs 패턴 ('*'는 임의 문자열)
+RESOURCE_CLASSES = {
+    'images': _extension_patterns('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'svg', 'ico', 'bmp'),
+    'fonts': _extension_patterns('woff', 'woff2', 'ttf', 'otf', 'eot'),
+    'media': _extension_patterns('mp4', 'webm', 'm3u8', 'ts', 'mp3', 'ogg', 'wav', 'm4a'),
+    'analytics': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*analytics.google.com*',
+        '*hotjar.com*', '*clarity.ms*', '*mixpanel.com*', '*amplitude.com*',
+        '*segment.io*', '*segment.com*', '*newrelic.com*', '*nr-data.net*',
+        '*facebook.net*', '*connect.facebook.com*', '*wcs.naver.net*', '*kakao.com/t/*',
+    ],
+    'ads': [
+        '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*',
+        '*adservice.google.*', '*criteo.com*', '*criteo.net*', '*adnxs.com*',
+        '*taboola.com*', '*outbrain.com*', '*mobon.net*', '*adsrvr.org*',
+    ],
+}
+
+# 분류를 지정하지 않았을 때 차단할 기본 분류
+DEFAULT_CLASSES = ('images', 'fonts', 'media', 'analytics', 'ads')
+
+
+def parse_list(value):
+    """쉼표로 구분된 문자열 또는 리스트를 공백 없는 리스트로 변환"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(',')
+    return [item.strip() for item in value if item and item.strip()]
+
+
+def blocked_url_patterns(classes=(), patterns=()):
+    """
+    차단할 URL 패턴 목록
+
+    Args:
+        classes (list): 리소스 분류 (images / fonts / media / analytics / ads)
+        patterns (list): 추가 URL 패턴 (예: '*.hanatour.com/banner/*')
+
+    Returns:
+        list: 중복을 제거한 URL 패턴
+    """
+    result = []
+    for name in parse_list(classes):
+        if name not in RESOURCE_CLASSES:
+            raise ValueError(f"알 수 없는 리소스 분류: {name} (사용 가능: {', '.join(RESOURCE_CLASSES)})")
+        result.extend(RESOURCE_CLASSES[name])
+    result.extend(parse_list(patterns))
+    return list(dict.fromkeys(result))
+
+
+def chrome_prefs(classes=()):
+    """
+    브라우저 실행 시점에 적용할 Chrome 설정 (이미지 차단)
+
+    Args:
+        classes (list): 리소스 분류
+
+    Returns:
+        dict: add_experimental_option('prefs', ...)에 전달할 설정
+    """
+    if 'images' in parse_list(classes):
+        return {'profile.managed_default_content_settings.images': 2}
+    return {}
+
+
+def apply_blocking(driver, patterns):
+    """
+    CDP로 URL 패턴 차단 (현재 탭에 적용, 다시 호출하면 패턴 교체)
+
+    Args:
+        driver: Chrome/Edge WebDriver
+        patterns (list): blocked_url_patterns 결과
+
+    Returns:
+        bool: 적용 여부 (CDP를 지원하지 않는 브라우저면 False)
+    """
+    if not hasattr(driver, 'execute_cdp_cmd'):
+        return False
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': list(patterns)})
+    return True
+
+
+def clear_blocking(driver):
+    """apply_blocking으로 설정한 차단 해제"""
+    if hasattr(driver, 'execute_cdp_cmd'):
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': []})
@@ -0,0 +1,104 @@
+"""
+테스트 실행 이력 저장소
+테스트별 소요 시간과 최근 결과를 파일에 누적해 스케줄링과 실행 순서 결정에 사용합니다.
+"""
+from utils.json_store import JsonTestStore
+
+
+class RunHistory(JsonTestStore):
+    """테스트 nodeid별 실행 이력을 보관하는 JSON 저장소"""
+
+    TMP_PREFIX = '.history_'
+
+    # 최근 실행 결과의 반영 비율 (지수 이동 평균)
+    SMOOTHING = 0.5
+    
+    # 테스트별로 보관하는 최근 결과 수
+    OUTCOME_WINDOW = 10
+
+    def __init__(self, path):
+        """
+        RunHistory 초기화
+
+        Args:
+            path (str): 이력 파일 경로
+        """
+        super().__init__(path)
+        self._pending = {}
+
+    def duration(self, nodeid, default=None):
+        """
+        테스트의 예상 소요 시간 반환
+
+        Args:
+            nodeid (str): pytest nodeid
+            default (float): 이력이 없을 때 반환할 값
+
+        Returns:
+            float: 예상 소요 시간 (초)
+        """
+        entry = self.tests.get(nodeid)
+        if entry is None or entry.get('duration') is None:
+            return default
+        return entry['duration']
+
+    def outcomes(self, nodeid):
+        """
+        테스트의 최근 결과 목록 (오래된 순)
+
+        Returns:
+            list: passed / failed / skipped 리스트
+        """
+        entry = self.tests.get(nodeid) or {}
+        return entry.get('outcomes') or ([entry['last_outcome']] if entry.get('last_outcome') else [])
+
+    def last_failed(self, nodeid):
+        """마지막 실행이 실패였는지 여부"""
+        recent = self.outcomes(nodeid)
+        return bool(recent) and recent[-1] == 'failed'
+
+    def is_flaky(self, nodeid):
+        """최근 결과에 성공과 실패가 섞여 있는지 여부"""
+        recent = set(self.outcomes(nodeid))
+        return 'passed' in recent and 'failed' in recent
+
+    def default_duration(self):
+        """이력이 없는 테스트에 사용할 기본 소요 시간 (알려진 값의 중앙값)"""
+        known = sorted(e['duration'] for e in self.tests.values() if e.get('duration') is not None)
+        if not known:
+            return 1.0
+        return known[len(known) // 2]
+
+    def record(self, nodeid, duration, outcome=None):
+        """
+        테스트 실행 결과 기록 (save 호출 시 파일에 반영)
+
+        Args:
+            nodeid (str): pytest nodeid
+            duration (float): 소요 시간 (초)
+            outcome (str): passed / failed / skipped
+        """
+        self._pending[nodeid] = {'duration': duration, 'outcome': outcome}
+
+    def save(self):
+        """기록된 결과를 파일에 병합 저장 (여러 프로세스가 동시에 저장해도 안전)"""
+        if not self._pending:
+            return
+        with self._locked():
+            tests = self._read()
+            for nodeid, result in self._pending.items():
+                self._merge_entry(tests.setdefault(nodeid, {}), result)
+            self._write(tests)
+            self.tests = tests
+        self._pending = {}
+
+    def _merge_entry(self, entry, result):
+        """기존 이력 항목에 새 실행 결과 반영"""
+        previous = entry.get('duration')
+        duration = result['duration']
+        if previous is not None:
+            duration = previous + (duration - previous) * self.SMOOTHING
+        entry['duration'] = round(duration, 4)
+        if result.get('outcome'):
+            entry['last_outcome'] = result['outcome']
+            entry['outcomes'] = (entry.get('outcomes', []) + [result['outcome']])[-self.OUTCOME_WINDOW:]
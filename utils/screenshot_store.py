@@ -0,0 +1,204 @@
+"""
+내용 주소 기반 스크린샷 저장소
+스크린샷을 SHA-256 해시로 저장해 같은 이미지는 한 번만 기록하고,
+테스트 → 해시/URL/제목/시간 정보는 작은 인덱스 파일에 남깁니다.
+"""
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 PNG 원본 그대로 저장
+    Image = None
+
+from utils.json_store import lock_file, unlock_file
+
+
+class ScreenshotStore:
+    """해시 파일명으로 스크린샷을 중복 없이 저장하는 저장소"""
+
+    INDEX_FILE = 'index.jsonl'
+
+    # 인덱스에 남길 오류 메시지 최대 길이
+    ERROR_LIMIT = 4000
+
+    # 이미지 형식 → (Pillow 형식 이름, 확장자)
+    FORMATS = {
+        'png': ('PNG', 'png'),
+        'webp': ('WEBP', 'webp'),
+        'jpeg': ('JPEG', 'jpg'),
+        'jpg': ('JPEG', 'jpg'),
+    }
+
+    def __init__(self, root, image_format='png', quality=80, max_width=0):
+        """
+        ScreenshotStore 초기화
+
+        Args:
+            root (str): 저장 디렉토리
+            image_format (str): 저장 형식 (png / webp / jpeg, png 외 형식은 Pillow 필요)
+            quality (int): webp/jpeg 품질 (1-100)
+            max_width (int): 이보다 넓은 이미지는 비율을 유지해 축소 (0이면 원본 크기)
+        """
+        self.root = root
+        self.image_format = (image_format or 'png').lower()
+        self.quality = int(quality)
+        self.max_width = int(max_width or 0)
+        self._lock = threading.Lock()
+
+        if self.image_format not in self.FORMATS:
+            raise ValueError(f"지원하지 않는 스크린샷 형식: {image_format}")
+        if Image is None and (self.image_format != 'png' or self.max_width):
+            print("⚠️ Pillow가 설치되지 않아 스크린샷을 PNG 원본으로 저장합니다")
+            self.image_format, self.max_width = 'png', 0
+
+    @property
+    def index_path(self):
+        """인덱스 파일 경로"""
+        return os.path.join(self.root, self.INDEX_FILE)
+
+    def put(self, png_bytes, test_name=None, url=None, title=None, kind='failure',
+            error_info=None, timestamp=None, run=None):
+        """
+        스크린샷 저장 및 인덱스 기록
+
+        같은 내용의 스크린샷이 이미 있으면 파일을 다시 쓰지 않고 인덱스만 추가합니다.
+
+        Args:
+            png_bytes (bytes): WebDriver가 반환한 PNG 데이터
+            test_name (str): 테스트 이름
+            url (str): 촬영 시점의 URL
+            title (str): 촬영 시점의 페이지 제목
+            kind (str): failure(실패 자동 촬영) / manual(직접 촬영)
+            error_info (str): 오류 정보
+            timestamp (float): 촬영 시각 (기본값: 현재 시각)
+            run (str): 실행 식별자 (리포트에서 같은 실행의 결과와 연결)
+
+        Returns:
+            str: 저장된 스크린샷 파일 경로
+        """
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        filename = f"{digest}.{self.FORMATS[self.image_format][1]}"
+        path = os.path.join(self.root, filename)
+        os.makedirs(self.root, exist_ok=True)
+
+        # 해시는 원본 PNG 기준이므로 같은 화면은 재인코딩 없이 건너뜀
+        # (기간 기준 정리에서 지워지지 않도록 수정 시각만 갱신)
+        if os.path.exists(path):
+            os.utime(path)
+        else:
+            self._write_atomic(path, self._encode(png_bytes))
+
+        entry = {
+            'test': test_name,
+            'kind': kind,
+            'hash': digest,
+            'file': filename,
+            'url': url,
+            'title': title,
+            'timestamp': timestamp if timestamp is not None else time.time(),
+        }
+        if run:
+            entry['run'] = run
+        if error_info:
+            entry['error'] = error_info[:self.ERROR_LIMIT]
+        self._append_index(entry)
+        return path
+
+    def entries(self, test_name=None):
+        """
+        인덱스 항목 조회
+
+        Args:
+            test_name (str): 지정하면 해당 테스트 항목만 반환
+
+        Returns:
+            list: 인덱스 항목 (dict) 리스트
+        """
+        entries = []
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if test_name is None or entry.get('test') == test_name:
+                        entries.append(entry)
+        except OSError:
+            pass
+        return entries
+
+    def prune(self):
+        """
+        이미지 파일이 삭제된 인덱스 항목 제거 (기간 기준 스크린샷 정리 후 호출)
+
+        Returns:
+            list: 남은 인덱스 항목 (dict) 리스트
+        """
+        if not os.path.exists(self.index_path):
+            return []
+        with self._lock, open(self.index_path, 'a+', encoding='utf-8') as f:
+            lock_file(f)
+            try:
+                f.seek(0)
+                lines = f.readlines()
+                kept, entries = [], []
+                for line in lines:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if os.path.exists(os.path.join(self.root, entry.get('file') or '')):
+                        kept.append(line)
+                        entries.append(entry)
+                if len(kept) != len(lines):
+                    f.truncate(0)
+                    f.writelines(kept)
+                    f.flush()
+            finally:
+                unlock_file(f)
+        return entries
+
+    def _encode(self, png_bytes):
+        """설정된 형식/크기로 이미지 변환 (Pillow 없거나 변환할 필요가 없으면 원본)"""
+        if Image is None or (self.image_format == 'png' and not self.max_width):
+            return png_bytes
+
+        image = Image.open(io.BytesIO(png_bytes))
+        if self.max_width and image.width > self.max_width:
+            height = max(1, round(image.height * self.max_width / image.width))
+            image = image.resize((self.max_width, height), Image.LANCZOS)
+
+        pil_format = self.FORMATS[self.image_format][0]
+        if pil_format == 'JPEG' and image.mode != 'RGB':
+            image = image.convert('RGB')
+
+        output = io.BytesIO()
+        if pil_format == 'PNG':
+            image.save(output, format=pil_format, optimize=True)
+        else:
+            image.save(output, format=pil_format, quality=self.quality)
+        return output.getvalue()
+
+    def _write_atomic(self, path, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix='.shot_')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _append_index(self, entry):
+        """여러 스레드/프로세스가 동시에 기록해도 줄이 섞이지 않도록 잠금 후 추가"""
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock, open(self.index_path, 'a', encoding='utf-8') as f:
+            lock_file(f)
+            try:
+                f.write(line)
+                f.flush()
+            finally:
+                unlock_file(f)
@@ -0,0 +1,207 @@
+"""
+CI 노드 간 테스트 샤딩
+수집된 테스트를 실행 이력의 소요 시간 기준으로 N개 샤드에 균등 분배하고, 그중 하나만 실행합니다.
+모든 샤드가 같은 이력 파일로 같은 분배를 계산하므로 노드끼리 통신할 필요가 없습니다.
+
+샤드 결과는 reports/shards/s<i>/에 저장되며 --merge로 하나의 리포트로 병합합니다.
+병합 대상은 이번 샤드 수(N)의 s1..sN뿐이므로 이전 실행의 샤드 결과가 섞이지 않습니다.
+공유 실행 이력은 샤드 실행 중 바뀌면 샤드별 분배가 어긋나므로 병합 단계에서만 갱신합니다.
+
+사용법:
+    python -m utils.shard_runner [테스트 경로] --shard=1/3
+    python -m utils.shard_runner --merge[=3]
+"""
+import glob
+import json
+import os
+import shutil
+import subprocess
+import sys
+from config.config import TestConfig
+from utils.run_history import RunHistory
+from utils.parallel_runner import collect_test_ids, partition_tests
+from utils.report_merge import merge_junit_reports, merge_result_streams, write_html_report
+
+
+def parse_shard(value):
+    """
+    '1/3' 형식의 샤드 지정 해석
+
+    Returns:
+        tuple: (샤드 번호 1..N, 샤드 수 N)
+    """
+    try:
+        index, total = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise ValueError(f"샤드 형식 오류: {value} (예: 1/3)")
+    if total < 1 or not 1 <= index <= total:
+        raise ValueError(f"샤드 범위 오류: {value} (1 <= i <= N)")
+    return index, total
+
+
+def select_shard(test_ids, index, total, history):
+    """
+    샤드에 배정된 테스트 선택
+
+    수집 순서와 무관하게 같은 결과가 나오도록 nodeid를 정렬한 뒤 분배합니다.
+
+    Args:
+        test_ids (list): 수집된 nodeid 리스트
+        index (int): 샤드 번호 (1부터 시작)
+        total (int): 샤드 수
+        history (RunHistory): 실행 이력
+
+    Returns:
+        tuple: (배정된 nodeid 리스트, 예상 소요 시간)
+    """
+    groups, loads = partition_tests(sorted(test_ids), total, history)
+    return groups[index - 1], loads[index - 1]
+
+
+def shard_dir(report_dir, index):
+    """샤드 결과 디렉토리"""
+    return os.path.join(report_dir, "shards", f"s{index}")
+
+
+def run_shard(test_path, index, total, env, report_dir="reports"):
+    """
+    샤드 하나 실행
+
+    Args:
+        test_path (str): 테스트 경로
+        index (int): 샤드 번호 (1부터 시작)
+        total (int): 샤드 수
+        env (dict): 환경 변수
+        report_dir (str): 리포트 디렉토리
+
+    Returns:
+        bool: 테스트 성공 여부 (배정된 테스트가 없으면 True)
+    """
+    test_ids = collect_test_ids(test_path, env)
+    if not test_ids:
+        print("❌ 실행할 테스트를 찾을 수 없습니다.")
+        return False
+
+    history = RunHistory(TestConfig.RUN_HISTORY_FILE).load()
+    nodeids, load = select_shard(test_ids, index, total, history)
+
+    output_dir = shard_dir(report_dir, index)
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(output_dir, exist_ok=True)
+    # 병합 단계가 샤드 수를 알 수 있도록 기록
+    with open(os.path.join(output_dir, "shard.json"), "w", encoding="utf-8") as f:
+        json.dump({'index': index, 'total': total}, f)
+    if not nodeids:
+        print(f"🧩 샤드 {index}/{total}: 배정된 테스트 없음")
+        return True
+
+    shard_env = dict(env)
+    shard_env.update({
+        'WORKER_ID': f"s{index}",
+        # 같은 호스트에서 여러 샤드가 동시에 실행될 수 있으므로 디버깅 포트는 자동 예약
+        'REMOTE_DEBUGGING_PORT': env.get('REMOTE_DEBUGGING_PORT') or 'auto',
+        # 결과는 샤드 디렉토리에만 기록하고 HTML과 공유 이력은 병합 단계에서 생성
+        'REPORT_STREAM_FILE': os.path.join(output_dir, "results.jsonl"),
+        'REPORT_HTML_FILE': '',
+        'TIMING_FILE': os.path.join(output_dir, "timings.json"),
+        'PERF_METRICS_FILE': os.path.join(output_dir, "perf_metrics.jsonl"),
+        'RUN_HISTORY_FILE': os.path.join(output_dir, "run_history.json"),
+    })
+    junit_path = os.path.join(output_dir, "junit.xml")
+    print(f"🧩 샤드 {index}/{total}: {len(nodeids)}/{len(test_ids)}개 테스트 (예상 {load:.1f}초)")
+    cmd = [sys.executable, "-m", "pytest", "-v", f"--junitxml={junit_path}", *nodeids]
+    returncode = subprocess.run(cmd, env=shard_env).returncode
+    # 종료 코드 5: 실행된 테스트 없음
+    return returncode in (0, 5)
+
+
+def recorded_shard_total(report_dir="reports"):
+    """
+    가장 최근에 실행된 샤드가 기록한 샤드 수
+
+    Returns:
+        int: 샤드 수 (기록이 없으면 None)
+    """
+    markers = glob.glob(os.path.join(report_dir, "shards", "s*", "shard.json"))
+    for path in sorted(markers, key=os.path.getmtime, reverse=True):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return int(json.load(f)['total'])
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+    return None
+
+
+def merge_shards(report_dir="reports", total=None):
+    """
+    샤드 결과를 하나의 리포트로 병합하고 공유 실행 이력 갱신
+
+    Args:
+        report_dir (str): 리포트 디렉토리
+        total (int): 샤드 수 (s1..sN만 병합, None이면 가장 최근 샤드가 기록한 샤드 수)
+
+    Returns:
+        list: 병합된 결과 dict 리스트
+    """
+    if total is None:
+        total = recorded_shard_total(report_dir)
+    if not total:
+        print("⚠️ 병합할 샤드 결과가 없습니다.")
+        return []
+    shard_dirs = []
+    for index in range(1, total + 1):
+        path = shard_dir(report_dir, index)
+        if os.path.isdir(path):
+            shard_dirs.append(path)
+        else:
+            print(f"⚠️ 샤드 {index}/{total} 결과 없음: {path}")
+    if not shard_dirs:
+        print("⚠️ 병합할 샤드 결과가 없습니다.")
+        return []
+
+    merge_junit_reports([os.path.join(path, "junit.xml") for path in shard_dirs],
+                        os.path.join(report_dir, "junit.xml"))
+    results_path = os.path.join(report_dir, "results.jsonl")
+    results = merge_result_streams([os.path.join(path, "results.jsonl") for path in shard_dirs], results_path)
+    write_html_report(results, os.path.join(report_dir, "report.html"), TestConfig.SCREENSHOT_DIR,
+                      source=results_path)
+
+    history = RunHistory(TestConfig.RUN_HISTORY_FILE)
+    for result in results:
+        if result.get('nodeid'):
+            outcome = 'failed' if result['outcome'] == 'error' else result['outcome']
+            history.record(result['nodeid'], result['duration'], outcome)
+    history.save()
+
+    failed = sum(1 for result in results if result['outcome'] in ('failed', 'error'))
+    print(f"🧩 샤드 {len(shard_dirs)}/{total}개 병합: 테스트 {len(results)}개, 실패 {failed}개")
+    return results
+
+
+def main(argv=None):
+    """명령행 실행"""
+    test_path = "tests/"
+    shard = None
+    merge = False
+    total = None
+    for arg in (argv if argv is not None else sys.argv[1:]):
+        if arg.startswith("--shard="):
+            shard = parse_shard(arg.split("=")[1])
+        elif arg == "--merge":
+            merge = True
+        elif arg.startswith("--merge="):
+            merge = True
+            total = int(arg.split("=")[1])
+        elif not arg.startswith("--"):
+            test_path = arg
+    if merge:
+        results = merge_shards(total=total)
+        return 1 if not results or any(r['outcome'] in ('failed', 'error') for r in results) else 0
+    if shard is None:
+        print("사용법: python -m utils.shard_runner [테스트 경로] --shard=i/N | --merge[=N]")
+        return 2
+    return 0 if run_shard(test_path, *shard, os.environ.copy()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+"""
+테스트별 타이밍 계측
+브라우저 실행, 페이지 이동, 대기, 동작, 종료에 걸린 시간을 테스트/단계별로 집계합니다.
+중첩 호출은 자기 자신의 시간만 해당 단계에 더하므로(예: 클릭 안의 대기는 wait) 합계가 중복되지 않습니다.
+"""
+import functools
+import json
+import os
+import threading
+import time
+
+# 단계 이름
+LAUNCH = 'launch'          # 브라우저/컨텍스트 준비
+CONFIGURE = 'configure'    # 타임아웃/창 크기 설정
+NAVIGATE = 'navigate'      # 페이지 이동/새로고침
+WAIT = 'wait'              # 요소 탐색/조건 대기
+ACTION = 'action'          # 클릭/입력/읽기 등 동작
+TEARDOWN = 'teardown'      # 드라이버 반납/종료
+
+# 브라우저 실행 오버헤드로 보는 단계
+OVERHEAD_PHASES = (LAUNCH, CONFIGURE, TEARDOWN)
+
+# 테스트 밖(세션 fixture 등)에서 측정된 시간의 키
+SESSION_KEY = '<session>'
+
+
+class TimingRecorder:
+    """테스트/단계별 누적 시간 기록기"""
+
+    def __init__(self):
+        self.tests = {}           # 테스트 키 → {단계: [누적 시간, 호출 수]}
+        self.wall_clock = {}      # 테스트 키 → 테스트 전체 소요 시간
+        self.session_start = time.perf_counter()
+        self.session_end = None
+        self._current = SESSION_KEY
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start_session(self):
+        """세션 시작 시각 기록 및 이전 결과 초기화"""
+        self.tests.clear()
+        self.wall_clock.clear()
+        self.session_start = time.perf_counter()
+        self.session_end = None
+
+    def end_session(self):
+        """세션 종료 시각 기록"""
+        self.session_end = time.perf_counter()
+
+    def start_test(self, nodeid):
+        """이후 측정 시간을 nodeid에 기록"""
+        self._current = nodeid
+
+    def end_test(self, nodeid, duration):
+        """
+        테스트 종료 (이후 측정 시간은 세션에 기록)
+
+        Args:
+            nodeid (str): pytest nodeid
+            duration (float): setup/call/teardown 전체 소요 시간 (초)
+        """
+        self.wall_clock[nodeid] = duration
+        self._current = SESSION_KEY
+
+    def span(self, phase):
+        """단계 시간을 측정하는 컨텍스트 매니저"""
+        return _Span(self, phase)
+
+    def mute_thread(self):
+        """현재 스레드에서 측정한 시간은 기록하지 않음 (테스트와 겹쳐 실행되는 백그라운드 작업용)"""
+        self._local.muted = True
+
+    def timed(self, phase):
+        """함수 실행 시간을 단계 시간으로 기록하는 데코레이터"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with _Span(self, phase):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def add(self, phase, elapsed, key=None):
+        """단계 시간 직접 추가"""
+        key = key or self._current
+        with self._lock:
+            entry = self.tests.setdefault(key, {}).setdefault(phase, [0.0, 0])
+            entry[0] += elapsed
+            entry[1] += 1
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def phase_totals(self):
+        """모든 테스트의 단계별 누적 시간"""
+        totals = {}
+        for phases in self.tests.values():
+            for phase, (elapsed, _) in phases.items():
+                totals[phase] = totals.get(phase, 0.0) + elapsed
+        return totals
+
+    def summary(self, top=10):
+        """
+        집계 결과
+
+        Args:
+            top (int): 포함할 느린 테스트 수
+
+        Returns:
+            dict: 전체 시간, 단계별 합계, 대기/동작 시간, 실행 오버헤드 비율, 느린 테스트 목록
+        """
+        end = self.session_end if self.session_end is not None else time.perf_counter()
+        wall_clock = end - self.session_start
+        totals = self.phase_totals()
+        overhead = sum(totals.get(phase, 0.0) for phase in OVERHEAD_PHASES)
+
+        slowest = sorted(self.wall_clock.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            'wall_clock': round(wall_clock, 4),
+            'phases': {phase: round(elapsed, 4) for phase, elapsed in sorted(totals.items())},
+            'wait': round(totals.get(WAIT, 0.0), 4),
+            'action': round(totals.get(ACTION, 0.0), 4),
+            'browser_overhead': round(overhead, 4),
+            'browser_overhead_ratio': round(overhead / wall_clock, 4) if wall_clock > 0 else 0.0,
+            'slowest': [
+                {
+                    'nodeid': nodeid,
+                    'duration': round(duration, 4),
+                    'phases': {
+                        phase: round(elapsed, 4)
+                        for phase, (elapsed, _) in sorted(self.tests.get(nodeid, {}).items())
+                    },
+                }
+                for nodeid, duration in slowest
+            ],
+        }
+
+    def write_json(self, path, top=10):
+        """
+        집계 결과를 JSON 파일로 저장
+
+        Args:
+            path (str): 저장 경로
+            top (int): 요약에 포함할 느린 테스트 수
+        """
+        data = {
+            'summary': self.summary(top),
+            'tests': {
+                key: {
+                    'duration': round(self.wall_clock[key], 4) if key in self.wall_clock else None,
+                    'phases': {
+                        phase: {'seconds': round(elapsed, 4), 'calls': calls}
+                        for phase, (elapsed, calls) in sorted(phases.items())
+                    },
+                }
+                for key, phases in self.tests.items()
+            },
+        }
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+
+    def format_summary(self, top=10):
+        """
+        터미널 출력용 요약
+
+        Returns:
+            list: 출력할 줄 목록
+        """
+        summary = self.summary(top)
+        wall_clock = summary['wall_clock'] or 1.0
+        lines = [
+            f"전체 {summary['wall_clock']:.2f}s / 대기 {summary['wait']:.2f}s"
+            f" / 동작 {summary['action']:.2f}s"
+            f" / 페이지 이동 {summary['phases'].get(NAVIGATE, 0.0):.2f}s",
+            f"브라우저 실행/설정/종료 {summary['browser_overhead']:.2f}s"
+            f" (전체의 {summary['browser_overhead_ratio'] * 100:.1f}%)",
+        ]
+        if summary['slowest']:
+            lines.append(f"느린 테스트 상위 {len(summary['slowest'])}개:")
+        for test in summary['slowest']:
+            phases = ', '.join(f"{phase} {elapsed:.2f}s" for phase, elapsed in test['phases'].items())
+            share = test['duration'] / wall_clock * 100
+            lines.append(f"  {test['duration']:7.2f}s ({share:4.1f}%) {test['nodeid']}"
+                         + (f" [{phases}]" if phases else ""))
+        return lines
+
+
+class _Span:
+    """중첩을 고려해 자기 시간만 기록하는 측정 구간"""
+
+    __slots__ = ('recorder', 'phase', 'start', 'children')
+
+    def __init__(self, recorder, phase):
+        self.recorder = recorder
+        self.phase = phase
+
+    def __enter__(self):
+        self.children = 0.0
+        self.recorder._stack().append(self)
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        stack = self.recorder._stack()
+        stack.pop()
+        if stack:
+            stack[-1].children += elapsed
+        if not getattr(self.recorder._local, 'muted', False):
+            self.recorder.add(self.phase, elapsed - self.children)
+        return False
+
+
+# 프로세스 전역 기록기
+timings = TimingRecorder()
+timed = timings.timed